@@ -110,7 +110,7 @@ class CrashAnalyzer:
         self.crashes = []
         for file_path in crash_files:
             try:
-                with open(file_path, 'r') as f:
+                with open(file_path, 'r', encoding='utf-8') as f:
                     crash = json.load(f)
                     crash['_file_path'] = file_path
                     self.crashes.append(crash)
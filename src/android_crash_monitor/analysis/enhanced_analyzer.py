@@ -285,8 +285,9 @@ class EnhancedCrashAnalyzer:
                 "recommendations": result.detailed_recommendations
             }
             
+            payload = json.dumps(export_data, indent=2, ensure_ascii=False)
             with open(output_path, 'w') as f:
-                json.dump(export_data, f, indent=2, ensure_ascii=False)
+                f.write(payload)
             
             return True
             
@@ -200,8 +200,9 @@ Analysis Time: {formatted_time}"""
                            output_path: Path) -> None:
         """Generate JSON report file."""
         try:
+            payload = json.dumps(analysis_report, indent=2, default=str)
             with open(output_path, 'w') as f:
-                json.dump(analysis_report, f, indent=2, default=str)
+                f.write(payload)
         except Exception as e:
             self.console.print(f"[red]Failed to save JSON report: {e}[/red]")
             
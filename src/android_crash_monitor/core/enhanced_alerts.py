@@ -14,14 +14,24 @@ This module provides specialized alerting for System.err crashes with:
 """
 
 import time
-import json
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Set, Callable
-from dataclasses import dataclass, asdict
+import itertools
+import queue
+import threading
+from collections import Counter
+from typing import Dict, List, Mapping, Optional, Set, Tuple, Callable
+from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
+from types import MappingProxyType
 
 from .enhanced_patterns import EnhancedCrashType, PatternMatch
+from ..utils.compat import DATACLASS_SLOTS
+from ..utils.json_utils import dumps_json
+from ..utils.time_utils import cached_iso_now
+
+
+# Shared stand-in for a missing PatternMatch.additional_context (read-only)
+_EMPTY_CONTEXT = MappingProxyType({})
 
 
 class AlertLevel(Enum):
@@ -32,6 +42,10 @@ class AlertLevel(Enum):
     CRITICAL = "critical"
 
 
+# Rule levels whose single-crash alerts are sent without waiting for aggregation
+_IMMEDIATE_ALERT_LEVELS = frozenset((AlertLevel.ERROR, AlertLevel.CRITICAL))
+
+
 class AlertType(Enum):
     """Types of alerts we can send."""
     SINGLE_CRASH = "single_crash"
@@ -42,7 +56,7 @@ class AlertType(Enum):
     RATE_THRESHOLD_EXCEEDED = "rate_threshold_exceeded"
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class Alert:
     """Represents an alert to be sent."""
     alert_id: str
@@ -65,14 +79,31 @@ class Alert:
     # Additional metadata
     metadata: Optional[Dict] = None
     
+    # Creation time to sub-second precision (alert timestamps are whole seconds)
+    ts_epoch: float = field(default_factory=time.time)
+    
     def to_dict(self) -> dict:
-        result = asdict(self)
-        result['alert_type'] = self.alert_type.value
-        result['level'] = self.level.value
-        return result
+        # Built by hand: asdict() would deep-copy metadata (which can hold
+        # the full cascade context) only for it to be serialized right away
+        return {
+            'alert_id': self.alert_id,
+            'alert_type': self.alert_type.value,
+            'level': self.level.value,
+            'title': self.title,
+            'message': self.message,
+            'timestamp': self.timestamp,
+            'device_serial': self.device_serial,
+            'crash_type': self.crash_type,
+            'app_package': self.app_package,
+            'severity': self.severity,
+            'crash_count': self.crash_count,
+            'time_window_minutes': self.time_window_minutes,
+            'metadata': self.metadata,
+            'ts_epoch': self.ts_epoch
+        }
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class AlertRule:
     """Configuration for alert rules."""
     crash_type: EnhancedCrashType
@@ -86,8 +117,17 @@ class AlertRule:
 class RateLimiter:
     """Rate limiting to prevent alert spam."""
     
+    # Adaptive back-off (see can_send_rule_alert)
+    BACKOFF_SUPPRESSIONS = 10  # suppressed alerts per doubling of the window
+    MAX_BACKOFF_FACTOR = 8     # cap relative to the rule's configured window
+    
     def __init__(self):
         self.alert_history: Dict[str, float] = {}  # alert_key -> last_sent_timestamp
+        self.last_seen: Dict[str, float] = {}  # alert_key -> last attempt timestamp
+        self.suppressed_counts: Dict[str, int] = {}  # alert_key -> suppressions since back-off
+        # alert_key -> (configured minutes, backed-off minutes), only for
+        # keys whose window is currently wider than the configured one
+        self.backoff_windows: Dict[str, Tuple[int, float]] = {}
     
     def can_send_alert(self, alert_key: str, rate_limit_minutes: int) -> bool:
         """Check if an alert can be sent based on rate limiting."""
@@ -100,6 +140,57 @@ class RateLimiter:
         
         return False
     
+    def get_rate_limit(self, alert_key: str, rule: AlertRule) -> float:
+        """Return the current window in minutes for one key of ``rule``.
+        
+        Back-off recorded under a different configured window (the rule's
+        rate_limit_minutes has since changed) no longer applies.
+        """
+        backoff = self.backoff_windows.get(alert_key)
+        if backoff is not None and backoff[0] == rule.rate_limit_minutes:
+            return backoff[1]
+        return float(rule.rate_limit_minutes)
+    
+    def can_send_rule_alert(self, alert_key: str, rule: AlertRule) -> bool:
+        """Rate-limit using an adaptive window kept per alert key.
+        
+        Every BACKOFF_SUPPRESSIONS suppressed alerts for a key double that
+        key's window (up to MAX_BACKOFF_FACTOR times the rule's configured
+        value). Once a key has been quiet for twice its current window, the
+        next alert halves it back toward ``rate_limit_minutes``. Other keys
+        of the same rule, and the rule itself, are unaffected.
+        """
+        now = time.time()
+        configured = rule.rate_limit_minutes
+        rate_limit = self.get_rate_limit(alert_key, rule)
+        window = rate_limit * 60
+        last_seen = self.last_seen.get(alert_key)
+        self.last_seen[alert_key] = now
+        
+        if now - self.alert_history.get(alert_key, 0) >= window:
+            if (last_seen is not None and now - last_seen >= 2 * window
+                    and rate_limit > configured):
+                self._set_rate_limit(alert_key, configured, max(float(configured), rate_limit / 2))
+            self.alert_history[alert_key] = now
+            self.suppressed_counts.pop(alert_key, None)
+            return True
+        
+        suppressed = self.suppressed_counts.get(alert_key, 0) + 1
+        if suppressed >= self.BACKOFF_SUPPRESSIONS:
+            suppressed = 0
+            self._set_rate_limit(alert_key, configured, min(
+                rate_limit * 2, float(configured * self.MAX_BACKOFF_FACTOR)
+            ))
+        self.suppressed_counts[alert_key] = suppressed
+        return False
+    
+    def _set_rate_limit(self, alert_key: str, configured: int, rate_limit: float):
+        """Record a key's window, forgetting it once back at the configured value."""
+        if rate_limit > configured:
+            self.backoff_windows[alert_key] = (configured, rate_limit)
+        else:
+            self.backoff_windows.pop(alert_key, None)
+    
     def cleanup_old_entries(self, max_age_hours: int = 24):
         """Clean up old rate limiting entries."""
         cutoff = time.time() - (max_age_hours * 3600)
@@ -107,6 +198,27 @@ class RateLimiter:
             key: timestamp for key, timestamp in self.alert_history.items()
             if timestamp > cutoff
         }
+        self.last_seen = {
+            key: timestamp for key, timestamp in self.last_seen.items()
+            if timestamp > cutoff
+        }
+        self.suppressed_counts = {
+            key: count for key, count in self.suppressed_counts.items()
+            if key in self.last_seen
+        }
+        self.backoff_windows = {
+            key: backoff for key, backoff in self.backoff_windows.items()
+            if key in self.last_seen
+        }
+
+
+@dataclass(**DATACLASS_SLOTS)
+class AggregationBucket:
+    """Pending alerts for one aggregation key plus running summaries."""
+    first_time: float  # epoch seconds of the first pending alert
+    last_time: float
+    alerts: List[Alert] = field(default_factory=list)
+    max_severity: int = 0
 
 
 class AlertAggregator:
@@ -114,59 +226,58 @@ class AlertAggregator:
     
     def __init__(self, window_minutes: int = 5):
         self.window_minutes = window_minutes
-        self.pending_alerts: Dict[str, List[Alert]] = {}  # aggregation_key -> alerts
+        self.pending_alerts: Dict[str, AggregationBucket] = {}  # aggregation_key -> bucket
     
-    def add_alert(self, alert: Alert) -> Optional[Alert]:
-        """Add alert to aggregator, return aggregated alert if ready."""
+    def add_alert(self, alert: Alert, agg_key: Optional[str] = None) -> Optional[Alert]:
+        """Add alert to aggregator, return aggregated alert if ready.
+        
+        Callers that already know the aggregation key (see
+        ``_get_aggregation_key``) can pass it to skip rebuilding it.
+        """
         # Create aggregation key based on alert type and context
-        agg_key = self._get_aggregation_key(alert)
+        if agg_key is None:
+            agg_key = self._get_aggregation_key(alert)
+        now = time.time()
         
         # Add to pending alerts
-        if agg_key not in self.pending_alerts:
-            self.pending_alerts[agg_key] = []
-        
-        self.pending_alerts[agg_key].append(alert)
-        
-        # Check if we should aggregate and send
-        return self._check_for_aggregation(agg_key)
-    
-    def _get_aggregation_key(self, alert: Alert) -> str:
-        """Generate aggregation key for similar alerts."""
-        return f"{alert.alert_type.value}_{alert.crash_type}_{alert.device_serial}"
-    
-    def _check_for_aggregation(self, agg_key: str) -> Optional[Alert]:
-        """Check if alerts should be aggregated and return aggregated alert."""
-        alerts = self.pending_alerts.get(agg_key, [])
-        if not alerts:
-            return None
+        bucket = self.pending_alerts.get(agg_key)
+        if bucket is None:
+            bucket = self.pending_alerts[agg_key] = AggregationBucket(
+                first_time=now, last_time=now
+            )
         
-        # Get the first alert to determine timing
-        first_alert = alerts[0]
-        first_time = datetime.fromisoformat(first_alert.timestamp.replace('Z', '+00:00'))
-        now = datetime.now()
+        bucket.alerts.append(alert)
+        bucket.last_time = now
+        severity = alert.severity or 0
+        if severity > bucket.max_severity:
+            bucket.max_severity = severity
         
         # Check if window has elapsed or we have enough alerts
-        time_elapsed = (now - first_time).total_seconds() / 60
+        time_elapsed = (now - bucket.first_time) / 60
         should_aggregate = (
             time_elapsed >= self.window_minutes or 
-            len(alerts) >= 5  # Aggregate after 5 similar alerts
+            len(bucket.alerts) >= 5  # Aggregate after 5 similar alerts
         )
         
         if should_aggregate:
-            aggregated = self._create_aggregated_alert(alerts)
+            aggregated = self._create_aggregated_alert(bucket)
             del self.pending_alerts[agg_key]  # Clear pending alerts
             return aggregated
         
         return None
     
-    def _create_aggregated_alert(self, alerts: List[Alert]) -> Alert:
+    def _get_aggregation_key(self, alert: Alert) -> str:
+        """Generate aggregation key for similar alerts."""
+        return f"{alert.alert_type.value}_{alert.crash_type}_{alert.device_serial}"
+    
+    def _create_aggregated_alert(self, bucket: AggregationBucket) -> Alert:
         """Create an aggregated alert from multiple similar alerts."""
+        alerts = bucket.alerts
         first_alert = alerts[0]
         count = len(alerts)
         
         # Calculate time window
-        timestamps = [datetime.fromisoformat(a.timestamp.replace('Z', '+00:00')) for a in alerts]
-        time_span = (max(timestamps) - min(timestamps)).total_seconds() / 60
+        time_span = (bucket.last_time - bucket.first_time) / 60
         
         # Create aggregated alert
         aggregated = Alert(
@@ -176,15 +287,17 @@ class AlertAggregator:
             title=f"Multiple {first_alert.crash_type} errors detected",
             message=f"Detected {count} similar errors in {time_span:.1f} minutes. "
                    f"Original error: {first_alert.message[:100]}...",
-            timestamp=datetime.now().isoformat(),
+            timestamp=cached_iso_now(),
             device_serial=first_alert.device_serial,
             crash_type=first_alert.crash_type,
             app_package=first_alert.app_package,
-            severity=max(a.severity or 0 for a in alerts),
+            severity=bucket.max_severity,
             crash_count=count,
             time_window_minutes=int(time_span),
+            # Summarize by ID range rather than listing every aggregated alert
             metadata={
-                "aggregated_alerts": [a.alert_id for a in alerts],
+                "first_alert_id": first_alert.alert_id,
+                "last_alert_id": alerts[-1].alert_id,
                 "original_alert_count": count
             }
         )
@@ -205,25 +318,46 @@ class AlertAggregator:
 class EnhancedAlertingSystem:
     """Enhanced alerting system for System.err monitoring."""
     
-    def __init__(self, output_dir: Path):
-        self.output_dir = output_dir
+    # Background dispatch tuning (only used with async_dispatch=True)
+    DISPATCH_QUEUE_SIZE = 1024
+    DISPATCH_BATCH_SIZE = 32
+    
+    def __init__(self, output_dir: Optional[Path], async_dispatch: bool = False):
+        self.output_dir = output_dir  # None disables the on-disk audit trail
         self.rate_limiter = RateLimiter()
         self.aggregator = AlertAggregator()
         
         # Alert handlers
         self.alert_handlers: List[Callable[[Alert], None]] = []
         
+        # Alert ID generation: a monotonic counter seeded from the start time
+        # keeps IDs unique across restarts without a clock read per alert
+        self._alert_id_counter = itertools.count(int(time.time() * 1000))
+        self._alert_id_prefixes: Dict[tuple, str] = {}  # (kind, device) -> prefix
+        
         # Alert rules configuration
         self.alert_rules = self._create_default_rules()
         
         # Statistics
         self.alert_stats = {
             "total_alerts": 0,
-            "alerts_by_type": {},
-            "alerts_by_level": {},
+            "alerts_by_type": Counter(),
+            "alerts_by_level": Counter(),
             "rate_limited_alerts": 0,
-            "aggregated_alerts": 0
+            "aggregated_alerts": 0,
+            "dropped_alerts": 0
         }
+        
+        # Optional background dispatch so slow handlers (webhooks, email)
+        # don't stall crash processing during cascades
+        self._dispatch_queue: Optional[queue.Queue] = None
+        self._dispatch_thread: Optional[threading.Thread] = None
+        if async_dispatch:
+            self._dispatch_queue = queue.Queue(maxsize=self.DISPATCH_QUEUE_SIZE)
+            self._dispatch_thread = threading.Thread(
+                target=self._drain_loop, name="alert-dispatch", daemon=True
+            )
+            self._dispatch_thread.start()
     
     def _create_default_rules(self) -> Dict[EnhancedCrashType, AlertRule]:
         """Create default alert rules for enhanced crash types."""
@@ -278,7 +412,11 @@ class EnhancedAlertingSystem:
         }
     
     def add_alert_handler(self, handler: Callable[[Alert], None]):
-        """Add an alert handler function."""
+        """Add an alert handler function.
+        
+        Handlers that also expose a ``handle_batch(alerts)`` method receive
+        alerts as lists instead of one call per alert.
+        """
         self.alert_handlers.append(handler)
     
     def process_enhanced_crash(self, pattern_match: PatternMatch, 
@@ -290,69 +428,72 @@ class EnhancedAlertingSystem:
         if not rule or not rule.enabled:
             return
         
-        # Check for cascade failure
-        is_cascade = pattern_match.additional_context and \
-                    pattern_match.additional_context.get("cascade_detected")
+        # Nobody would see the alert: skip message building and bookkeeping
+        if not self.alert_handlers and self.output_dir is None:
+            return
         
-        if is_cascade:
-            self._handle_cascade_alert(pattern_match, device_serial, app_package, rule)
-        else:
-            self._handle_single_crash_alert(pattern_match, device_serial, app_package, rule)
-    
-    def _handle_single_crash_alert(self, pattern_match: PatternMatch, 
-                                  device_serial: str, app_package: Optional[str], 
-                                  rule: AlertRule):
-        """Handle alert for a single crash."""
-        crash_type = pattern_match.crash_type
+        # Check for cascade failure (rare path)
+        context = pattern_match.additional_context or _EMPTY_CONTEXT
+        cascade_info = context.get("cascade_detected")
         
-        # Create rate limiting key
-        rate_key = f"{crash_type.value}_{device_serial}_{app_package or 'unknown'}"
+        if cascade_info:
+            self._handle_cascade_alert(pattern_match, context, cascade_info,
+                                       device_serial, app_package)
+            return
+        
+        # Single crash: handled inline, this runs once per detected crash
+        crash_type_value = crash_type.value
         
         # Check rate limiting
-        if not self.rate_limiter.can_send_alert(rate_key, rule.rate_limit_minutes):
+        rate_key = f"{crash_type_value}_{device_serial}_{app_package or 'unknown'}"
+        if not self.rate_limiter.can_send_rule_alert(rate_key, rule):
             self.alert_stats["rate_limited_alerts"] += 1
             return
         
+        # Slice the pattern once; every message template embeds the same prefix
+        short_pattern = pattern_match.pattern[:50]
+        
         # Create alert
         alert = Alert(
-            alert_id=f"crash_{int(time.time() * 1000)}_{device_serial}",
+            alert_id=self._next_alert_id("crash", device_serial),
             alert_type=rule.alert_type,
             level=rule.level,
-            title=self._generate_alert_title(crash_type, is_cascade=False),
-            message=self._generate_alert_message(pattern_match, is_cascade=False),
-            timestamp=datetime.now().isoformat(),
+            title=crash_type.alert_title,
+            message=self._generate_alert_message(pattern_match, is_cascade=False,
+                                                 short_pattern=short_pattern,
+                                                 context=context),
+            timestamp=cached_iso_now(),
             device_serial=device_serial,
-            crash_type=crash_type.value,
+            crash_type=crash_type_value,
             app_package=app_package,
             severity=pattern_match.severity_override,
             metadata=pattern_match.additional_context
         )
         
         # Try aggregation
-        aggregated_alert = self.aggregator.add_alert(alert)
+        agg_key = f"{rule.alert_type.value}_{crash_type_value}_{device_serial}"
+        aggregated_alert = self.aggregator.add_alert(alert, agg_key)
         if aggregated_alert:
             self._send_alert(aggregated_alert)
             self.alert_stats["aggregated_alerts"] += 1
-        else:
+        elif rule.level in _IMMEDIATE_ALERT_LEVELS:
             # Send individual alert for high severity issues
-            if rule.level in [AlertLevel.ERROR, AlertLevel.CRITICAL]:
-                self._send_alert(alert)
+            self._send_alert(alert)
     
-    def _handle_cascade_alert(self, pattern_match: PatternMatch, 
-                             device_serial: str, app_package: Optional[str], 
-                             rule: AlertRule):
+    def _handle_cascade_alert(self, pattern_match: PatternMatch, context: Mapping,
+                             cascade_info: Dict, device_serial: str,
+                             app_package: Optional[str]):
         """Handle alert for cascade failure."""
         crash_type = pattern_match.crash_type
-        cascade_info = pattern_match.additional_context.get("cascade_detected", {})
         
         # Create high-priority alert for cascade
         alert = Alert(
-            alert_id=f"cascade_{int(time.time() * 1000)}_{device_serial}",
+            alert_id=self._next_alert_id("cascade", device_serial),
             alert_type=AlertType.CASCADE_FAILURE,
             level=AlertLevel.CRITICAL,  # Cascade failures are always critical
             title=f"CASCADE FAILURE: {crash_type.value} errors",
-            message=self._generate_cascade_message(pattern_match, cascade_info),
-            timestamp=datetime.now().isoformat(),
+            message=self._generate_cascade_message(pattern_match, cascade_info, context),
+            timestamp=cached_iso_now(),
             device_serial=device_serial,
             crash_type=crash_type.value,
             app_package=app_package,
@@ -368,52 +509,28 @@ class EnhancedAlertingSystem:
         # Send cascade alert immediately (no aggregation/rate limiting)
         self._send_alert(alert)
     
-    def _generate_alert_title(self, crash_type: EnhancedCrashType, is_cascade: bool) -> str:
-        """Generate alert title based on crash type."""
-        titles = {
-            EnhancedCrashType.HLS_STREAMING_ERROR: "HLS Streaming Failure",
-            EnhancedCrashType.VIDEO_CODEC_ERROR: "Video Codec Error",
-            EnhancedCrashType.RECEIVER_REGISTRATION_ERROR: "Receiver Registration Issue",
-            EnhancedCrashType.MEDIA_PIPELINE_ERROR: "Media Pipeline Error",
-            EnhancedCrashType.HARDWARE_ACCELERATION_ERROR: "Hardware Acceleration Failure",
-            EnhancedCrashType.MANIFEST_VALIDATION_ERROR: "Media Manifest Validation Error"
-        }
-        
-        base_title = titles.get(crash_type, "Enhanced Crash Detected")
-        return f"CASCADE: {base_title}" if is_cascade else base_title
+    def _next_alert_id(self, kind: str, device_serial: str) -> str:
+        """Generate a unique alert ID like ``crash_<device>_<seq>``."""
+        key = (kind, device_serial)
+        prefix = self._alert_id_prefixes.get(key)
+        if prefix is None:
+            prefix = self._alert_id_prefixes[key] = f"{kind}_{device_serial}_"
+        return prefix + str(next(self._alert_id_counter))
     
-    def _generate_alert_message(self, pattern_match: PatternMatch, is_cascade: bool) -> str:
-        """Generate detailed alert message."""
-        crash_type = pattern_match.crash_type
-        context = pattern_match.additional_context or {}
+    def _generate_alert_message(self, pattern_match: PatternMatch, is_cascade: bool,
+                                short_pattern: Optional[str] = None,
+                                context: Optional[Mapping] = None) -> str:
+        """Generate detailed alert message.
         
-        base_messages = {
-            EnhancedCrashType.HLS_STREAMING_ERROR: 
-                f"HLS streaming error detected. Pattern: {pattern_match.pattern[:50]}... "
-                f"This typically indicates video playback issues in browsers or media apps.",
-            
-            EnhancedCrashType.VIDEO_CODEC_ERROR:
-                f"Video codec error detected. Pattern: {pattern_match.pattern[:50]}... "
-                f"This may affect video playback performance and quality.",
-            
-            EnhancedCrashType.RECEIVER_REGISTRATION_ERROR:
-                f"Broadcast receiver registration error. Pattern: {pattern_match.pattern[:50]}... "
-                f"This indicates app lifecycle management issues.",
-            
-            EnhancedCrashType.MEDIA_PIPELINE_ERROR:
-                f"Media pipeline error detected. Pattern: {pattern_match.pattern[:50]}... "
-                f"This affects media playback functionality.",
-            
-            EnhancedCrashType.HARDWARE_ACCELERATION_ERROR:
-                f"Hardware acceleration error detected. Pattern: {pattern_match.pattern[:50]}... "
-                f"This may degrade system graphics performance.",
-            
-            EnhancedCrashType.MANIFEST_VALIDATION_ERROR:
-                f"Media manifest validation error. Pattern: {pattern_match.pattern[:50]}... "
-                f"This indicates issues with media content format validation."
-        }
+        ``short_pattern`` (the 50-character pattern prefix) and ``context``
+        can be passed by callers that already hold them.
+        """
+        if context is None:
+            context = pattern_match.additional_context or _EMPTY_CONTEXT
+        if short_pattern is None:
+            short_pattern = pattern_match.pattern[:50]
         
-        message = base_messages.get(crash_type, f"Enhanced crash detected: {pattern_match.pattern[:100]}...")
+        message = pattern_match.crash_type.message_template.format(pattern=short_pattern)
         
         # Add context information
         if "likely_app" in context:
@@ -430,7 +547,8 @@ class EnhancedAlertingSystem:
         return message
     
     def _generate_cascade_message(self, pattern_match: PatternMatch, 
-                                 cascade_info: Dict) -> str:
+                                 cascade_info: Dict,
+                                 context: Optional[Mapping] = None) -> str:
         """Generate message for cascade failure."""
         crash_count = cascade_info.get("total_crashes", 0)
         time_window = cascade_info.get("time_window", 5)
@@ -442,7 +560,8 @@ class EnhancedAlertingSystem:
             f"This indicates a serious system instability issue requiring immediate attention."
         )
         
-        context = pattern_match.additional_context or {}
+        if context is None:
+            context = pattern_match.additional_context or _EMPTY_CONTEXT
         if "likely_app" in context:
             message += f" Primary app affected: {context['likely_app']}"
         
@@ -453,27 +572,118 @@ class EnhancedAlertingSystem:
         # Update statistics
         self.alert_stats["total_alerts"] += 1
         
-        alert_type_str = alert.alert_type.value
-        self.alert_stats["alerts_by_type"][alert_type_str] = \
-            self.alert_stats["alerts_by_type"].get(alert_type_str, 0) + 1
-        
-        level_str = alert.level.value
-        self.alert_stats["alerts_by_level"][level_str] = \
-            self.alert_stats["alerts_by_level"].get(level_str, 0) + 1
+        self.alert_stats["alerts_by_type"][alert.alert_type.value] += 1
+        self.alert_stats["alerts_by_level"][alert.level.value] += 1
         
         # Save alert to file
         self._save_alert(alert)
         
         # Send to handlers
+        if self._dispatch_queue is None:
+            self._dispatch_alerts([alert])
+            return
+        
+        try:
+            self._dispatch_queue.put_nowait(alert)
+        except queue.Full:
+            self.alert_stats["dropped_alerts"] += 1
+    
+    def _dispatch_alerts(self, alerts: List[Alert]):
+        """Deliver alerts to every registered handler."""
         for handler in self.alert_handlers:
+            handle_batch = getattr(handler, "handle_batch", None)
+            if handle_batch is not None:
+                try:
+                    handle_batch(alerts)
+                except Exception as e:
+                    print(f"Alert handler error: {e}")
+                continue
+            
+            for alert in alerts:
+                try:
+                    handler(alert)
+                except Exception as e:
+                    # Log error but continue with other handlers
+                    print(f"Alert handler error: {e}")
+    
+    def _drain_loop(self):
+        """Background thread: deliver queued alerts in batches."""
+        dispatch_queue = self._dispatch_queue
+        while True:
+            alert = dispatch_queue.get()
+            batch = []
+            stopping = alert is None
+            if not stopping:
+                batch.append(alert)
+            
+            # Coalesce whatever else is already waiting
+            while not stopping and len(batch) < self.DISPATCH_BATCH_SIZE:
+                try:
+                    alert = dispatch_queue.get_nowait()
+                except queue.Empty:
+                    break
+                if alert is None:
+                    stopping = True
+                else:
+                    batch.append(alert)
+            
             try:
-                handler(alert)
-            except Exception as e:
-                # Log error but continue with other handlers
-                print(f"Alert handler error: {e}")
+                if batch:
+                    self._dispatch_alerts(batch)
+            finally:
+                for _ in range(len(batch) + stopping):
+                    dispatch_queue.task_done()
+            
+            if stopping:
+                return
+    
+    def flush(self):
+        """Block until every queued alert has been delivered."""
+        if self._dispatch_queue is not None:
+            self._dispatch_queue.join()
+    
+    def close(self, timeout: float = 5.0):
+        """Deliver queued alerts and stop the background dispatch thread.
+        
+        If the thread is still busy after ``timeout`` it keeps its queue, so
+        handlers are never called from two threads at once; call close()
+        again to retry.
+        """
+        thread = self._dispatch_thread
+        if thread is None:
+            return
+        
+        if thread.is_alive():
+            deadline = time.monotonic() + timeout
+            try:
+                self._dispatch_queue.put(None, timeout=timeout)
+            except queue.Full:
+                return
+            thread.join(max(0.0, deadline - time.monotonic()))
+            if thread.is_alive():
+                return
+        
+        # Alerts queued behind the stop marker are delivered here; any later
+        # alerts are delivered synchronously
+        leftovers = []
+        while True:
+            try:
+                alert = self._dispatch_queue.get_nowait()
+            except queue.Empty:
+                break
+            if alert is not None:
+                leftovers.append(alert)
+        
+        self._dispatch_thread = None
+        self._dispatch_queue = None
+        if leftovers:
+            self._dispatch_alerts(leftovers)
     
     def _save_alert(self, alert: Alert):
         """Save alert to file for audit trail."""
+        if self.output_dir is None:
+            return
+        
         try:
             alerts_dir = self.output_dir / "alerts"
             alerts_dir.mkdir(exist_ok=True)
@@ -481,8 +691,9 @@ class EnhancedAlertingSystem:
             filename = f"alert_{alert.alert_id}.json"
             filepath = alerts_dir / filename
             
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(alert.to_dict(), f, indent=2, default=str)
+            # Serialize the dataclass directly (no asdict deep copy)
+            with open(filepath, 'wb') as f:
+                f.write(dumps_json(alert))
                 
         except Exception as e:
             print(f"Failed to save alert: {e}")
@@ -496,7 +707,9 @@ class EnhancedAlertingSystem:
             **self.alert_stats,
             "rate_limiter_entries": len(self.rate_limiter.alert_history),
             "pending_aggregations": len(self.aggregator.pending_alerts),
-            "active_alert_rules": len([r for r in self.alert_rules.values() if r.enabled])
+            "queued_alerts": self._dispatch_queue.qsize() if self._dispatch_queue else 0,
+            "active_alert_rules": len([r for r in self.alert_rules.values() if r.enabled]),
+            "backed_off_alert_keys": len(self.rate_limiter.backoff_windows)
         }
     
     def update_alert_rule(self, crash_type: EnhancedCrashType, **kwargs):
@@ -13,19 +13,93 @@ Key features:
 - Console display enhancements for new crash types
 """
 
+import queue
+import re
+import threading
 import time
-from typing import List, Dict, Optional, Callable
+from typing import List, Dict, Optional, Callable, Tuple
 from dataclasses import dataclass, asdict
 from datetime import datetime
 from pathlib import Path
 
-from .monitor import CrashDetector, CrashEvent, LogEntry
+from rich.text import Text
+
+from .monitor import CrashDetector, CrashEvent, CrashType, LogEntry, _is_stack_trace_start
 from .enhanced_patterns import EnhancedCrashPatterns, EnhancedCrashType, PatternMatch
-from .enhanced_alerts import EnhancedAlertingSystem, Alert
+from .enhanced_alerts import EnhancedAlertingSystem, Alert, AlertLevel, AlertType
 from ..ui.console import ConsoleUI
+from ..utils.compat import DATACLASS_SLOTS
+
+
+# Compatibility mapping from enhanced crash types to the original CrashType
+_CRASH_TYPE_MAPPING = {
+    EnhancedCrashType.HLS_STREAMING_ERROR: CrashType.RUNTIME_ERROR,
+    EnhancedCrashType.VIDEO_CODEC_ERROR: CrashType.RUNTIME_ERROR,
+    EnhancedCrashType.RECEIVER_REGISTRATION_ERROR: CrashType.RUNTIME_ERROR,
+    EnhancedCrashType.MEDIA_PIPELINE_ERROR: CrashType.RUNTIME_ERROR,
+    EnhancedCrashType.HARDWARE_ACCELERATION_ERROR: CrashType.RUNTIME_ERROR,
+    EnhancedCrashType.MANIFEST_VALIDATION_ERROR: CrashType.RUNTIME_ERROR,
+}
+
+_CRASH_TITLES = {
+    EnhancedCrashType.HLS_STREAMING_ERROR: "HLS Streaming Error",
+    EnhancedCrashType.VIDEO_CODEC_ERROR: "Video Codec Error",
+    EnhancedCrashType.RECEIVER_REGISTRATION_ERROR: "Broadcast Receiver Error",
+    EnhancedCrashType.MEDIA_PIPELINE_ERROR: "Media Pipeline Error",
+    EnhancedCrashType.HARDWARE_ACCELERATION_ERROR: "Hardware Acceleration Error",
+    EnhancedCrashType.MANIFEST_VALIDATION_ERROR: "Media Manifest Error",
+}
+
+# Console styling for alerts
+_ALERT_COLORS = {
+    AlertLevel.INFO: "blue",
+    AlertLevel.WARNING: "yellow",
+    AlertLevel.ERROR: "red",
+    AlertLevel.CRITICAL: "bright_red"
+}
+
+_ALERT_PREFIXES = {
+    AlertType.CASCADE_FAILURE: "🚨 CASCADE",
+    AlertType.HLS_STREAMING_DOWN: "📺 HLS",
+    AlertType.VIDEO_CODEC_FAILURE: "🎥 CODEC",
+    AlertType.SYSTEM_INSTABILITY: "⚠️  SYSTEM",
+    AlertType.SINGLE_CRASH: "💥 CRASH"
+}
+
+# Styled console prefix per (level, type), e.g. "[red]📺 HLS[/red] "; copied
+# and extended with the title so alerts don't go through markup parsing
+_ALERT_PREFIX_TEXT = {
+    (level, alert_type): Text.assemble(
+        (_ALERT_PREFIXES.get(alert_type, "🔔 ALERT"), _ALERT_COLORS.get(level, "white")), " "
+    )
+    for level in AlertLevel
+    for alert_type in AlertType
+}
+
+# Alert types counted as cascade alerts
+_CASCADE_ALERT_TYPES = frozenset((AlertType.CASCADE_FAILURE,))
+
+# Crash descriptions quote at most this much of the log message
+_DESCRIPTION_MAX_CHARS = 200
+
+# Keywords marking stack-trace lines for crash types whose traces the
+# generic extractor misses
+_HLS_TRACE_KEYWORDS = ("kotlinx.coroutines", "invokeSuspend", "resumeWith")  # Kotlin coroutines
+_CODEC_TRACE_KEYWORDS = ("Codec", "Buffer", "MediaFormat", "Surface")
+
+
+def _keyword_scanner(keywords):
+    """Compile keywords into one alternation so each line is scanned once in C."""
+    return re.compile("|".join(re.escape(keyword) for keyword in keywords)).search
+
+
+_STACK_TRACE_KEYWORD_SCANS = {
+    EnhancedCrashType.HLS_STREAMING_ERROR: _keyword_scanner(_HLS_TRACE_KEYWORDS),
+    EnhancedCrashType.VIDEO_CODEC_ERROR: _keyword_scanner(_CODEC_TRACE_KEYWORDS),
+}
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class EnhancedMonitoringStats:
     """Enhanced statistics including System.err specific metrics."""
     # Original stats
@@ -65,10 +139,39 @@ class EnhancedMonitoringStats:
     low_confidence_detections: int = 0  # < 70%
 
 
+@dataclass(**DATACLASS_SLOTS)
+class EnhancedDetectionCounters:
+    """Running counters behind EnhancedCrashDetector.get_enhanced_statistics()."""
+    enhanced_crashes_detected: int = 0
+    hls_streaming_errors: int = 0
+    video_codec_errors: int = 0
+    receiver_registration_errors: int = 0
+    cascade_failures_detected: int = 0
+    hardware_acceleration_errors: int = 0
+    media_pipeline_errors: int = 0
+    manifest_validation_errors: int = 0
+    total_alerts_sent: int = 0
+    critical_alerts_sent: int = 0
+    cascade_alerts_sent: int = 0
+    rate_limited_alerts: int = 0
+    dropped_alert_renders: int = 0
+    high_confidence_detections: int = 0
+    medium_confidence_detections: int = 0
+    low_confidence_detections: int = 0
+
+
 class EnhancedCrashDetector(CrashDetector):
     """Enhanced crash detector with System.err specific patterns."""
     
-    def __init__(self, console: ConsoleUI, output_dir: Path):
+    # Alerts waiting for the console render thread (async_alerts=True);
+    # when full, further alerts are counted and not rendered
+    RENDER_QUEUE_SIZE = 256
+    
+    # get_enhanced_statistics() results are reused for at most this long
+    # when no new detections or alerts have arrived
+    STATS_CACHE_SECONDS = 1.0
+    
+    def __init__(self, console: ConsoleUI, output_dir: Path, async_alerts: bool = False):
         super().__init__()
         
         self.console = console
@@ -79,43 +182,59 @@ class EnhancedCrashDetector(CrashDetector):
         self.alerting_system = EnhancedAlertingSystem(output_dir)
         
         # Enhanced statistics
-        self.enhanced_stats = {
-            "enhanced_crashes_detected": 0,
-            "hls_streaming_errors": 0,
-            "video_codec_errors": 0,
-            "receiver_registration_errors": 0,
-            "cascade_failures_detected": 0,
-            "hardware_acceleration_errors": 0,
-            "media_pipeline_errors": 0,
-            "manifest_validation_errors": 0,
-            "total_alerts_sent": 0,
-            "critical_alerts_sent": 0,
-            "cascade_alerts_sent": 0,
-            "rate_limited_alerts": 0,
-            "high_confidence_detections": 0,
-            "medium_confidence_detections": 0,
-            "low_confidence_detections": 0
-        }
+        self.enhanced_stats = EnhancedDetectionCounters()
         
         # Setup console alert handler
         self.alerting_system.add_alert_handler(self._console_alert_handler)
         
         # Device model cache for context
         self.device_models: Dict[str, str] = {}
+        
+        # Log timestamp parsing cache: "MM-dd HH:MM" -> epoch seconds
+        self._ts_cache_key = ""
+        self._ts_cache_base = 0.0
+        
+        # Session ID cache: device_serial -> (epoch second, session_id)
+        self._session_id_cache: Dict[str, Tuple[int, str]] = {}
+        
+        # Memoized get_enhanced_statistics() result
+        self._stats_dirty = True
+        self._stats_cache: Dict = {}
+        self._stats_cache_time = 0.0
+        
+        # Optional console render thread so ingest doesn't wait on the terminal
+        self._render_queue: Optional[queue.Queue] = None
+        self._render_thread: Optional[threading.Thread] = None
+        if async_alerts:
+            self._render_queue = queue.Queue(maxsize=self.RENDER_QUEUE_SIZE)
+            self._render_thread = threading.Thread(
+                target=self._render_loop, name="alert-render", daemon=True
+            )
+            self._render_thread.start()
     
-    def detect_crashes(self, log_entry: LogEntry) -> List[CrashEvent]:
-        """Enhanced crash detection with both original and System.err patterns."""
+    def detect_crashes(self, log_entry: LogEntry,
+                       might_match: Optional[bool] = None) -> List[CrashEvent]:
+        """Enhanced crash detection with both original and System.err patterns.
+        
+        ``might_match`` is a precomputed enhanced prefilter result for the
+        entry, as produced by detect_crashes_batch().
+        """
         # Get original crash detections
         original_crashes = super().detect_crashes(log_entry)
         
         # Enhanced detection for System.err specific patterns
-        enhanced_matches = self._detect_enhanced_patterns(log_entry)
+        enhanced_matches = self._detect_enhanced_patterns(log_entry, might_match)
         
         # Process enhanced matches
         enhanced_crashes = []
+        related_logs = None
         for match in enhanced_matches:
+            # Matches on the same line share one context window
+            if related_logs is None:
+                related_logs = self._get_related_logs(log_entry, context_lines=15)
+            
             # Create enhanced crash event
-            enhanced_crash = self._create_enhanced_crash_event(log_entry, match)
+            enhanced_crash = self._create_enhanced_crash_event(log_entry, match, related_logs)
             enhanced_crashes.append(enhanced_crash)
             
             # Update enhanced statistics
@@ -129,22 +248,34 @@ class EnhancedCrashDetector(CrashDetector):
         
         return all_crashes
     
-    def _detect_enhanced_patterns(self, log_entry: LogEntry) -> List[PatternMatch]:
+    def detect_crashes_batch(self, log_entries: List[LogEntry]) -> List[CrashEvent]:
+        """Detect crashes from a batch of log entries, in order.
+        
+        The enhanced prefilter runs over the whole batch in a single scan;
+        each entry is then processed exactly as detect_crashes() would.
+        """
+        candidates = self.enhanced_patterns.might_match_batch(
+            [log_entry.message for log_entry in log_entries]
+        )
+        detect = self.detect_crashes
+        crashes = []
+        for log_entry, might_match in zip(log_entries, candidates):
+            crashes.extend(detect(log_entry, might_match))
+        return crashes
+    
+    def _detect_enhanced_patterns(self, log_entry: LogEntry,
+                                  might_match: Optional[bool] = None) -> List[PatternMatch]:
         """Detect enhanced System.err patterns."""
+        # Most log lines are noise; skip timestamp parsing and the regex bank
+        if might_match is None:
+            might_match = self.enhanced_patterns.might_match(log_entry.message)
+        if not might_match:
+            return []
+        
         # Convert timestamp to float for cascade detection
         try:
-            # Parse MM-dd HH:MM:SS.sss format and convert to timestamp
-            time_parts = log_entry.timestamp.split('.')
-            time_base = time_parts[0]  # MM-dd HH:MM:SS
-            milliseconds = int(time_parts[1]) if len(time_parts) > 1 else 0
-            
-            # Create a rough timestamp (using current year as approximation)
-            from datetime import datetime
-            current_year = datetime.now().year
-            timestamp_str = f"{current_year}-{time_base}.{milliseconds:03d}"
-            parsed_time = datetime.strptime(timestamp_str, "%Y-%m-%d %H:%M:%S.%f")
-            timestamp = parsed_time.timestamp()
-        except:
+            timestamp = self._parse_log_timestamp(log_entry.timestamp)
+        except (ValueError, IndexError):
             timestamp = time.time()  # Fallback to current time
         
         return self.enhanced_patterns.detect_enhanced_crashes(
@@ -153,22 +284,33 @@ class EnhancedCrashDetector(CrashDetector):
             timestamp=timestamp
         )
     
+    def _parse_log_timestamp(self, ts: str) -> float:
+        """Convert a logcat "MM-dd HH:MM:SS.sss" timestamp to epoch seconds.
+        
+        Logcat timestamps carry no year, so the current year is assumed.
+        The epoch value of the "MM-dd HH:MM" prefix is cached, so only the
+        first line of each minute builds a datetime; the rest just add
+        seconds and milliseconds. Raises ValueError on malformed input.
+        """
+        key = ts[:11]
+        if key != self._ts_cache_key:
+            if len(key) != 11 or key[2] != '-' or key[5] != ' ' or key[8] != ':':
+                raise ValueError(f"Unrecognized log timestamp: {ts!r}")
+            self._ts_cache_base = datetime(
+                datetime.now().year, int(key[:2]), int(key[3:5]),
+                int(key[6:8]), int(key[9:11])
+            ).timestamp()
+            self._ts_cache_key = key
+        
+        milliseconds = int(ts[15:18]) if len(ts) > 15 else 0
+        return self._ts_cache_base + int(ts[12:14]) + milliseconds * 0.001
+    
     def _create_enhanced_crash_event(self, log_entry: LogEntry, 
-                                   match: PatternMatch) -> CrashEvent:
+                                   match: PatternMatch,
+                                   related_logs: Optional[List[LogEntry]] = None) -> CrashEvent:
         """Create a CrashEvent from an enhanced pattern match."""
-        from .monitor import CrashType
-        
         # Map enhanced crash type to original crash type for compatibility
-        crash_type_mapping = {
-            EnhancedCrashType.HLS_STREAMING_ERROR: CrashType.RUNTIME_ERROR,
-            EnhancedCrashType.VIDEO_CODEC_ERROR: CrashType.RUNTIME_ERROR,
-            EnhancedCrashType.RECEIVER_REGISTRATION_ERROR: CrashType.RUNTIME_ERROR,
-            EnhancedCrashType.MEDIA_PIPELINE_ERROR: CrashType.RUNTIME_ERROR,
-            EnhancedCrashType.HARDWARE_ACCELERATION_ERROR: CrashType.RUNTIME_ERROR,
-            EnhancedCrashType.MANIFEST_VALIDATION_ERROR: CrashType.RUNTIME_ERROR,
-        }
-        
-        original_crash_type = crash_type_mapping.get(
+        original_crash_type = _CRASH_TYPE_MAPPING.get(
             match.crash_type, CrashType.RUNTIME_ERROR
         )
         
@@ -180,65 +322,16 @@ class EnhancedCrashDetector(CrashDetector):
         # Use enhanced severity if available
         severity = match.severity_override if match.severity_override else 6
         
-        # Create title and description
-        title = self._generate_enhanced_crash_title(match, log_entry)
-        description = self._generate_enhanced_crash_description(match, log_entry)
+        # Title carries the short app name, or the log tag when unknown
+        base_title = _CRASH_TITLES.get(match.crash_type, "Enhanced Runtime Error")
+        title = f"{base_title} ({app_package.rpartition('.')[2] if app_package else log_entry.tag})"
         
-        # Get related logs with enhanced context
-        related_logs = self._get_related_logs(log_entry, context_lines=15)
-        
-        # Extract stack trace
-        stack_trace = self._extract_enhanced_stack_trace(related_logs, match)
-        
-        # Create session ID
-        session_id = f"{int(time.time())}_{log_entry.device_serial}"
-        
-        return CrashEvent(
-            timestamp=log_entry.timestamp,
-            crash_type=original_crash_type,
-            app_package=app_package,
-            app_name=app_name,
-            severity=severity,
-            title=title,
-            description=description,
-            stack_trace=stack_trace,
-            related_logs=related_logs,
-            device_serial=log_entry.device_serial,
-            device_model=self.device_models.get(log_entry.device_serial),
-            session_id=session_id,
-            detection_patterns=[match.pattern],
-            first_seen=log_entry.timestamp
+        # Description is the message plus enhanced context information
+        message = log_entry.message
+        description = (
+            message[:_DESCRIPTION_MAX_CHARS] + "..."
+            if len(message) > _DESCRIPTION_MAX_CHARS else message
         )
-    
-    def _generate_enhanced_crash_title(self, match: PatternMatch, 
-                                     log_entry: LogEntry) -> str:
-        """Generate title for enhanced crash."""
-        titles = {
-            EnhancedCrashType.HLS_STREAMING_ERROR: "HLS Streaming Error",
-            EnhancedCrashType.VIDEO_CODEC_ERROR: "Video Codec Error",
-            EnhancedCrashType.RECEIVER_REGISTRATION_ERROR: "Broadcast Receiver Error",
-            EnhancedCrashType.MEDIA_PIPELINE_ERROR: "Media Pipeline Error",
-            EnhancedCrashType.HARDWARE_ACCELERATION_ERROR: "Hardware Acceleration Error",
-            EnhancedCrashType.MANIFEST_VALIDATION_ERROR: "Media Manifest Error",
-        }
-        
-        base_title = titles.get(match.crash_type, "Enhanced Runtime Error")
-        
-        # Add app context if available
-        context = match.additional_context or {}
-        if "likely_app" in context:
-            app_name = context["likely_app"].split('.')[-1] if '.' in context["likely_app"] else context["likely_app"]
-            return f"{base_title} ({app_name})"
-        
-        return f"{base_title} ({log_entry.tag})"
-    
-    def _generate_enhanced_crash_description(self, match: PatternMatch, 
-                                           log_entry: LogEntry) -> str:
-        """Generate description for enhanced crash."""
-        base_description = log_entry.message[:200] + "..." if len(log_entry.message) > 200 else log_entry.message
-        
-        # Add enhanced context information
-        context = match.additional_context or {}
         enhancements = []
         
         if "streaming_protocol" in context:
@@ -261,66 +354,96 @@ class EnhancedCrashDetector(CrashDetector):
             )
         
         if enhancements:
-            return f"{base_description} | {' | '.join(enhancements)}"
+            description = f"{description} | {' | '.join(enhancements)}"
         
-        return base_description
+        # Get related logs with enhanced context
+        if related_logs is None:
+            related_logs = self._get_related_logs(log_entry, context_lines=15)
+        
+        # Extract stack trace
+        stack_trace = self._extract_enhanced_stack_trace(related_logs, match)
+        
+        # Create session ID
+        session_id = self._session_id(log_entry.device_serial)
+        
+        return CrashEvent(
+            timestamp=log_entry.timestamp,
+            crash_type=original_crash_type,
+            app_package=app_package,
+            app_name=app_name,
+            severity=severity,
+            title=title,
+            description=description,
+            stack_trace=stack_trace,
+            related_logs=related_logs,
+            device_serial=log_entry.device_serial,
+            device_model=self.device_models.get(log_entry.device_serial),
+            session_id=session_id,
+            detection_patterns=[match.pattern],
+            first_seen=log_entry.timestamp
+        )
+    
+    def _session_id(self, device_serial: str) -> str:
+        """Return the per-second session ID for a device, reusing the string within a second."""
+        now = int(time.time())
+        cached = self._session_id_cache.get(device_serial)
+        if cached is not None and cached[0] == now:
+            return cached[1]
+        session_id = f"{now}_{device_serial}"
+        self._session_id_cache[device_serial] = (now, session_id)
+        return session_id
     
     def _extract_enhanced_stack_trace(self, related_logs: List[LogEntry], 
                                     match: PatternMatch) -> List[str]:
-        """Extract stack trace with enhanced context awareness."""
-        stack_trace = []
+        """Extract stack trace with enhanced context awareness.
         
-        # Use original stack trace extraction
-        original_trace = self._extract_stack_trace(related_logs)
-        if original_trace:
-            return original_trace
-        
-        # For System.err crashes, look for specific patterns
-        if match.crash_type == EnhancedCrashType.HLS_STREAMING_ERROR:
-            # Look for Kotlin coroutines stack traces
-            for log in related_logs:
-                if any(keyword in log.message for keyword in 
-                       ["kotlinx.coroutines", "invokeSuspend", "resumeWith"]):
-                    stack_trace.append(log.message)
-        
-        elif match.crash_type == EnhancedCrashType.VIDEO_CODEC_ERROR:
-            # Look for codec-specific traces
-            for log in related_logs:
-                if any(keyword in log.message for keyword in 
-                       ["Codec", "Buffer", "MediaFormat", "Surface"]):
-                    stack_trace.append(log.message)
-        
-        return stack_trace or [match.pattern]  # Fallback to pattern if no trace found
+        Applies the generic stack-trace rules and, until a generic trace
+        starts, collects type-specific trace lines in the same pass over
+        ``related_logs``. The generic trace wins when found.
+        """
+        keyword_scan = _STACK_TRACE_KEYWORD_SCANS.get(match.crash_type)
+        stack_trace = []
+        keyword_lines = []
+        in_stack_trace = False
+        
+        for log in related_logs:
+            message = log.message
+            if _is_stack_trace_start(message):
+                in_stack_trace = True
+                stack_trace.append(message)
+            elif in_stack_trace:
+                stripped = message.strip()
+                if stripped.startswith("at "):
+                    stack_trace.append(message)
+                elif stripped:
+                    # Non-stack trace line, stop collecting
+                    break
+            elif keyword_scan is not None and keyword_scan(message):
+                keyword_lines.append(message)
+        
+        return stack_trace or keyword_lines or [match.pattern]  # Fallback to pattern if no trace found
     
     def _update_enhanced_stats(self, match: PatternMatch):
         """Update enhanced statistics based on pattern match."""
-        self.enhanced_stats["enhanced_crashes_detected"] += 1
+        self._stats_dirty = True
+        stats = self.enhanced_stats
+        stats.enhanced_crashes_detected += 1
         
         # Update by crash type
-        crash_type_stats = {
-            EnhancedCrashType.HLS_STREAMING_ERROR: "hls_streaming_errors",
-            EnhancedCrashType.VIDEO_CODEC_ERROR: "video_codec_errors", 
-            EnhancedCrashType.RECEIVER_REGISTRATION_ERROR: "receiver_registration_errors",
-            EnhancedCrashType.MEDIA_PIPELINE_ERROR: "media_pipeline_errors",
-            EnhancedCrashType.HARDWARE_ACCELERATION_ERROR: "hardware_acceleration_errors",
-            EnhancedCrashType.MANIFEST_VALIDATION_ERROR: "manifest_validation_errors",
-        }
-        
-        stat_key = crash_type_stats.get(match.crash_type)
-        if stat_key:
-            self.enhanced_stats[stat_key] += 1
+        stat_name = match.crash_type.stat_name
+        setattr(stats, stat_name, getattr(stats, stat_name) + 1)
         
         # Update confidence stats
         if match.confidence >= 0.9:
-            self.enhanced_stats["high_confidence_detections"] += 1
+            stats.high_confidence_detections += 1
         elif match.confidence >= 0.7:
-            self.enhanced_stats["medium_confidence_detections"] += 1
+            stats.medium_confidence_detections += 1
         else:
-            self.enhanced_stats["low_confidence_detections"] += 1
+            stats.low_confidence_detections += 1
         
         # Update cascade stats
         if match.additional_context and match.additional_context.get("cascade_detected"):
-            self.enhanced_stats["cascade_failures_detected"] += 1
+            stats.cascade_failures_detected += 1
     
     def _process_enhanced_alert(self, match: PatternMatch, log_entry: LogEntry):
         """Process alerts for enhanced crashes."""
@@ -329,10 +452,9 @@ class EnhancedCrashDetector(CrashDetector):
         if match.additional_context:
             app_package = match.additional_context.get("likely_app")
         
-        if not app_package:
-            # Try to extract from log entry tag or message
-            if "." in log_entry.tag and len(log_entry.tag.split(".")) >= 3:
-                app_package = log_entry.tag
+        if not app_package and log_entry.tag.count(".") >= 2:
+            # Package-like tag (at least three dotted components)
+            app_package = log_entry.tag
         
         # Process through alerting system
         self.alerting_system.process_enhanced_crash(
@@ -340,89 +462,147 @@ class EnhancedCrashDetector(CrashDetector):
             device_serial=log_entry.device_serial,
             app_package=app_package
         )
+        self._stats_dirty = True
     
     def _console_alert_handler(self, alert: Alert):
         """Handle alerts by displaying them in console."""
         # Update alert statistics
-        self.enhanced_stats["total_alerts_sent"] += 1
-        
-        if alert.level.value == "critical":
-            self.enhanced_stats["critical_alerts_sent"] += 1
-        
-        if "cascade" in alert.alert_type.value:
-            self.enhanced_stats["cascade_alerts_sent"] += 1
-        
-        # Display alert in console with appropriate styling
-        alert_colors = {
-            "info": "blue",
-            "warning": "yellow", 
-            "error": "red",
-            "critical": "bright_red"
-        }
-        
-        color = alert_colors.get(alert.level.value, "white")
-        
-        # Create alert prefix based on type
-        alert_prefixes = {
-            "cascade_failure": "🚨 CASCADE",
-            "hls_streaming_down": "📺 HLS",
-            "video_codec_failure": "🎥 CODEC",
-            "system_instability": "⚠️  SYSTEM",
-            "single_crash": "💥 CRASH"
-        }
-        
-        prefix = alert_prefixes.get(alert.alert_type.value, "🔔 ALERT")
-        
-        # Display the alert
-        self.console.print(
-            f"[{color}]{prefix}[/{color}] "
-            f"[bold]{alert.title}[/bold] "
-            f"(Severity: {alert.severity or 'N/A'}/10)"
-        )
+        self._stats_dirty = True
+        self.enhanced_stats.total_alerts_sent += 1
+        
+        if alert.level is AlertLevel.CRITICAL:
+            self.enhanced_stats.critical_alerts_sent += 1
+        
+        if alert.alert_type in _CASCADE_ALERT_TYPES:
+            self.enhanced_stats.cascade_alerts_sent += 1
+        
+        # Counters stay on the caller's thread; only rendering is deferred
+        if self._render_queue is None:
+            self._render_alert(alert)
+            return
+        
+        try:
+            self._render_queue.put_nowait(alert)
+        except queue.Full:
+            # Rendering here would write the console from two threads
+            self.enhanced_stats.dropped_alert_renders += 1
+    
+    def _render_alert(self, alert: Alert):
+        """Display an alert in the console."""
+        # Display alert in console with styling for its level and type
+        headline = _ALERT_PREFIX_TEXT[alert.level, alert.alert_type].copy()
+        headline.append(alert.title, style="bold")
+        headline.append(f" (Severity: {alert.severity or 'N/A'}/10)")
+        self.console.print(headline)
         
         # Show additional info for cascade failures
-        if alert.alert_type.value == "cascade_failure" and alert.crash_count > 1:
+        if alert.alert_type is AlertType.CASCADE_FAILURE and alert.crash_count > 1:
             self.console.print(
                 f"  └─ {alert.crash_count} crashes in {alert.time_window_minutes} min(s)"
             )
     
+    def _render_loop(self):
+        """Background thread: render queued alerts until close() is called."""
+        render_queue = self._render_queue
+        while True:
+            alert = render_queue.get()
+            try:
+                if alert is None:
+                    return
+                self._render_alert(alert)
+            except Exception as e:
+                self.console.error(f"Error rendering alert: {e}")
+            finally:
+                render_queue.task_done()
+    
+    def flush_alerts(self):
+        """Block until every queued alert has been rendered."""
+        if self._render_queue is not None:
+            self._render_queue.join()
+    
+    def close(self, timeout: float = 5.0):
+        """Render queued alerts and stop the background render thread.
+        
+        If the thread is still busy after ``timeout`` it keeps its queue, so
+        the console is never written from two threads at once; call close()
+        again to retry.
+        """
+        thread = self._render_thread
+        if thread is None:
+            return
+        
+        if thread.is_alive():
+            deadline = time.monotonic() + timeout
+            try:
+                self._render_queue.put(None, timeout=timeout)
+            except queue.Full:
+                return
+            thread.join(max(0.0, deadline - time.monotonic()))
+            if thread.is_alive():
+                return
+        
+        # Alerts queued behind the stop marker are rendered here; any later
+        # alerts are rendered synchronously
+        leftovers = []
+        while True:
+            try:
+                alert = self._render_queue.get_nowait()
+            except queue.Empty:
+                break
+            if alert is not None:
+                leftovers.append(alert)
+        
+        self._render_thread = None
+        self._render_queue = None
+        for alert in leftovers:
+            self._render_alert(alert)
+    
     def set_device_model(self, device_serial: str, model: str):
         """Set device model for context."""
         self.device_models[device_serial] = model
     
     def get_enhanced_statistics(self) -> Dict:
-        """Get enhanced monitoring statistics."""
-        # Get alerting system stats
-        alert_stats = self.alerting_system.get_alert_statistics()
-        
-        # Get pattern matching stats
-        pattern_stats = self.enhanced_patterns.get_pattern_stats()
+        """Get enhanced monitoring statistics.
+        
+        The result is cached until the next detection or alert, or for at
+        most STATS_CACHE_SECONDS. Each call returns a shallow copy of the
+        cached dict; the nested sections are shared, so treat them as
+        read-only.
+        """
+        now = time.monotonic()
+        if (self._stats_dirty or
+                now - self._stats_cache_time >= self.STATS_CACHE_SECONDS):
+            self._stats_dirty = False
+            self._stats_cache_time = now
+            self._stats_cache = {
+                **asdict(self.enhanced_stats),
+                "alert_system": self.alerting_system.get_alert_statistics(),
+                "pattern_matching": self.enhanced_patterns.get_pattern_stats()
+            }
         
-        return {
-            **self.enhanced_stats,
-            "alert_system": alert_stats,
-            "pattern_matching": pattern_stats
-        }
+        return dict(self._stats_cache)
     
     def get_pattern_performance_summary(self) -> Dict:
         """Get summary of pattern matching performance."""
-        stats = self.get_enhanced_statistics()
+        # Only detector counters are needed, not the alerting/pattern stats
+        stats = self.enhanced_stats
         
-        total_enhanced = stats["enhanced_crashes_detected"]
+        total_enhanced = stats.enhanced_crashes_detected
         if total_enhanced == 0:
             return {"message": "No enhanced crashes detected yet"}
         
         # Calculate confidence distribution
-        high_conf_pct = (stats["high_confidence_detections"] / total_enhanced) * 100
-        medium_conf_pct = (stats["medium_confidence_detections"] / total_enhanced) * 100
-        low_conf_pct = (stats["low_confidence_detections"] / total_enhanced) * 100
+        pct_scale = 100.0 / total_enhanced
+        high_conf_pct = stats.high_confidence_detections * pct_scale
+        medium_conf_pct = stats.medium_confidence_detections * pct_scale
+        low_conf_pct = stats.low_confidence_detections * pct_scale
         
         # Calculate alert efficiency
-        alert_rate = (stats["total_alerts_sent"] / total_enhanced) * 100
+        alert_rate = stats.total_alerts_sent * pct_scale
         
         return {
             "total_enhanced_crashes": total_enhanced,
-            "cascade_failures": stats["cascade_failures_detected"],
+            "cascade_failures": stats.cascade_failures_detected,
             "confidence_distribution": {
                 "high": f"{high_conf_pct:.1f}%",
                 "medium": f"{medium_conf_pct:.1f}%", 
@@ -430,9 +610,9 @@ class EnhancedCrashDetector(CrashDetector):
             },
             "alert_efficiency": f"{alert_rate:.1f}%",
             "top_crash_types": {
-                "HLS Streaming": stats["hls_streaming_errors"],
-                "Video Codec": stats["video_codec_errors"],
-                "Receiver Registration": stats["receiver_registration_errors"],
-                "Hardware Acceleration": stats["hardware_acceleration_errors"]
+                "HLS Streaming": stats.hls_streaming_errors,
+                "Video Codec": stats.video_codec_errors,
+                "Receiver Registration": stats.receiver_registration_errors,
+                "Hardware Acceleration": stats.hardware_acceleration_errors
             }
         }
\ No newline at end of file
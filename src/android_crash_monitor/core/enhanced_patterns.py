@@ -13,11 +13,32 @@ patterns identified from the System.err crash analysis, focusing on:
 - Media pipeline errors
 """
 
+import bisect
 import re
+from collections import Counter, deque
 from enum import Enum
-from typing import Dict, List, Optional, Tuple
+from functools import lru_cache
+from itertools import accumulate
+from types import MappingProxyType
+from typing import Deque, Dict, List, Optional, Sequence, Tuple
 from dataclasses import dataclass
 
+from ..utils.compat import DATACLASS_SLOTS
+
+try:
+    import hyperscan
+    HYPERSCAN_AVAILABLE = True
+except ImportError:
+    hyperscan = None
+    HYPERSCAN_AVAILABLE = False
+
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    ahocorasick = None
+    AHOCORASICK_AVAILABLE = False
+
 
 class EnhancedCrashType(Enum):
     """Enhanced crash types for System.err specific errors."""
@@ -29,7 +50,54 @@ class EnhancedCrashType(Enum):
     MANIFEST_VALIDATION_ERROR = "manifest_validation_error"
 
 
-@dataclass
+# Alert wording carried on each member (crash_type.alert_title /
+# crash_type.message_template) so the alerting hot path reads an attribute
+# instead of building and hashing into a lookup table per alert.
+# message_template takes a single {pattern} field.
+_ALERT_TEXT = {
+    EnhancedCrashType.HLS_STREAMING_ERROR: (
+        "HLS Streaming Failure",
+        "HLS streaming error detected. Pattern: {pattern}... "
+        "This typically indicates video playback issues in browsers or media apps."
+    ),
+    EnhancedCrashType.VIDEO_CODEC_ERROR: (
+        "Video Codec Error",
+        "Video codec error detected. Pattern: {pattern}... "
+        "This may affect video playback performance and quality."
+    ),
+    EnhancedCrashType.RECEIVER_REGISTRATION_ERROR: (
+        "Receiver Registration Issue",
+        "Broadcast receiver registration error. Pattern: {pattern}... "
+        "This indicates app lifecycle management issues."
+    ),
+    EnhancedCrashType.MEDIA_PIPELINE_ERROR: (
+        "Media Pipeline Error",
+        "Media pipeline error detected. Pattern: {pattern}... "
+        "This affects media playback functionality."
+    ),
+    EnhancedCrashType.HARDWARE_ACCELERATION_ERROR: (
+        "Hardware Acceleration Failure",
+        "Hardware acceleration error detected. Pattern: {pattern}... "
+        "This may degrade system graphics performance."
+    ),
+    EnhancedCrashType.MANIFEST_VALIDATION_ERROR: (
+        "Media Manifest Validation Error",
+        "Media manifest validation error. Pattern: {pattern}... "
+        "This indicates issues with media content format validation."
+    ),
+}
+
+for _crash_type, (_title, _template) in _ALERT_TEXT.items():
+    _crash_type.alert_title = _title
+    _crash_type.message_template = _template
+
+# Detection counter for each member (crash_type.stat_name), e.g.
+# "hls_streaming_errors" in EnhancedCrashDetector's statistics
+for _crash_type in EnhancedCrashType:
+    _crash_type.stat_name = f"{_crash_type.value}s"
+
+
+@dataclass(**DATACLASS_SLOTS)
 class PatternMatch:
     """Result of pattern matching with metadata."""
     crash_type: EnhancedCrashType
@@ -133,22 +201,37 @@ class SystemErrPatterns:
 class CascadeDetector:
     """Detects cascade failure patterns in crash sequences."""
     
+    __slots__ = ("window_seconds", "threshold_count", "recent_crashes", "type_counts")
+    
     def __init__(self, window_seconds: int = 5, threshold_count: int = 3):
         self.window_seconds = window_seconds
         self.threshold_count = threshold_count
-        self.recent_crashes: List[Tuple[float, str]] = []  # (timestamp, crash_type)
+        # (timestamp, crash_type), kept sorted by timestamp
+        self.recent_crashes: Deque[Tuple[float, str]] = deque()
+        # crash_type -> occurrences in recent_crashes
+        self.type_counts: Counter = Counter()
     
     def add_crash(self, timestamp: float, crash_type: str) -> bool:
         """Add a crash and check if it triggers cascade detection."""
-        # Add to recent crashes
-        self.recent_crashes.append((timestamp, crash_type))
+        # Add to recent crashes; out-of-order timestamps (e.g. interleaved
+        # devices) are inserted in place so eviction can stop at the first
+        # entry inside the window
+        recent = self.recent_crashes
+        if not recent or timestamp >= recent[-1][0]:
+            recent.append((timestamp, crash_type))
+        else:
+            entry = (timestamp, crash_type)
+            recent.insert(bisect.bisect_right(recent, entry), entry)
+        type_counts = self.type_counts
+        type_counts[crash_type] += 1
         
         # Clean old entries outside the window
         cutoff_time = timestamp - self.window_seconds
-        self.recent_crashes = [
-            (ts, ct) for ts, ct in self.recent_crashes 
-            if ts >= cutoff_time
-        ]
+        while recent[0][0] < cutoff_time:
+            _, expired_type = recent.popleft()
+            type_counts[expired_type] -= 1
+            if not type_counts[expired_type]:
+                del type_counts[expired_type]
         
         # Check if we have a cascade
         return len(self.recent_crashes) >= self.threshold_count
@@ -158,44 +241,374 @@ class CascadeDetector:
         if len(self.recent_crashes) < self.threshold_count:
             return {}
         
-        crash_types = [ct for _, ct in self.recent_crashes]
-        unique_types = set(crash_types)
-        
+        # Ties for dominant type go to the type present in the window longest
+        type_counts = self.type_counts
         return {
             "total_crashes": len(self.recent_crashes),
-            "unique_types": len(unique_types),
-            "crash_types": list(unique_types),
+            "unique_types": len(type_counts),
+            "crash_types": list(type_counts),
             "time_window": self.window_seconds,
-            "dominant_type": max(crash_types, key=crash_types.count) if crash_types else None
+            "dominant_type": type_counts.most_common(1)[0][0] if type_counts else None
         }
 
 
+# Severity for each crash type, before any cascade bump
+_SEVERITY_OVERRIDES = {
+    # High severity for streaming failures as they affect user experience
+    EnhancedCrashType.HLS_STREAMING_ERROR: 7,
+    
+    # Medium-high for codec errors as they can cascade
+    EnhancedCrashType.VIDEO_CODEC_ERROR: 6,
+    
+    # Medium for receiver issues - usually app-specific
+    EnhancedCrashType.RECEIVER_REGISTRATION_ERROR: 5,
+    
+    # Medium for media pipeline issues
+    EnhancedCrashType.MEDIA_PIPELINE_ERROR: 5,
+    
+    # High for hardware acceleration as it affects performance
+    EnhancedCrashType.HARDWARE_ACCELERATION_ERROR: 7,
+    
+    # Medium for manifest validation
+    EnhancedCrashType.MANIFEST_VALIDATION_ERROR: 6,
+}
+
+# Carried on each member (crash_type.severity_override): Enum hashing runs
+# in Python, so an attribute read is ~10x cheaper than a dict lookup
+for _crash_type in EnhancedCrashType:
+    _crash_type.severity_override = _SEVERITY_OVERRIDES.get(_crash_type)
+
+# (codec name, lowercase token) in reporting priority order
+_CODEC_TOKENS = (("VP9", "vp9"), ("H264", "h264"), ("HEVC", "hevc"), ("AV1", "av1"))
+
+# Codec tokens that raise video codec match confidence
+_CONFIDENT_CODEC_TOKENS = ("vp9", "h264", "hevc")
+_CONFIDENT_CODECS = frozenset(("VP9", "H264", "HEVC"))
+
+# Constant part of each crash type's additional_context, in output key
+# order; "detection_tag" is filled in per match
+_BASE_CONTEXTS = {
+    crash_type: {"crash_category": "system_err_enhanced", "detection_tag": None}
+    for crash_type in EnhancedCrashType
+}
+_BASE_CONTEXTS[EnhancedCrashType.HLS_STREAMING_ERROR].update(
+    error_category="media_streaming", streaming_protocol="HLS")
+
+for _crash_type, _base_context in _BASE_CONTEXTS.items():
+    _crash_type.base_context = _base_context
+
+_RECEIVER_CLASS_PATTERN = re.compile(r"r8\.([a-zA-Z0-9$@]+)", re.IGNORECASE)
+
+# Named-group variants searched in place of a reported pattern, so context
+# extraction can reuse the match; PatternMatch.pattern keeps the plain text
+_CAPTURING_PATTERNS = {
+    r"Receiver not registered: r8\.[a-zA-Z0-9$@]+":
+        r"Receiver not registered: r8\.(?P<receiver_class>[a-zA-Z0-9$@]+)",
+}
+
+_REGEX_METACHARS = frozenset(".^$*+?{}[]\\|()")
+
+
+def _required_literal(pattern: str) -> str:
+    """Return the literal text every match of ``pattern`` must start with."""
+    end = 0
+    while end < len(pattern) and pattern[end] not in _REGEX_METACHARS:
+        end += 1
+    if end < len(pattern) and pattern[end] in "*?{":
+        end -= 1  # The quantifier makes the last literal character optional
+    return pattern[:end]
+
+
+# Patterns with groups or letter escapes (\d, \S, ...) can't be lowercased
+_UNFOLDABLE_PATTERN = re.compile(r"\\[A-Za-z]|\(")
+
+
+def _folded_regex(pattern: str) -> Optional[re.Pattern]:
+    """Compile a case-sensitive equivalent of ``pattern`` for casefolded text.
+    
+    Case-sensitive search lets ``re`` use its literal-prefix scan, which
+    IGNORECASE disables. Returns None for patterns that must run against
+    the original message: those whose text can't be safely lowercased and
+    those with capture groups, whose values should keep the original case.
+    """
+    if _UNFOLDABLE_PATTERN.search(pattern):
+        return None
+    return re.compile(pattern.lower())
+
+
+@lru_cache(maxsize=None)
+def _hyperscan_database(expressions: Tuple[str, ...]):
+    """Compile case-insensitive expressions into a Hyperscan block database.
+    
+    Compilation takes a noticeable fraction of a second, so the database
+    is shared by every EnhancedCrashPatterns built from the same patterns.
+    Its scratch space is not: each instance scans with its own Scratch.
+    Returns None if Hyperscan rejects an expression.
+    """
+    try:
+        database = hyperscan.Database()
+        database.compile(
+            expressions=[expression.encode() for expression in expressions],
+            ids=list(range(len(expressions))),
+            elements=len(expressions),
+            flags=[hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SINGLEMATCH] * len(expressions),
+        )
+    except hyperscan.error:
+        return None
+    return database
+
+
+def _compile_patterns() -> Dict[EnhancedCrashType, Tuple[re.Pattern, ...]]:
+    """Compile all enhanced patterns for performance."""
+    patterns = {
+        EnhancedCrashType.HLS_STREAMING_ERROR: SystemErrPatterns.HLS_STREAMING_PATTERNS,
+        EnhancedCrashType.VIDEO_CODEC_ERROR: SystemErrPatterns.VIDEO_CODEC_PATTERNS,
+        EnhancedCrashType.RECEIVER_REGISTRATION_ERROR: SystemErrPatterns.RECEIVER_REGISTRATION_PATTERNS,
+        EnhancedCrashType.MEDIA_PIPELINE_ERROR: SystemErrPatterns.MEDIA_PIPELINE_PATTERNS,
+        EnhancedCrashType.HARDWARE_ACCELERATION_ERROR: SystemErrPatterns.HARDWARE_ACCELERATION_PATTERNS,
+        EnhancedCrashType.MANIFEST_VALIDATION_ERROR: SystemErrPatterns.MANIFEST_VALIDATION_PATTERNS,
+    }
+    
+    return {
+        crash_type: tuple(re.compile(pattern, re.IGNORECASE) for pattern in pattern_list)
+        for crash_type, pattern_list in patterns.items()
+    }
+
+
+def _search_regex(pattern: re.Pattern) -> Tuple[re.Pattern, bool]:
+    """Return (regex to search, whether it runs on the casefolded message)."""
+    capturing = _CAPTURING_PATTERNS.get(pattern.pattern)
+    if capturing is not None:
+        return re.compile(capturing, re.IGNORECASE), False
+    folded_regex = _folded_regex(pattern.pattern)
+    if folded_regex is not None:
+        return folded_regex, True
+    return pattern, False
+
+
+def _guard_patterns(compiled_patterns):
+    """Pair each pattern with the lowercase literal every match must contain.
+    
+    Entries are (lowercase leading literal, reported pattern, regex to
+    search, regex runs on the casefolded message, pattern is just the
+    literal). A pattern is only searched when its literal occurs in the
+    casefolded message, and plain literals need no search at all.
+    """
+    return {
+        crash_type: tuple(
+            (literal.lower(), pattern, *_search_regex(pattern),
+             literal == pattern.pattern)
+            for pattern in patterns
+            for literal in (_required_literal(pattern.pattern),)
+        )
+        for crash_type, patterns in compiled_patterns.items()
+    }
+
+
+def _build_prefilter(compiled_patterns) -> Optional[Tuple[str, ...]]:
+    """Collect the smallest set of lowercase literals covering all patterns.
+    
+    Every pattern match contains its leading literal, so a message
+    containing none of these literals cannot match any pattern. Literals
+    that contain a shorter literal from the set are dropped as redundant.
+    Returns None when some pattern has no leading literal.
+    """
+    literals = set()
+    for patterns in compiled_patterns.values():
+        for pattern in patterns:
+            literal = _required_literal(pattern.pattern)
+            if not literal:
+                return None
+            literals.add(literal.lower())
+    
+    return tuple(sorted(
+        literal for literal in literals
+        if not any(other != literal and other in literal for other in literals)
+    ))
+
+
+def _build_literal_automaton(guarded_patterns):
+    """Build an automaton over all guard literals, if pyahocorasick is available."""
+    if not AHOCORASICK_AVAILABLE:
+        return None
+    
+    automaton = ahocorasick.Automaton()
+    for entries in guarded_patterns.values():
+        for literal, _, _, _, _ in entries:
+            if literal:
+                automaton.add_word(literal, literal)
+    automaton.make_automaton()
+    return automaton
+
+
+@lru_cache(maxsize=1)
+def _pattern_tables():
+    """Build the read-only pattern tables shared by every EnhancedCrashPatterns.
+    
+    The patterns are class-level constants, so compiling them, deriving
+    their guards and building the prefilter and automaton only needs to
+    happen once per process rather than once per detector.
+    Returns (compiled patterns, guarded patterns, prefilter literals, automaton).
+    """
+    compiled_patterns = _compile_patterns()
+    guarded_patterns = _guard_patterns(compiled_patterns)
+    return (
+        MappingProxyType(compiled_patterns),
+        MappingProxyType(guarded_patterns),
+        _build_prefilter(compiled_patterns),
+        _build_literal_automaton(guarded_patterns),
+    )
+
+
 class EnhancedCrashPatterns:
     """Enhanced crash pattern detection with System.err specific patterns."""
     
+    __slots__ = ("compiled_patterns", "guarded_patterns", "prefilter_literals",
+                 "literal_automaton", "cascade_detector", "hyperscan_db",
+                 "_hyperscan_patterns", "_hyperscan_scratch")
+    
     def __init__(self):
-        self.compiled_patterns = self._compile_patterns()
+        (self.compiled_patterns, self.guarded_patterns,
+         self.prefilter_literals, self.literal_automaton) = _pattern_tables()
         self.cascade_detector = CascadeDetector()
+        
+        # Optional multi-pattern database scanning all patterns in one pass.
+        # Scratch space can't serve two scans at once, so unlike the shared
+        # database each instance (used from one thread, like its cascade
+        # detector) allocates its own.
+        self.hyperscan_db, self._hyperscan_patterns = self._compile_hyperscan()
+        self._hyperscan_scratch = (
+            hyperscan.Scratch(self.hyperscan_db) if self.hyperscan_db is not None else None
+        )
     
-    def _compile_patterns(self) -> Dict[EnhancedCrashType, List[re.Pattern]]:
-        """Compile all enhanced patterns for performance."""
-        patterns = {
-            EnhancedCrashType.HLS_STREAMING_ERROR: SystemErrPatterns.HLS_STREAMING_PATTERNS,
-            EnhancedCrashType.VIDEO_CODEC_ERROR: SystemErrPatterns.VIDEO_CODEC_PATTERNS,
-            EnhancedCrashType.RECEIVER_REGISTRATION_ERROR: SystemErrPatterns.RECEIVER_REGISTRATION_PATTERNS,
-            EnhancedCrashType.MEDIA_PIPELINE_ERROR: SystemErrPatterns.MEDIA_PIPELINE_PATTERNS,
-            EnhancedCrashType.HARDWARE_ACCELERATION_ERROR: SystemErrPatterns.HARDWARE_ACCELERATION_PATTERNS,
-            EnhancedCrashType.MANIFEST_VALIDATION_ERROR: SystemErrPatterns.MANIFEST_VALIDATION_PATTERNS,
-        }
+    def might_match(self, message: str) -> bool:
+        """Cheap check that rules out messages no enhanced pattern can match."""
+        if self.prefilter_literals is None:
+            return True
+        message = message.casefold()
+        if self.literal_automaton is not None:
+            # Every prefilter literal is a guard literal and every guard
+            # literal contains one, so any automaton hit is a prefilter hit
+            return next(self.literal_automaton.iter(message), None) is not None
+        return any(literal in message for literal in self.prefilter_literals)
+    
+    def might_match_batch(self, messages: Sequence[str]) -> List[bool]:
+        """Vectorized might_match() over many messages.
+        
+        The messages are joined into one buffer and scanned once per
+        prefilter literal (or once in total with the automaton); each hit is
+        mapped back to its message through the running message end offsets.
+        Literals never contain the separator, so a hit cannot straddle two
+        messages. Non-ASCII batches, whose casefolding may change lengths,
+        fall back to per-message checks.
+        """
+        if self.prefilter_literals is None:
+            return [True] * len(messages)
+        
+        blob = "\n".join(messages)
+        if not blob.isascii():
+            return [self.might_match(message) for message in messages]
+        blob = blob.lower()
+        
+        # ends[i] is one past message i's separator, so the message holding
+        # offset pos is bisect_right(ends, pos)
+        ends = list(accumulate(map((1).__add__, map(len, messages))))
+        candidates = [False] * len(messages)
+        if self.literal_automaton is not None:
+            for end, _ in self.literal_automaton.iter(blob):
+                candidates[bisect.bisect_right(ends, end)] = True
+            return candidates
+        
+        for literal in self.prefilter_literals:
+            pos = blob.find(literal)
+            while pos != -1:
+                index = bisect.bisect_right(ends, pos)
+                candidates[index] = True
+                # The rest of this message cannot add anything
+                pos = blob.find(literal, ends[index])
+        return candidates
+    
+    def detect_enhanced_crashes_batch(
+            self, lines: Sequence[Tuple[str, str, float]]) -> List[List[PatternMatch]]:
+        """Detect enhanced crash patterns in (message, tag, timestamp) lines.
+        
+        Equivalent to calling detect_enhanced_crashes() on each line in
+        order, but lines are prefiltered together by might_match_batch().
+        """
+        candidates = self.might_match_batch([message for message, _, _ in lines])
+        return [
+            self.detect_enhanced_crashes(message, tag, timestamp) if candidate else []
+            for (message, tag, timestamp), candidate in zip(lines, candidates)
+        ]
+    
+    def _compile_hyperscan(self):
+        """Look up the Hyperscan database for all patterns, if available.
+        
+        Pattern IDs follow type order and then list order, so the lowest
+        matching ID per type is the pattern the ``re`` path would report.
+        Returns (None, []) when Hyperscan is missing or rejects a pattern.
+        """
+        if not HYPERSCAN_AVAILABLE:
+            return None, []
         
-        compiled = {}
-        for crash_type, pattern_list in patterns.items():
-            compiled[crash_type] = [
-                re.compile(pattern, re.IGNORECASE) 
-                for pattern in pattern_list
-            ]
+        ordered = [
+            (crash_type, pattern)
+            for crash_type, compiled_patterns in self.compiled_patterns.items()
+            for pattern in compiled_patterns
+        ]
+        database = _hyperscan_database(tuple(pattern.pattern for _, pattern in ordered))
+        if database is None:
+            return None, []
         
-        return compiled
+        return database, ordered
+    
+    def _find_pattern_matches(
+        self, message: str, folded: str
+    ) -> List[Tuple[EnhancedCrashType, re.Pattern, Optional[re.Match]]]:
+        """Return the first matching pattern for each crash type, in type order.
+        
+        Each entry carries the ``re.Match`` so context extraction can reuse
+        its named groups; it is None when Hyperscan found the match.
+        ``folded`` is ``message.casefold()``, shared with the context helpers.
+        """
+        found = []
+        
+        if self.hyperscan_db is not None:
+            matched_ids = set()
+            self.hyperscan_db.scan(
+                message.encode('utf-8', errors='replace'),
+                match_event_handler=lambda pattern_id, start, end, flags, context:
+                    matched_ids.add(pattern_id),
+                scratch=self._hyperscan_scratch
+            )
+            seen_types = set()
+            for pattern_id in sorted(matched_ids):
+                crash_type, pattern = self._hyperscan_patterns[pattern_id]
+                if crash_type not in seen_types:
+                    seen_types.add(crash_type)
+                    found.append((crash_type, pattern, None))
+            return found
+        
+        # Guards test literals against the set of literals the automaton
+        # found, or by substring search in the casefolded message without it
+        if self.literal_automaton is not None:
+            literals_present = {literal for _, literal in self.literal_automaton.iter(folded)}
+            literals_present.add("")  # Patterns without a literal always run
+        else:
+            literals_present = folded
+        
+        for crash_type, guarded_patterns in self.guarded_patterns.items():
+            for literal, pattern, regex, search_folded, literal_only in guarded_patterns:
+                if literal in literals_present:
+                    if literal_only:
+                        found.append((crash_type, pattern, None))
+                        break
+                    pattern_match = regex.search(folded if search_folded else message)
+                    if pattern_match:
+                        found.append((crash_type, pattern, pattern_match))
+                        break  # Don't duplicate same type
+        
+        return found
     
     def detect_enhanced_crashes(self, message: str, tag: str = "", 
                               timestamp: float = 0.0) -> List[PatternMatch]:
@@ -203,36 +616,36 @@ class EnhancedCrashPatterns:
         matches = []
         
         # Check each enhanced pattern type
-        for crash_type, compiled_patterns in self.compiled_patterns.items():
-            for pattern in compiled_patterns:
-                if pattern.search(message):
-                    confidence = self._calculate_confidence(
-                        crash_type, message, tag
-                    )
-                    severity = self._get_severity_override(crash_type, message)
-                    context = self._extract_context(crash_type, message, tag)
-                    
-                    match = PatternMatch(
-                        crash_type=crash_type,
-                        pattern=pattern.pattern,
-                        confidence=confidence,
-                        severity_override=severity,
-                        additional_context=context
-                    )
-                    matches.append(match)
-                    break  # Don't duplicate same type
+        folded = message.casefold()
+        for crash_type, pattern, pattern_match in self._find_pattern_matches(message, folded):
+            context = self._extract_context(crash_type, message, tag, folded, pattern_match)
+            confidence = self._calculate_confidence(
+                crash_type, message, tag, folded, context
+            )
+            severity = crash_type.severity_override
+            
+            match = PatternMatch(
+                crash_type=crash_type,
+                pattern=pattern.pattern,
+                confidence=confidence,
+                severity_override=severity,
+                additional_context=context
+            )
+            matches.append(match)
         
         # Check for cascade patterns if we have matches
+        # matches holds at most one entry per crash type, so each type is
+        # recorded once per message
         if matches and timestamp > 0:
+            cascade_detector = self.cascade_detector
             for match in matches:
-                is_cascade = self.cascade_detector.add_crash(
+                is_cascade = cascade_detector.add_crash(
                     timestamp, match.crash_type.value
                 )
                 if is_cascade:
-                    cascade_info = self.cascade_detector.get_cascade_info()
-                    if match.additional_context is None:
-                        match.additional_context = {}
-                    match.additional_context["cascade_detected"] = cascade_info
+                    # _extract_context always returns a dict
+                    match.additional_context["cascade_detected"] = \
+                        cascade_detector.get_cascade_info()
                     # Increase severity for cascade failures
                     if match.severity_override:
                         match.severity_override = min(10, match.severity_override + 2)
@@ -242,8 +655,13 @@ class EnhancedCrashPatterns:
         return matches
     
     def _calculate_confidence(self, crash_type: EnhancedCrashType, 
-                            message: str, tag: str) -> float:
-        """Calculate confidence level for pattern match."""
+                            message: str, tag: str, folded: str,
+                            context: Optional[Dict[str, str]] = None) -> float:
+        """Calculate confidence level for pattern match.
+        
+        ``folded`` is ``message.casefold()``; ``context`` is the match's
+        extracted context, whose codec_type saves rescanning for codecs.
+        """
         base_confidence = 0.8
         
         # Increase confidence for specific conditions
@@ -258,7 +676,12 @@ class EnhancedCrashPatterns:
                 base_confidence += 0.15
         
         elif crash_type == EnhancedCrashType.VIDEO_CODEC_ERROR:
-            if any(codec in message.lower() for codec in ["vp9", "h264", "hevc"]):
+            if context is not None:
+                # The first codec found is confident iff any confident one is
+                confident = context.get("codec_type") in _CONFIDENT_CODECS
+            else:
+                confident = any(codec in folded for codec in _CONFIDENT_CODEC_TOKENS)
+            if confident:
                 base_confidence += 0.1
         
         return min(1.0, base_confidence)
@@ -266,59 +689,40 @@ class EnhancedCrashPatterns:
     def _get_severity_override(self, crash_type: EnhancedCrashType, 
                              message: str) -> Optional[int]:
         """Get severity override for specific crash types."""
-        severity_map = {
-            # High severity for streaming failures as they affect user experience
-            EnhancedCrashType.HLS_STREAMING_ERROR: 7,
-            
-            # Medium-high for codec errors as they can cascade
-            EnhancedCrashType.VIDEO_CODEC_ERROR: 6,
-            
-            # Medium for receiver issues - usually app-specific
-            EnhancedCrashType.RECEIVER_REGISTRATION_ERROR: 5,
-            
-            # Medium for media pipeline issues
-            EnhancedCrashType.MEDIA_PIPELINE_ERROR: 5,
-            
-            # High for hardware acceleration as it affects performance
-            EnhancedCrashType.HARDWARE_ACCELERATION_ERROR: 7,
-            
-            # Medium for manifest validation
-            EnhancedCrashType.MANIFEST_VALIDATION_ERROR: 6,
-        }
-        
-        return severity_map.get(crash_type)
+        return crash_type.severity_override
     
     def _extract_context(self, crash_type: EnhancedCrashType, 
-                        message: str, tag: str) -> Dict[str, str]:
-        """Extract additional context from crash messages."""
-        context = {
-            "crash_category": "system_err_enhanced",
-            "detection_tag": tag
-        }
+                        message: str, tag: str, folded: str,
+                        pattern_match: Optional[re.Match] = None) -> Dict[str, str]:
+        """Extract additional context from crash messages.
+        
+        ``folded`` is ``message.casefold()``; ``pattern_match`` is the match of
+        the detecting pattern, whose named groups are used when present.
+        """
+        groups = pattern_match.groupdict() if pattern_match else {}
+        # Copy the per-type template; the result is mutated later (cascade
+        # info) and serialized as alert metadata, so it must be a plain dict
+        context = crash_type.base_context.copy()
+        context["detection_tag"] = tag
         
         # Extract specific context based on crash type
         if crash_type == EnhancedCrashType.HLS_STREAMING_ERROR:
-            context["error_category"] = "media_streaming"
-            context["streaming_protocol"] = "HLS"
-            if "aloha" in message.lower():
+            if "aloha" in folded:
                 context["likely_app"] = "com.aloha.browser"
         
         elif crash_type == EnhancedCrashType.RECEIVER_REGISTRATION_ERROR:
             # Extract receiver class if available
-            receiver_match = re.search(r"r8\.([a-zA-Z0-9$@]+)", message)
-            if receiver_match:
-                context["receiver_class"] = receiver_match.group(1)
+            receiver_class = groups.get("receiver_class")
+            if receiver_class is None:
+                receiver_match = _RECEIVER_CLASS_PATTERN.search(message)
+                receiver_class = receiver_match.group(1) if receiver_match else None
+            if receiver_class:
+                context["receiver_class"] = receiver_class
         
         elif crash_type == EnhancedCrashType.VIDEO_CODEC_ERROR:
             # Extract codec type
-            codec_patterns = {
-                "VP9": "vp9",
-                "H264": "h264",
-                "HEVC": "hevc",
-                "AV1": "av1"
-            }
-            for codec_name, pattern in codec_patterns.items():
-                if pattern in message.lower():
+            for codec_name, token in _CODEC_TOKENS:
+                if token in folded:
                     context["codec_type"] = codec_name
                     break
         
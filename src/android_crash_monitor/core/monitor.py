@@ -11,21 +11,27 @@ Core monitoring functionality that:
 """
 
 import asyncio
-import json
+import heapq
 import os
 import re
 import signal
 import time
+from collections import deque
 from datetime import datetime, timedelta
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List, Optional, Set, AsyncGenerator, Callable
+from typing import Deque, Dict, List, Optional, Set, AsyncGenerator, Callable, Tuple
 from enum import Enum
+from itertools import islice
+from operator import itemgetter
 
 from .adb import ADBManager, ADBError, AndroidDevice
 from .config import MonitoringConfig, ConfigManager
 from ..ui.console import ConsoleUI
+from ..utils.compat import DATACLASS_SLOTS
+from ..utils.json_utils import dumps_json
 from ..utils.logger import get_logger
+from ..utils.time_utils import cached_logcat_now
 
 # Enhanced detection components
 try:
@@ -55,6 +61,11 @@ class LogLevel(Enum):
     FATAL = "F"
 
 
+# Logcat priority letter -> LogLevel; a dict hit is much cheaper than
+# calling the Enum for every parsed line
+_LOG_LEVELS = {level.value: level for level in LogLevel}
+
+
 class CrashType(Enum):
     """Types of crashes and errors we detect."""
     ANR = "anr"  # Application Not Responding
@@ -68,7 +79,25 @@ class CrashType(Enum):
     UNKNOWN = "unknown"  # Other errors
 
 
-@dataclass
+# Title wording carried on each member (crash_type.crash_title) so building
+# a crash title reads an attribute instead of a dict rebuilt per crash
+_CRASH_TITLES = {
+    CrashType.ANR: "Application Not Responding",
+    CrashType.CRASH: "Application Crash",
+    CrashType.NATIVE_CRASH: "Native Code Crash",
+    CrashType.RUNTIME_ERROR: "Runtime Exception",
+    CrashType.OUT_OF_MEMORY: "Out of Memory Error",
+    CrashType.PERMISSION_ERROR: "Permission Denied",
+    CrashType.NETWORK_ERROR: "Network Connection Error",
+    CrashType.DATABASE_ERROR: "Database Error",
+    CrashType.UNKNOWN: "Unknown Error",
+}
+
+for _crash_type, _title in _CRASH_TITLES.items():
+    _crash_type.crash_title = _title
+
+
+@dataclass(**DATACLASS_SLOTS)
 class LogEntry:
     """Represents a single Android log entry."""
     timestamp: str
@@ -78,16 +107,39 @@ class LogEntry:
     tid: int
     message: str
     device_serial: str
-    raw_line: str
+    
+    # Tag given to lines that are not in logcat format; their message is
+    # the whole line
+    UNPARSED_TAG = "UNKNOWN"
+    
+    @property
+    def raw_line(self) -> str:
+        """The logcat line, rebuilt in threadtime format from the parsed fields.
+        
+        Not stored: buffered entries would otherwise keep a second copy of
+        every line. Column padding may differ from the original line.
+        """
+        if self.tag == self.UNPARSED_TAG and self.pid == 0:
+            return self.message
+        return (f"{self.timestamp} {self.pid:>5} {self.tid:>5} "
+                f"{self.level.value} {self.tag}: {self.message}")
     
     def to_dict(self) -> dict:
+        # Built by hand: asdict() walks dataclass fields recursively and
+        # deep-copies values, once per related log of every saved crash
         return {
-            **asdict(self),
-            'level': self.level.value
+            'timestamp': self.timestamp,
+            'level': self.level.value,
+            'tag': self.tag,
+            'pid': self.pid,
+            'tid': self.tid,
+            'message': self.message,
+            'device_serial': self.device_serial,
+            'raw_line': self.raw_line
         }
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class CrashEvent:
     """Represents a detected crash or error event."""
     timestamp: str
@@ -108,13 +160,27 @@ class CrashEvent:
     first_seen: str
     
     def to_dict(self) -> dict:
-        result = asdict(self)
-        result['crash_type'] = self.crash_type.value
-        result['related_logs'] = [log.to_dict() for log in self.related_logs]
-        return result
+        # Built by hand, see LogEntry.to_dict; lists are still copied so the
+        # result can be modified without touching the event
+        return {
+            'timestamp': self.timestamp,
+            'crash_type': self.crash_type.value,
+            'app_package': self.app_package,
+            'app_name': self.app_name,
+            'severity': self.severity,
+            'title': self.title,
+            'description': self.description,
+            'stack_trace': list(self.stack_trace),
+            'related_logs': [log.to_dict() for log in self.related_logs],
+            'device_serial': self.device_serial,
+            'device_model': self.device_model,
+            'session_id': self.session_id,
+            'detection_patterns': list(self.detection_patterns),
+            'first_seen': self.first_seen
+        }
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class MonitoringStats:
     """Statistics about the monitoring session."""
     session_id: str
@@ -211,6 +277,30 @@ class CrashPatterns:
         r"SQLiteCantOpenDatabaseException"
     ]
     
+    # Lowercase substrings, per type, at least one of which occurs in any
+    # message matching one of that type's patterns. Types missing here have
+    # no safe trigger and always run their patterns.
+    TRIGGERS = {
+        CrashType.ANR: (
+            "anr in ", ": anr", "application not responding", "input dispatching timed out"
+        ),
+        CrashType.CRASH: ("fatal exception", "process: ", "exit called, status: "),
+        CrashType.NATIVE_CRASH: (
+            ": *** fatal exception in process", ": build fingerprint:",
+            ": abort message:", ": fatal signal ", ": crash_dump"
+        ),
+        CrashType.RUNTIME_ERROR: ("java.lang.", "exception"),
+        CrashType.OUT_OF_MEMORY: (
+            "outofmemoryerror", "failed to allocate", "low on memory", "gc_"
+        ),
+        CrashType.PERMISSION_ERROR: ("permission", "securityexception", "access denied"),
+        CrashType.NETWORK_ERROR: (
+            "unknownhostexception", "timeoutexception",
+            "no network security config specified", "unable to resolve host"
+        ),
+        CrashType.DATABASE_ERROR: ("sqliteexception", "sqlexception", "database"),
+    }
+    
     @classmethod
     def get_all_patterns(cls) -> Dict[CrashType, List[str]]:
         """Get all crash patterns organized by type."""
@@ -248,38 +338,51 @@ class LogParser:
         if not match:
             # Handle malformed lines gracefully
             return LogEntry(
-                timestamp=datetime.now().strftime("%m-%d %H:%M:%S.%f")[:-3],
+                timestamp=cached_logcat_now(),
                 level=LogLevel.INFO,
-                tag="UNKNOWN",
+                tag=LogEntry.UNPARSED_TAG,
                 pid=0,
                 tid=0,
                 message=line,
-                device_serial=device_serial,
-                raw_line=line
+                device_serial=device_serial
             )
         
         timestamp, pid, tid, level, tag, message = match.groups()
         
-        try:
-            log_level = LogLevel(level)
-        except ValueError:
-            log_level = LogLevel.INFO
-        
         return LogEntry(
             timestamp=timestamp,
-            level=log_level,
+            level=_LOG_LEVELS.get(level, LogLevel.INFO),
             tag=tag.strip(),
             pid=int(pid),
             tid=int(tid),
             message=message.strip(),
-            device_serial=device_serial,
-            raw_line=line
+            device_serial=device_serial
         )
 
 
+# Patterns whose first group is the app package, tried in order, each with a
+# literal the message must contain. The "(pid" pattern backtracks from every
+# word, so skipping it on messages without the literal saves most of the cost.
+_APP_PACKAGE_PATTERNS = (
+    ("Process: ", re.compile(r"Process: ([a-zA-Z0-9._]+)")),
+    ("Package: ", re.compile(r"Package: ([a-zA-Z0-9._]+)")),
+    ("(pid ", re.compile(r"([a-zA-Z0-9._]+)\s+\(pid \d+\)")),
+)
+
+# Marks an app package that has not been extracted yet (None is a valid result)
+_UNSET = object()
+
+# Matches lines that start (or belong to) a Java stack trace; one C-level
+# scan instead of a substring test per indicator
+_is_stack_trace_start = re.compile(r"at |Caused by:|Exception|Error").search
+
+
 class CrashDetector:
     """Detects crashes and errors from parsed log entries."""
     
+    # Recent log entries kept for crash context
+    LOG_BUFFER_SIZE = 1000
+    
     def __init__(self):
         self.patterns = CrashPatterns.get_all_patterns()
         self.compiled_patterns = {}
@@ -287,51 +390,85 @@ class CrashDetector:
         
         # Track ongoing crash sequences
         self.active_crashes: Dict[str, CrashEvent] = {}
-        self.log_buffer: List[LogEntry] = []
-        self.buffer_size = 1000
+        self.log_buffer: Deque[LogEntry] = deque(maxlen=self.LOG_BUFFER_SIZE)
         
+    @property
+    def buffer_size(self) -> int:
+        """Capacity of the log buffer, fixed when the detector is created."""
+        return self.log_buffer.maxlen
+    
     def _compile_patterns(self):
         """Compile regex patterns for better performance."""
         for crash_type, patterns in self.patterns.items():
             self.compiled_patterns[crash_type] = [
                 re.compile(pattern, re.IGNORECASE) for pattern in patterns
             ]
+        
+        # (crash type, trigger substrings or None, patterns) in type order,
+        # so detection never hashes an Enum per line
+        self.triggered_patterns = [
+            (crash_type, CrashPatterns.TRIGGERS.get(crash_type), compiled_patterns)
+            for crash_type, compiled_patterns in self.compiled_patterns.items()
+        ]
     
     def detect_crashes(self, log_entry: LogEntry) -> List[CrashEvent]:
         """Detect crashes from a log entry."""
         # Add to buffer for context
         self.log_buffer.append(log_entry)
-        if len(self.log_buffer) > self.buffer_size:
-            self.log_buffer.pop(0)
         
         crashes = []
         
-        # Check each pattern type
-        for crash_type, compiled_patterns in self.compiled_patterns.items():
+        # Check each pattern type, skipping types none of whose trigger
+        # substrings occur (most lines contain no crash keywords at all)
+        folded = log_entry.message.casefold()
+        app_package = _UNSET
+        for crash_type, triggers, compiled_patterns in self.triggered_patterns:
+            if triggers is not None and not any(trigger in folded for trigger in triggers):
+                continue
             for pattern in compiled_patterns:
                 if pattern.search(log_entry.message):
+                    # Crashes of several types on one line share one package lookup
+                    if app_package is _UNSET:
+                        app_package = self._extract_app_package(log_entry)
                     crash = self._create_crash_event(
-                        log_entry, crash_type, pattern.pattern
+                        log_entry, crash_type, pattern.pattern, app_package
                     )
                     crashes.append(crash)
                     break  # Don't duplicate crashes of the same type
         
         return crashes
     
+    def detect_crashes_batch(self, log_entries: List[LogEntry]) -> List[CrashEvent]:
+        """Detect crashes from a batch of log entries, in order.
+        
+        Equivalent to calling detect_crashes() on each entry, but with the
+        method lookup hoisted out of the loop. Useful when replaying saved
+        logs or draining a burst of buffered logcat lines.
+        """
+        detect = self.detect_crashes
+        crashes = []
+        for log_entry in log_entries:
+            crashes.extend(detect(log_entry))
+        return crashes
+    
     def _create_crash_event(self, log_entry: LogEntry, crash_type: CrashType, 
-                           pattern: str) -> CrashEvent:
-        """Create a crash event from a detected log entry."""
+                           pattern: str, app_package: Optional[str] = _UNSET) -> CrashEvent:
+        """Create a crash event from a detected log entry.
+        
+        ``app_package`` may be passed when already extracted from this entry.
+        """
         session_id = f"{int(time.time())}_{log_entry.device_serial}"
         
         # Extract app information
-        app_package = self._extract_app_package(log_entry)
-        app_name = self._extract_app_name(log_entry)
+        if app_package is _UNSET:
+            app_package = self._extract_app_package(log_entry)
+        app_name = self._extract_app_name(log_entry, app_package)
         
         # Determine severity based on crash type and log level
         severity = self._calculate_severity(crash_type, log_entry.level)
         
         # Generate title and description
-        title = self._generate_crash_title(crash_type, log_entry)
+        title = self._generate_crash_title(crash_type, log_entry, app_package)
         description = self._generate_crash_description(crash_type, log_entry)
         
         # Collect related logs (context around the crash)
@@ -360,24 +497,20 @@ class CrashDetector:
     def _extract_app_package(self, log_entry: LogEntry) -> Optional[str]:
         """Extract app package name from log entry."""
         # Try to extract from common patterns
-        patterns = [
-            r"Process: ([a-zA-Z0-9._]+)",
-            r"Package: ([a-zA-Z0-9._]+)",
-            r"([a-zA-Z0-9._]+)\s+\(pid \d+\)"
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, log_entry.message)
-            if match:
-                return match.group(1)
+        message = log_entry.message
+        for literal, pattern in _APP_PACKAGE_PATTERNS:
+            if literal in message:
+                match = pattern.search(message)
+                if match:
+                    return match.group(1)
         
         return None
     
-    def _extract_app_name(self, log_entry: LogEntry) -> Optional[str]:
-        """Extract app name from log entry."""
+    def _extract_app_name(self, log_entry: LogEntry,
+                          app_package: Optional[str]) -> Optional[str]:
+        """Extract app name from log entry, given its extracted package."""
         # This would typically require additional system calls
         # For now, return the tag or package name
-        app_package = self._extract_app_package(log_entry)
         if app_package:
             return app_package.split('.')[-1]  # Use last part of package name
         return log_entry.tag
@@ -408,22 +541,10 @@ class CrashDetector:
         
         return max(1, min(10, base_severity + level_modifier))
     
-    def _generate_crash_title(self, crash_type: CrashType, log_entry: LogEntry) -> str:
-        """Generate a human-readable title for the crash."""
-        titles = {
-            CrashType.ANR: "Application Not Responding",
-            CrashType.CRASH: "Application Crash", 
-            CrashType.NATIVE_CRASH: "Native Code Crash",
-            CrashType.RUNTIME_ERROR: "Runtime Exception",
-            CrashType.OUT_OF_MEMORY: "Out of Memory Error",
-            CrashType.PERMISSION_ERROR: "Permission Denied",
-            CrashType.NETWORK_ERROR: "Network Connection Error",
-            CrashType.DATABASE_ERROR: "Database Error",
-            CrashType.UNKNOWN: "Unknown Error"
-        }
-        
-        base_title = titles.get(crash_type, "Error")
-        app_package = self._extract_app_package(log_entry)
+    def _generate_crash_title(self, crash_type: CrashType, log_entry: LogEntry,
+                              app_package: Optional[str]) -> str:
+        """Generate a human-readable title for the crash, given its extracted package."""
+        base_title = crash_type.crash_title
         
         if app_package:
             return f"{base_title} in {app_package}"
@@ -436,6 +557,12 @@ class CrashDetector:
     
     def _get_related_logs(self, crash_log: LogEntry, context_lines: int = 10) -> List[LogEntry]:
         """Get related log entries around a crash for context."""
+        # During live detection the crash log was just appended to the buffer
+        if self.log_buffer and self.log_buffer[-1] is crash_log:
+            related_logs = list(islice(reversed(self.log_buffer), context_lines + 1))
+            related_logs.reverse()
+            return related_logs
+        
         # Find the crash log in buffer
         crash_index = -1
         for i, log in enumerate(reversed(self.log_buffer)):
@@ -451,7 +578,7 @@ class CrashDetector:
         start_index = max(0, crash_index - context_lines)
         end_index = min(len(self.log_buffer), crash_index + context_lines + 1)
         
-        return self.log_buffer[start_index:end_index]
+        return list(islice(self.log_buffer, start_index, end_index))
     
     def _extract_stack_trace(self, related_logs: List[LogEntry]) -> List[str]:
         """Extract stack trace from related logs."""
@@ -460,8 +587,7 @@ class CrashDetector:
         
         for log in related_logs:
             # Look for stack trace indicators
-            if any(indicator in log.message for indicator in 
-                   ["at ", "Caused by:", "Exception", "Error"]):
+            if _is_stack_trace_start(log.message):
                 in_stack_trace = True
                 stack_trace.append(log.message)
             elif in_stack_trace and log.message.strip().startswith("at "):
@@ -479,6 +605,15 @@ class CrashDetector:
 class AndroidCrashMonitor:
     """Main monitoring engine for Android crash detection."""
     
+    # Crashes waiting to be written before _handle_crash blocks
+    SAVE_QUEUE_SIZE = 1024
+    # Most crash files written per worker-thread hop
+    SAVE_BATCH_SIZE = 64
+    # Bytes requested from logcat stdout per read
+    READ_CHUNK_SIZE = 65536
+    # Parsed lines counted locally before being added to stats
+    STATS_FLUSH_LINES = 256
+    
     def __init__(self, config: MonitoringConfig, console: ConsoleUI):
         self.config = config
         self.console = console
@@ -487,7 +622,9 @@ class AndroidCrashMonitor:
         
         # Use enhanced crash detector if available
         if ENHANCED_DETECTION_AVAILABLE:
-            self.crash_detector = EnhancedCrashDetector(console, Path(config.output_dir))
+            self.crash_detector = EnhancedCrashDetector(
+                console, Path(config.output_dir), async_alerts=True
+            )
             self.console.info("🚀 Enhanced System.err monitoring enabled")
         else:
             self.crash_detector = CrashDetector()
@@ -497,6 +634,7 @@ class AndroidCrashMonitor:
         self.is_running = False
         self.session_id = f"session_{int(time.time())}"
         self.start_time = None
+        self._start_monotonic = 0.0  # Uptime clock, immune to wall-clock changes
         self.monitored_devices: List[AndroidDevice] = []
         self.active_processes: Dict[str, asyncio.subprocess.Process] = {}
         
@@ -532,6 +670,11 @@ class AndroidCrashMonitor:
         # Graceful shutdown (will be initialized when monitoring starts)
         self.shutdown_event = None
         
+        # Background crash file writer (started with monitoring); crashes
+        # are saved synchronously when it is not running
+        self._save_queue: Optional[asyncio.Queue] = None
+        self._saver_task: Optional[asyncio.Task] = None
+        
     def add_crash_handler(self, handler: Callable[[CrashEvent], None]):
         """Add a crash event handler."""
         self.crash_handlers.append(handler)
@@ -542,10 +685,12 @@ class AndroidCrashMonitor:
             raise RuntimeError("Monitor is already running")
         
         self.start_time = datetime.now()
+        self._start_monotonic = time.monotonic()
         self.stats.start_time = self.start_time.isoformat()
         
         # Initialize async components now that we have an event loop
         self.shutdown_event = asyncio.Event()
+        self._start_crash_saver()
         
         try:
             # Discover devices to monitor
@@ -646,6 +791,8 @@ class AndroidCrashMonitor:
         
         retry_count = 0
         max_retries = 5
+        processed = 0
+        flush_lines = self.STATS_FLUSH_LINES
         
         while self.is_running and retry_count < max_retries:
             try:
@@ -669,8 +816,11 @@ class AndroidCrashMonitor:
                     if not log_entry:
                         continue
                     
-                    # Update statistics
-                    self.stats.total_logs_processed += 1
+                    # Update statistics (counted locally, flushed in batches)
+                    processed += 1
+                    if processed >= flush_lines:
+                        self.stats.total_logs_processed += processed
+                        processed = 0
                     
                     # Detect crashes
                     crashes = self.crash_detector.detect_crashes(log_entry)
@@ -695,6 +845,9 @@ class AndroidCrashMonitor:
                 await asyncio.sleep(2 ** retry_count)  # Exponential backoff
             
             finally:
+                self.stats.total_logs_processed += processed
+                processed = 0
+                
                 # Clean up process
                 if device.serial in self.active_processes:
                     process = self.active_processes[device.serial]
@@ -750,20 +903,35 @@ class AndroidCrashMonitor:
             logger.error(f"Post-monitoring analysis failed: {e}")
     
     async def _read_logcat_stream(self, process: asyncio.subprocess.Process) -> AsyncGenerator[str, None]:
-        """Read lines from logcat process stream."""
+        """Read lines from logcat process stream.
+        
+        Stdout is read in large chunks and split on newlines, so a busy
+        device costs one read and one decode per chunk rather than per line.
+        A trailing partial line is carried over to the next chunk.
+        """
+        pending = b""
         while True:
             try:
-                line = await asyncio.wait_for(
-                    process.stdout.readline(), 
+                chunk = await asyncio.wait_for(
+                    process.stdout.read(self.READ_CHUNK_SIZE), 
                     timeout=1.0
                 )
                 
-                if not line:  # EOF
+                if not chunk:  # EOF
+                    if pending:
+                        yield pending.decode('utf-8', errors='replace').strip()
                     break
                 
-                # Line is already bytes, decode it
-                decoded_line = line.decode('utf-8', errors='replace').strip() if isinstance(line, bytes) else line.strip()
-                yield decoded_line
+                # Only decode up to the last newline; the rest may be a partial line
+                end = chunk.rfind(b"\n")
+                if end < 0:
+                    pending += chunk
+                    continue
+                data = pending + chunk[:end]
+                pending = chunk[end + 1:]
+                
+                for line in data.decode('utf-8', errors='replace').split('\n'):
+                    yield line.strip()
                 
             except asyncio.TimeoutError:
                 # Check if process is still running
@@ -836,29 +1004,75 @@ class AndroidCrashMonitor:
         )
     
     async def _save_crash(self, crash: CrashEvent) -> None:
-        """Save crash data to file."""
-        try:
-            # Create filename with timestamp including milliseconds to prevent collisions
-            now = datetime.now()
-            timestamp = now.strftime("%Y%m%d_%H%M%S")
-            milliseconds = now.microsecond // 1000
-            filename = f"crash_{timestamp}_{milliseconds:03d}_{crash.crash_type.value}_{crash.device_serial}.json"
-            filepath = self.output_dir / filename
-            
-            # Ensure output directory exists
-            self.output_dir.mkdir(parents=True, exist_ok=True)
-            
-            # Save crash data
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(crash.to_dict(), f, indent=2, default=str)
-            
-            # Log successful save for debugging
-            logger.debug(f"Crash saved: {filepath}")
+        """Save crash data to file, via the background writer when it is running."""
+        # Create filename with timestamp including milliseconds to prevent collisions
+        now = datetime.now()
+        timestamp = now.strftime("%Y%m%d_%H%M%S")
+        milliseconds = now.microsecond // 1000
+        filename = f"crash_{timestamp}_{milliseconds:03d}_{crash.crash_type.value}_{crash.device_serial}.json"
+        filepath = self.output_dir / filename
+        
+        if self._saver_task is None or self._saver_task.done():
+            self._write_crashes([(filepath, crash)])
+        else:
+            await self._save_queue.put((filepath, crash))
+    
+    async def _crash_saver(self) -> None:
+        """Write queued crashes in batches off the event loop until a None sentinel."""
+        queue = self._save_queue
+        stopping = False
+        while not stopping:
+            item = await queue.get()
+            batch = []
+            while True:
+                if item is None:
+                    stopping = True
+                else:
+                    batch.append(item)
+                if stopping or len(batch) >= self.SAVE_BATCH_SIZE or queue.empty():
+                    break
+                item = queue.get_nowait()
             
-        except Exception as e:
-            logger.error(f"Failed to save crash to {filepath}: {type(e).__name__}: {e}")
-            logger.error(f"Output directory exists: {self.output_dir.exists()}")
-            logger.error(f"Output directory writable: {os.access(self.output_dir, os.W_OK)}")
+            if batch:
+                await asyncio.to_thread(self._write_crashes, batch)
+    
+    def _start_crash_saver(self) -> None:
+        """Start the background crash file writer on the running event loop."""
+        self._save_queue = asyncio.Queue(maxsize=self.SAVE_QUEUE_SIZE)
+        self._saver_task = asyncio.create_task(self._crash_saver())
+    
+    async def _stop_crash_saver(self) -> None:
+        """Flush queued crashes and stop the background writer."""
+        if self._saver_task is None:
+            return
+        if not self._saver_task.done():
+            await self._save_queue.put(None)
+            await self._saver_task
+        self._saver_task = None
+    
+    def _write_crashes(self, batch: List[Tuple[Path, CrashEvent]]) -> None:
+        """Write (filepath, crash) pairs, one JSON file per crash."""
+        for filepath, crash in batch:
+            try:
+                data = dumps_json(crash.to_dict())
+                try:
+                    f = open(filepath, 'wb')
+                except FileNotFoundError:
+                    # Created in __init__; only recreate it if it was removed since
+                    self.output_dir.mkdir(parents=True, exist_ok=True)
+                    f = open(filepath, 'wb')
+                
+                # Save crash data
+                with f:
+                    f.write(data)
+                
+                # Log successful save for debugging
+                logger.debug(f"Crash saved: {filepath}")
+                
+            except Exception as e:
+                logger.error(f"Failed to save crash to {filepath}: {type(e).__name__}: {e}")
+                logger.error(f"Output directory exists: {self.output_dir.exists()}")
+                logger.error(f"Output directory writable: {os.access(self.output_dir, os.W_OK)}")
     
     async def _show_periodic_reminders(self) -> None:
         """Show periodic reminders to press Ctrl+C, especially when events are flowing rapidly."""
@@ -905,18 +1119,21 @@ class AndroidCrashMonitor:
                 await asyncio.sleep(10)  # Update every 10 seconds
                 
                 if self.start_time:
-                    self.stats.uptime_seconds = (datetime.now() - self.start_time).total_seconds()
-                    
-                    if self.stats.uptime_seconds > 0:
-                        self.stats.logs_per_second = (
-                            self.stats.total_logs_processed / self.stats.uptime_seconds
-                        )
+                    self._update_rate_stats()
                 
                 # Could add memory/CPU monitoring here with psutil
                 
             except Exception as e:
                 logger.warning(f"Stats update failed: {e}")
     
+    def _update_rate_stats(self) -> None:
+        """Refresh uptime and average log rate from the monotonic clock."""
+        self.stats.uptime_seconds = time.monotonic() - self._start_monotonic
+        if self.stats.uptime_seconds > 0:
+            self.stats.logs_per_second = (
+                self.stats.total_logs_processed / self.stats.uptime_seconds
+            )
+    
     def _setup_signal_handlers(self) -> None:
         """Setup signal handlers for graceful shutdown."""
         def signal_handler(signum, frame):
@@ -944,31 +1161,54 @@ class AndroidCrashMonitor:
         
         self.active_processes.clear()
         
+        # Write out crashes still queued for saving
+        await self._stop_crash_saver()
+        
+        # Let the enhanced detector finish rendering queued alerts (off the
+        # loop: close() can wait on the render thread)
+        if ENHANCED_DETECTION_AVAILABLE:
+            await asyncio.to_thread(self.crash_detector.close)
+        
         # Finalize statistics
         if self.start_time:
             self.stats.end_time = datetime.now().isoformat()
-            self.stats.uptime_seconds = (datetime.now() - self.start_time).total_seconds()
+            self._update_rate_stats()
         
-        # Save session statistics
-        await self._save_session_stats()
+        # Save session statistics while the final summary is displayed: one
+        # yield lets the task encode the stats and hand the write to a thread
+        save_stats = asyncio.ensure_future(self._save_session_stats())
+        await asyncio.sleep(0)
         
-        self.console.success("Monitoring stopped")
-        self._display_final_stats()
+        try:
+            self.console.success("Monitoring stopped")
+            self._display_final_stats()
+        finally:
+            await save_stats
     
     async def _save_session_stats(self) -> None:
-        """Save session statistics to file."""
+        """Save session statistics to file.
+        
+        The stats are encoded on the event loop, so the snapshot is taken
+        now, and the file is written from a worker thread.
+        """
         try:
             stats_filename = f"session_stats_{self.session_id}.json"
             stats_filepath = self.output_dir / stats_filename
             
-            with open(stats_filepath, 'w', encoding='utf-8') as f:
-                json.dump(asdict(self.stats), f, indent=2, default=str)
+            data = dumps_json(self.stats)
+            await asyncio.to_thread(self._write_file, stats_filepath, data)
             
             logger.info(f"Session stats saved to {stats_filepath}")
             
         except Exception as e:
             logger.error(f"Failed to save session stats: {e}")
     
+    @staticmethod
+    def _write_file(filepath: Path, data: bytes) -> None:
+        """Write bytes to a file (run off the event loop)."""
+        with open(filepath, 'wb') as f:
+            f.write(data)
+    
     def _display_final_stats(self) -> None:
         """Display final monitoring statistics."""
         self.console.header("Monitoring Session Summary")
@@ -992,12 +1232,10 @@ class AndroidCrashMonitor:
             
             if self.stats.crashes_by_app:
                 self.console.info("Top crashing apps:")
-                sorted_apps = sorted(
-                    self.stats.crashes_by_app.items(), 
-                    key=lambda x: x[1], 
-                    reverse=True
+                top_apps = heapq.nlargest(
+                    5, self.stats.crashes_by_app.items(), key=itemgetter(1)
                 )
-                for app, count in sorted_apps[:5]:  # Top 5
+                for app, count in top_apps:
                     self.console.info(f"  {app}: {count}")
             
             # Show enhanced statistics if available
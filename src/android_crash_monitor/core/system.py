@@ -11,15 +11,69 @@ Provides intelligent system detection capabilities including:
 
 import os
 import platform
+import re
 import shutil
 import subprocess
 import sys
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Optional
 
 from .config import SystemInfo
 
 
+# ctypes is only needed for the Windows admin check
+_IS_WINDOWS = sys.platform == 'win32'
+if _IS_WINDOWS:
+    import ctypes
+
+
+# Quoted version in the first line of `java -version` output
+_JAVA_VERSION_PATTERN = re.compile(r'"([^"]*)"')
+
+# Linux distribution info; the VERSION= value (up to any further '=') is
+# found with one regex scan over the whole file
+_OS_RELEASE_PATH = '/etc/os-release'
+_OS_RELEASE_VERSION_PATTERN = re.compile(r'^VERSION=([^=\n]*)', re.MULTILINE)
+
+# Package manager commands probed per OS, in reporting order
+_PACKAGE_MANAGER_CANDIDATES = {
+    'macOS': ('brew', 'port'),  # Homebrew, MacPorts
+    # APT, DNF, YUM, Pacman, Zypper, Portage, Alpine Package Keeper
+    'Linux': ('apt', 'dnf', 'yum', 'pacman', 'zypper', 'emerge', 'apk'),
+    'Windows': ('choco', 'winget', 'scoop'),  # Chocolatey, Windows Package Manager, Scoop
+}
+
+# Common Android SDK install locations per OS; "~" is expanded at lookup time
+_ANDROID_SDK_CANDIDATES = {
+    'macOS': (
+        '~/Library/Android/sdk',
+        '/usr/local/share/android-sdk',
+        '/opt/homebrew/share/android-sdk',
+    ),
+    'Linux': (
+        '~/Android/Sdk',
+        '/usr/lib/android-sdk',
+        '/opt/android-sdk',
+    ),
+    'Windows': (
+        '~/AppData/Local/Android/Sdk',
+        'C:/Android/Sdk',
+    ),
+}
+
+
+@lru_cache(maxsize=1)
+def _is_admin() -> bool:
+    """Whether the process has administrator privileges, checked once per process."""
+    try:
+        if _IS_WINDOWS:
+            return ctypes.windll.shell32.IsUserAnAdmin() != 0
+        return os.getuid() == 0
+    except (AttributeError, OSError):
+        return False
+
+
 class SystemDetector:
     """Detects system information and capabilities."""
     
@@ -28,18 +82,21 @@ class SystemDetector:
     
     def detect_all(self) -> SystemInfo:
         """Detect all system information at once."""
-        return SystemInfo(
-            os=self.get_os_name(),
-            version=self.get_os_version(),
-            arch=self.get_architecture(),
-            python_version=self.get_python_version(),
-            package_managers=self.detect_package_managers(),
-            download_tools=self.get_download_tools(),
-            has_android_sdk=self.get_android_home() is not None,
-            has_java=self.get_java_version() is not None,
-            java_version=self.get_java_version(),
-            is_admin=self.is_admin()
-        )
+        if 'system_info' not in self._cache:
+            java_version = self.get_java_version()
+            self._cache['system_info'] = SystemInfo(
+                os=self.get_os_name(),
+                version=self.get_os_version(),
+                arch=self.get_architecture(),
+                python_version=self.get_python_version(),
+                package_managers=self.detect_package_managers(),
+                download_tools=self.get_download_tools(),
+                has_android_sdk=self.get_android_home() is not None,
+                has_java=java_version is not None,
+                java_version=java_version,
+                is_admin=self.is_admin()
+            )
+        return self._cache['system_info']
     
     async def get_system_info(self) -> SystemInfo:
         """Get system information (async version for compatibility)."""
@@ -84,14 +141,11 @@ class SystemDetector:
                 elif system == 'Linux':
                     # Linux distribution version
                     try:
-                        with open('/etc/os-release', 'r') as version_file:
-                            version = None
-                            for line in version_file:
-                                if line.startswith('VERSION='):
-                                    version = line.split('=')[1].strip().strip('"')
-                                    break
-                            if not version:
-                                version = platform.release()
+                        with open(_OS_RELEASE_PATH, 'r') as version_file:
+                            match = _OS_RELEASE_VERSION_PATTERN.search(version_file.read())
+                        version = match.group(1).strip().strip('"') if match else None
+                        if not version:
+                            version = platform.release()
                     except FileNotFoundError:
                         version = platform.release()
                 elif system == 'Windows':
@@ -124,46 +178,15 @@ class SystemDetector:
     def detect_package_managers(self) -> List[str]:
         """Detect available package managers."""
         if 'package_managers' not in self._cache:
-            managers = []
-            
-            # Define package managers by platform
-            candidates = {
-                'macOS': [
-                    ('brew', 'Homebrew'),
-                    ('port', 'MacPorts'),
-                ],
-                'Linux': [
-                    ('apt', 'APT'),
-                    ('dnf', 'DNF'),
-                    ('yum', 'YUM'),
-                    ('pacman', 'Pacman'),
-                    ('zypper', 'Zypper'),
-                    ('emerge', 'Portage'),
-                    ('apk', 'Alpine Package Keeper'),
-                ],
-                'Windows': [
-                    ('choco', 'Chocolatey'),
-                    ('winget', 'Windows Package Manager'),
-                    ('scoop', 'Scoop'),
-                ]
-            }
-            
-            os_name = self.get_os_name()
-            if os_name in candidates:
-                for cmd, name in candidates[os_name]:
-                    if self._command_exists(cmd):
-                        managers.append(cmd)
-            
+            candidates = _PACKAGE_MANAGER_CANDIDATES.get(self.get_os_name(), ())
+            managers = [cmd for cmd in candidates if self._command_exists(cmd)]
             self._cache['package_managers'] = managers
         return self._cache['package_managers']
     
     def has_download_tools(self) -> bool:
         """Check if download tools (curl, wget) are available."""
-        if 'has_download_tools' not in self._cache:
-            has_curl = self._command_exists('curl')
-            has_wget = self._command_exists('wget')
-            self._cache['has_download_tools'] = has_curl or has_wget
-        return self._cache['has_download_tools']
+        # Reuses the curl/wget probes made for get_download_tools()
+        return bool(self.get_download_tools())
     
     def get_shell(self) -> str:
         """Get the current shell."""
@@ -191,20 +214,16 @@ class SystemDetector:
     
     def is_admin(self) -> bool:
         """Check if running with administrator privileges."""
-        if 'is_admin' not in self._cache:
-            try:
-                if self.get_os_name() == 'Windows':
-                    import ctypes
-                    self._cache['is_admin'] = ctypes.windll.shell32.IsUserAnAdmin() != 0
-                else:
-                    self._cache['is_admin'] = os.getuid() == 0
-            except (ImportError, AttributeError, OSError):
-                self._cache['is_admin'] = False
-        return self._cache['is_admin']
+        # Shared across detectors: privileges don't change within a process
+        return _is_admin()
     
     def get_java_version(self) -> Optional[str]:
         """Get Java version if available."""
         if 'java_version' not in self._cache:
+            # Skip spawning (and possibly timing out on) java when it isn't on PATH
+            if not self._command_exists('java'):
+                self._cache['java_version'] = None
+                return None
             try:
                 result = subprocess.run(['java', '-version'], 
                                       capture_output=True, text=True, timeout=5)
@@ -212,8 +231,7 @@ class SystemDetector:
                     # Parse version from stderr (Java outputs version to stderr)
                     version_line = result.stderr.split('\n')[0]
                     # Extract version number using regex
-                    import re
-                    match = re.search(r'"([^"]*)"', version_line)
+                    match = _JAVA_VERSION_PATTERN.search(version_line)
                     if match:
                         self._cache['java_version'] = match.group(1)
                     else:
@@ -230,36 +248,19 @@ class SystemDetector:
             android_home = None
             
             # Check environment variables
-            for env_var in ['ANDROID_HOME', 'ANDROID_SDK_ROOT']:
+            for env_var in ('ANDROID_HOME', 'ANDROID_SDK_ROOT'):
                 path = os.environ.get(env_var)
-                if path and Path(path).is_dir():
+                if path and os.path.isdir(path):
                     android_home = Path(path)
                     break
             
-            # Check common installation locations
+            # Check common installation locations; platform-tools existing
+            # implies the SDK directory does, so one stat per candidate
             if not android_home:
-                common_paths = []
-                if self.get_os_name() == 'macOS':
-                    common_paths = [
-                        Path.home() / 'Library/Android/sdk',
-                        Path('/usr/local/share/android-sdk'),
-                        Path('/opt/homebrew/share/android-sdk'),
-                    ]
-                elif self.get_os_name() == 'Linux':
-                    common_paths = [
-                        Path.home() / 'Android/Sdk',
-                        Path('/usr/lib/android-sdk'),
-                        Path('/opt/android-sdk'),
-                    ]
-                elif self.get_os_name() == 'Windows':
-                    common_paths = [
-                        Path.home() / 'AppData/Local/Android/Sdk',
-                        Path('C:/Android/Sdk'),
-                    ]
-                
-                for path in common_paths:
-                    if path.is_dir() and (path / 'platform-tools').is_dir():
-                        android_home = path
+                for candidate in _ANDROID_SDK_CANDIDATES.get(self.get_os_name(), ()):
+                    path = os.path.expanduser(candidate)
+                    if os.path.isdir(os.path.join(path, 'platform-tools')):
+                        android_home = Path(path)
                         break
             
             self._cache['android_home'] = android_home
@@ -268,17 +269,18 @@ class SystemDetector:
     def get_system_info_dict(self) -> dict:
         """Get all system information as a dictionary."""
         info = self.detect_all()
+        android_home = self.get_android_home()
         result = {
-            'os_name': info.os_name,
-            'architecture': info.architecture,
+            'os_name': info.os,
+            'architecture': info.arch,
             'python_version': info.python_version,
             'package_managers': info.package_managers,
-            'has_download_tools': info.has_download_tools,
+            'has_download_tools': bool(info.download_tools),
             'shell': self.get_shell(),
             'terminal': self.get_terminal(),
-            'is_admin': self.is_admin(),
-            'java_version': self.get_java_version(),
-            'android_home': str(self.get_android_home()) if self.get_android_home() else None,
+            'is_admin': info.is_admin,
+            'java_version': info.java_version,
+            'android_home': str(android_home) if android_home else None,
         }
         return result
     
@@ -291,20 +293,22 @@ class SystemDetector:
         self._cache.clear()
 
 
+# Shared by the convenience functions so repeated calls reuse one cache
+# instead of re-probing PATH, java and /etc/os-release each time
+_DETECTOR = SystemDetector()
+
+
 # Convenience functions
 def detect_system() -> SystemInfo:
     """Convenience function to detect system information."""
-    detector = SystemDetector()
-    return detector.detect_all()
+    return _DETECTOR.detect_all()
 
 
 def get_os_name() -> str:
     """Get the operating system name."""
-    detector = SystemDetector()
-    return detector.get_os_name()
+    return _DETECTOR.get_os_name()
 
 
 def get_package_managers() -> List[str]:
     """Get available package managers."""
-    detector = SystemDetector()
-    return detector.detect_package_managers()
\ No newline at end of file
+    return _DETECTOR.detect_package_managers()
@@ -6,14 +6,16 @@ Provides various export formats for crash reports, session data, and logs.
 Supports JSON, CSV, HTML, and text/markdown formats with rich formatting.
 """
 
+from types import MappingProxyType
+
 from .base import BaseExporter, ExportError, ExportData, MultiFormatExporter
 from .json_exporter import JSONExporter, CompactJSONExporter, DetailedJSONExporter
 from .csv_exporter import CSVExporter, ExcelCSVExporter, DetailedCSVExporter, LogsCSVExporter
 from .html_exporter import HTMLExporter
 from .text_exporter import TextExporter, MarkdownExporter
 
-# Export format registry
-EXPORTERS = {
+# Export format registry (read-only, so the sorted names below stay in sync)
+EXPORTERS = MappingProxyType({
     'json': JSONExporter,
     'csv': CSVExporter, 
     'html': HTMLExporter,
@@ -27,20 +29,22 @@ EXPORTERS = {
     'excel-csv': ExcelCSVExporter,
     'detailed-csv': DetailedCSVExporter,
     'logs-csv': LogsCSVExporter,
-}
+})
+
+_FORMAT_NAMES = tuple(sorted(EXPORTERS))
 
 def get_exporter(format_name: str) -> BaseExporter:
     """Get an exporter instance for the specified format."""
     format_name = format_name.lower()
     if format_name not in EXPORTERS:
-        available = ', '.join(sorted(EXPORTERS.keys()))
+        available = ', '.join(_FORMAT_NAMES)
         raise ExportError(f"Unsupported export format: {format_name}. Available formats: {available}")
     
     return EXPORTERS[format_name]()
 
 def get_available_formats() -> list[str]:
     """Get list of available export formats."""
-    return sorted(EXPORTERS.keys())
+    return list(_FORMAT_NAMES)
 
 def export_crashes(crashes, output_path, format_name='json', **kwargs):
     """Convenience function to export crash data."""
@@ -6,6 +6,7 @@ Provides the base interface and common functionality for all export formats.
 """
 
 from abc import ABC, abstractmethod
+from dataclasses import fields
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Any, Optional, Union
@@ -86,8 +87,9 @@ class BaseExporter(ABC):
         if not stats:
             return {}
         
-        from dataclasses import asdict
-        return asdict(stats)
+        # Shallow: the result is only serialized, so the per-app and per-type
+        # counters don't need asdict()'s recursive copy
+        return {field.name: getattr(stats, field.name) for field in fields(stats)}
     
     def _prepare_logs_data(self, logs: List[LogEntry]) -> List[Dict[str, Any]]:
         """Convert log entries to exportable format."""
@@ -95,7 +95,7 @@ class CSVExporter(BaseExporter):
         """Write statistics as CSV sections."""
         writer = csv.writer(file_handle, delimiter=delimiter, quoting=csv.QUOTE_MINIMAL)
         
-        stats_dict = stats if isinstance(stats, dict) else stats.__dict__
+        stats_dict = stats if isinstance(stats, dict) else self._prepare_stats_data(stats)
         
         # Session summary
         writer.writerow(['SESSION STATISTICS'])
@@ -207,7 +207,7 @@ class HTMLExporter(BaseExporter):
     
     def _html_statistics_section(self, stats: Any) -> str:
         """Generate statistics section."""
-        stats_dict = stats if isinstance(stats, dict) else stats.__dict__
+        stats_dict = stats if isinstance(stats, dict) else self._prepare_stats_data(stats)
         
         return f"""
         <section class="statistics">
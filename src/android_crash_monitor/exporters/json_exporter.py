@@ -6,7 +6,9 @@ Exports crash reports and monitoring data to JSON format with proper structure
 and formatting for both human readability and machine processing.
 """
 
+import heapq
 import json
+from operator import itemgetter
 from pathlib import Path
 from typing import Dict, Any
 
@@ -37,11 +39,11 @@ class JSONExporter(BaseExporter):
         json_data = self._build_json_structure(data, include_metadata, include_raw_logs)
         
         try:
+            # Encode first so the document is written in one call, not per token
+            indent = 2 if pretty_print else None
+            payload = json.dumps(json_data, indent=indent, ensure_ascii=False, default=str)
             with open(output_path, 'w', encoding='utf-8') as f:
-                if pretty_print:
-                    json.dump(json_data, f, indent=2, ensure_ascii=False, default=str)
-                else:
-                    json.dump(json_data, f, ensure_ascii=False, default=str)
+                f.write(payload)
                     
         except Exception as e:
             raise ExportError(f"Failed to write JSON file: {e}")
@@ -129,7 +131,7 @@ class JSONExporter(BaseExporter):
             "total_crashes": len(data.crashes),
             "crash_types": dict(sorted(crash_types.items(), key=lambda x: x[1], reverse=True)),
             "severity_distribution": severity_dist,
-            "apps_affected": dict(sorted(apps_affected.items(), key=lambda x: x[1], reverse=True)[:10]),  # Top 10
+            "apps_affected": dict(heapq.nlargest(10, apps_affected.items(), key=itemgetter(1))),  # Top 10
             "devices_affected": devices_affected,
             "time_range": time_range
         }
@@ -6,6 +6,8 @@ Exports crash reports and monitoring data to plain text or Markdown format
 for simple viewing and documentation.
 """
 
+import heapq
+from operator import itemgetter
 from pathlib import Path
 from typing import Dict, Any, List
 
@@ -219,7 +221,7 @@ class TextExporter(BaseExporter):
         else:
             lines = ["-" * 40, "SESSION STATISTICS", "-" * 40]
         
-        stats_dict = stats if isinstance(stats, dict) else stats.__dict__
+        stats_dict = stats if isinstance(stats, dict) else self._prepare_stats_data(stats)
         
         # Basic stats
         duration = self._format_duration(stats_dict.get('uptime_seconds', 0))
@@ -257,9 +259,8 @@ class TextExporter(BaseExporter):
             else:
                 lines.append("Top Crashing Applications:")
             
-            # Sort and limit to top 5
-            sorted_apps = sorted(crashes_by_app.items(), key=lambda x: x[1], reverse=True)
-            for app, count in sorted_apps[:5]:
+            # Top 5 without sorting every app
+            for app, count in heapq.nlargest(5, crashes_by_app.items(), key=itemgetter(1)):
                 lines.append(f"  {app}: {count}")
         
         return '\n'.join(lines)
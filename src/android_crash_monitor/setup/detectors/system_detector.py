@@ -35,7 +35,7 @@ class SystemDetectorUI:
         system_table.add_column("Component", style="cyan")
         system_table.add_column("Details", style="white")
         
-        system_table.add_row("Operating System", f"{system_info.os_name} ({system_info.architecture})")
+        system_table.add_row("Operating System", f"{system_info.os} ({system_info.arch})")
         system_table.add_row("Python Version", system_info.python_version)
         
         if system_info.package_managers:
@@ -45,11 +45,11 @@ class SystemDetectorUI:
             system_table.add_row("Package Managers", "[yellow]None detected[/yellow]")
             
         system_table.add_row("Download Tools", 
-                           "Available" if system_info.has_download_tools else "[red]Missing[/red]")
+                           "Available" if system_info.download_tools else "[red]Missing[/red]")
         
         self.console.print(system_table)
         self.console.success("System detection completed")
         
         # Store system info in config
-        self.config.system = system_info
+        self.config.set_system_info(system_info)
         return True
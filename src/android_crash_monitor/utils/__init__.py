@@ -4,7 +4,9 @@ from .time_utils import (
     parse_android_timestamp,
     format_duration,
     get_time_difference_seconds,
-    is_within_time_window
+    is_within_time_window,
+    cached_iso_now,
+    cached_logcat_now
 )
 
 from .crash_utils import (
@@ -19,12 +21,16 @@ from .crash_utils import (
     get_crash_summary
 )
 
+from .json_utils import dumps_json
+
 __all__ = [
     # Time utilities
     'parse_android_timestamp',
     'format_duration',
     'get_time_difference_seconds',
     'is_within_time_window',
+    'cached_iso_now',
+    'cached_logcat_now',
     # Crash utilities
     'extract_crash_text',
     'get_crash_severity',
@@ -35,4 +41,6 @@ __all__ = [
     'calculate_crash_frequency',
     'find_common_stack_frames',
     'get_crash_summary',
+    # JSON utilities
+    'dumps_json',
 ]
\ No newline at end of file
@@ -0,0 +1,12 @@
+#!/usr/bin/env python3
+"""
+Compatibility Helpers
+
+Shims for features that depend on the running Python version.
+"""
+
+import sys
+
+# Keyword arguments for ``@dataclass(**DATACLASS_SLOTS)``: generates
+# ``__slots__`` on Python 3.10+ and is a no-op on older interpreters.
+DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+JSON Utilities
+
+Fast JSON serialization for crash, alert and session files. Uses orjson
+when it is installed and falls back to the standard library otherwise.
+"""
+
+import dataclasses
+import json
+from enum import Enum
+from types import MappingProxyType
+from typing import Any
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+
+def _json_default(obj: Any) -> Any:
+    """Encoder for types neither backend serializes natively.
+    
+    Also mirrors what orjson handles itself (enums, dataclasses) for the
+    standard library path. Read-only mappings such as the shared pattern
+    tables are emitted as objects rather than their repr.
+    """
+    if isinstance(obj, MappingProxyType):
+        return dict(obj)
+    if isinstance(obj, Enum):
+        return obj.value
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return {f.name: getattr(obj, f.name) for f in dataclasses.fields(obj)}
+    return str(obj)
+
+
+def dumps_json(obj: Any, indent: bool = True) -> bytes:
+    """
+    Serialize an object to UTF-8 encoded JSON.
+
+    Dataclasses and enums are serialized directly (enums by value), so
+    callers don't need to build an intermediate dict with ``asdict``.
+    Anything else that isn't JSON-native is converted with ``str``.
+
+    Args:
+        obj: Object to serialize
+        indent: Pretty-print with two-space indentation
+
+    Returns:
+        JSON document as bytes, ready to write to a binary file
+    """
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=_json_default, option=option)
+
+    return json.dumps(
+        obj, indent=2 if indent else None, default=_json_default, ensure_ascii=False
+    ).encode('utf-8')
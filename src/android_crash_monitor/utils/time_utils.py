@@ -5,8 +5,15 @@ Time Utilities
 Centralized timestamp parsing and manipulation for Android crash monitoring.
 """
 
+import time
 from datetime import datetime
-from typing import Optional
+from typing import Optional, Tuple
+
+# (epoch second, ISO string) for the most recent cached_iso_now() call
+_iso_now_cache: Tuple[int, str] = (0, "")
+
+# (epoch second, "MM-dd HH:MM:SS" string) for the most recent cached_logcat_now() call
+_logcat_now_cache: Tuple[int, str] = (0, "")
 
 
 def parse_android_timestamp(timestamp_str: str) -> Optional[datetime]:
@@ -113,3 +120,44 @@ def is_within_time_window(timestamp: datetime, window_minutes: int) -> bool:
     now = datetime.now()
     diff_minutes = abs((now - timestamp).total_seconds() / 60)
     return diff_minutes <= window_minutes
+
+
+def cached_iso_now() -> str:
+    """
+    Get the current local time as an ISO 8601 string, at one-second resolution.
+    
+    The formatted string is cached for the current second, so bursts of
+    events (e.g. alert floods) format the timestamp at most once per second
+    instead of calling ``datetime.now().isoformat()`` for each event.
+    
+    Returns:
+        Naive local timestamp like "2024-10-24T04:15:36"
+    """
+    global _iso_now_cache
+    now = int(time.time())
+    cached_second, cached_iso = _iso_now_cache
+    if now != cached_second:
+        cached_iso = datetime.fromtimestamp(now).isoformat()
+        _iso_now_cache = (now, cached_iso)
+    return cached_iso
+
+
+def cached_logcat_now() -> str:
+    """
+    Get the current local time as a logcat timestamp, with milliseconds.
+    
+    Only the millisecond suffix is formatted per call; the "MM-dd HH:MM:SS"
+    part is cached for the current second. Equivalent to
+    ``datetime.now().strftime("%m-%d %H:%M:%S.%f")[:-3]``.
+    
+    Returns:
+        Local timestamp like "10-24 04:15:36.123"
+    """
+    global _logcat_now_cache
+    now = time.time()
+    second = int(now)
+    cached_second, cached_prefix = _logcat_now_cache
+    if second != cached_second:
+        cached_prefix = time.strftime("%m-%d %H:%M:%S", time.localtime(second))
+        _logcat_now_cache = (second, cached_prefix)
+    return f"{cached_prefix}.{int((now - second) * 1000):03d}"
@@ -45,8 +45,7 @@ class EnhancedMonitoringTester:
                     pid=13579,
                     tid=13579,
                     message="java.lang.IllegalArgumentException: Invalid HLS manifest: does not start with #EXTM3U",
-                    device_serial="1C311FDF6000FS",
-                    raw_line="10-06 22:36:33.972 13579 13579 W System.err: java.lang.IllegalArgumentException: Invalid HLS manifest: does not start with #EXTM3U"
+                    device_serial="1C311FDF6000FS"
                 ),
                 "expected_type": "hls_streaming_error",
                 "should_alert": True
@@ -60,8 +59,7 @@ class EnhancedMonitoringTester:
                     pid=13579,
                     tid=13579,
                     message="java.lang.IllegalArgumentException: Receiver not registered: r8.y4j@2b3b386",
-                    device_serial="1C311FDF6000FS",
-                    raw_line="10-06 22:36:09.149 13579 13579 W System.err: java.lang.IllegalArgumentException: Receiver not registered: r8.y4j@2b3b386"
+                    device_serial="1C311FDF6000FS"
                 ),
                 "expected_type": "receiver_registration_error",
                 "should_alert": True
@@ -75,8 +73,7 @@ class EnhancedMonitoringTester:
                     pid=13579,
                     tid=18741,
                     message="[release] component is released",
-                    device_serial="1C311FDF6000FS",
-                    raw_line="10-06 22:36:08.100 13579 18741 I ExynosC2Vp9DecComponent: [release] component is released"
+                    device_serial="1C311FDF6000FS"
                 ),
                 "expected_type": "video_codec_error",
                 "should_alert": False  # Lower severity
@@ -90,8 +87,7 @@ class EnhancedMonitoringTester:
                     pid=13579,
                     tid=18741,
                     message="deallocate() 58321360912570 was not successful 2",
-                    device_serial="1C311FDF6000FS",
-                    raw_line="10-06 22:36:07.500 13579 18741 W Codec2-GraphicBufferAllocator: deallocate() 58321360912570 was not successful 2"
+                    device_serial="1C311FDF6000FS"
                 ),
                 "expected_type": "hardware_acceleration_error",
                 "should_alert": True
@@ -105,8 +101,7 @@ class EnhancedMonitoringTester:
                     pid=13579,
                     tid=18741,
                     message="Receive forward intent: com.google.android.apps.pixel.dcservice.monitor.ACTION_MONITOR_MEDIA_PLAYBACK_STOPPED",
-                    device_serial="1C311FDF6000FS",
-                    raw_line="10-06 22:36:08.200 13579 18741 I ForwardBroadcastListene: Receive forward intent: com.google.android.apps.pixel.dcservice.monitor.ACTION_MONITOR_MEDIA_PLAYBACK_STOPPED"
+                    device_serial="1C311FDF6000FS"
                 ),
                 "expected_type": "media_pipeline_error",
                 "should_alert": False  # Lower severity
@@ -0,0 +1,264 @@
+"""Unit tests for the enhanced System.err alerting system."""
+
+import dataclasses
+import threading
+import time
+
+import pytest
+
+from android_crash_monitor.core import enhanced_alerts
+from android_crash_monitor.core.enhanced_alerts import (
+    Alert, AlertAggregator, AlertLevel, AlertRule, AlertType, EnhancedAlertingSystem,
+    RateLimiter
+)
+from android_crash_monitor.core.enhanced_patterns import EnhancedCrashType, PatternMatch
+
+
+def make_match(crash_type=EnhancedCrashType.HLS_STREAMING_ERROR, context=None):
+    return PatternMatch(
+        crash_type=crash_type,
+        pattern=r"Invalid HLS manifest: does not start with #EXTM3U",
+        confidence=0.9,
+        severity_override=7,
+        additional_context=context,
+    )
+
+
+@pytest.fixture
+def alerting(tmp_path):
+    system = EnhancedAlertingSystem(tmp_path)
+    received = []
+    system.add_alert_handler(received.append)
+    system.received = received
+    return system
+
+
+class TestProcessEnhancedCrash:
+    def test_error_level_alert_is_sent_and_saved(self, alerting, tmp_path):
+        alerting.process_enhanced_crash(make_match(), "SERIAL1", "com.example")
+        assert len(alerting.received) == 1
+        assert alerting.received[0].title == "HLS Streaming Failure"
+        assert len(list((tmp_path / "alerts").glob("*.json"))) == 1
+
+    def test_alerts_in_one_second_keep_precise_order(self, alerting):
+        for serial in ("A", "B"):
+            alerting.process_enhanced_crash(make_match(), serial)
+        first, second = alerting.received
+        assert first.ts_epoch <= second.ts_epoch
+        assert int(first.ts_epoch) <= int(time.time())
+        assert first.to_dict()["ts_epoch"] == first.ts_epoch
+
+    def test_cascade_context_sends_critical_alert(self, alerting):
+        cascade = {"total_crashes": 4, "time_window": 5, "dominant_type": "hls_streaming_error"}
+        context = {"likely_app": "com.aloha.browser", "cascade_detected": cascade}
+        alerting.process_enhanced_crash(make_match(context=context), "SERIAL1")
+
+        alert = alerting.received[0]
+        assert alert.alert_type.value == "cascade_failure"
+        assert alert.crash_count == 4
+        assert "Primary app affected: com.aloha.browser" in alert.message
+
+    def test_disabled_rule_is_skipped(self, alerting):
+        alerting.update_alert_rule(EnhancedCrashType.HLS_STREAMING_ERROR, enabled=False)
+        alerting.process_enhanced_crash(make_match(), "SERIAL1")
+        assert alerting.received == []
+        assert alerting.get_alert_statistics()["active_alert_rules"] == 5
+
+    def test_rule_changed_in_place_takes_effect(self, alerting):
+        alerting.alert_rules[EnhancedCrashType.HLS_STREAMING_ERROR].enabled = False
+        alerting.process_enhanced_crash(make_match(), "SERIAL1")
+        assert alerting.received == []
+
+        alerting.alert_rules[EnhancedCrashType.HLS_STREAMING_ERROR] = dataclasses.replace(
+            alerting.alert_rules[EnhancedCrashType.HLS_STREAMING_ERROR], enabled=True)
+        alerting.process_enhanced_crash(make_match(), "SERIAL1")
+        assert len(alerting.received) == 1
+
+    def test_no_handlers_and_no_output_dir_short_circuits(self):
+        system = EnhancedAlertingSystem(None)
+        system.process_enhanced_crash(make_match(), "SERIAL1")
+        assert system.alert_stats["total_alerts"] == 0
+        assert system.rate_limiter.alert_history == {}
+
+
+class TestAsyncDispatch:
+    def test_queued_alerts_are_delivered_on_flush(self, tmp_path):
+        system = EnhancedAlertingSystem(tmp_path, async_dispatch=True)
+        received = []
+        system.add_alert_handler(received.append)
+
+        system.process_enhanced_crash(make_match(), "SERIAL1")
+        system.flush()
+        assert len(received) == 1
+        system.close()
+
+    def test_batch_handlers_receive_lists(self, tmp_path):
+        class BatchHandler:
+            def __init__(self):
+                self.batches = []
+
+            def __call__(self, alert):
+                raise AssertionError("per-alert call not expected")
+
+            def handle_batch(self, alerts):
+                self.batches.append(list(alerts))
+
+        system = EnhancedAlertingSystem(tmp_path, async_dispatch=True)
+        handler = BatchHandler()
+        system.add_alert_handler(handler)
+        for serial in ("A", "B", "C"):
+            system.process_enhanced_crash(make_match(), serial)
+        system.close()
+
+        assert sum(len(batch) for batch in handler.batches) == 3
+
+    def test_close_timeout_keeps_busy_thread(self, tmp_path):
+        release = threading.Event()
+        calls = []
+
+        def slow_handler(alert):
+            calls.append(threading.current_thread().name)
+            release.wait(5)
+
+        system = EnhancedAlertingSystem(tmp_path, async_dispatch=True)
+        system.add_alert_handler(slow_handler)
+        system.process_enhanced_crash(make_match(), "A")
+        while not calls:
+            time.sleep(0.001)
+
+        system.close(timeout=0.05)
+        assert system._dispatch_thread is not None
+        system.process_enhanced_crash(make_match(), "B")
+        assert len(calls) == 1  # queued, not delivered on this thread
+
+        release.set()
+        system.close()
+        assert system._dispatch_thread is None
+        # B sat behind the stop marker and was delivered by close()
+        assert calls == ["alert-dispatch", threading.current_thread().name]
+
+    def test_close_on_full_queue_returns(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(EnhancedAlertingSystem, "DISPATCH_QUEUE_SIZE", 1)
+        release = threading.Event()
+        system = EnhancedAlertingSystem(tmp_path, async_dispatch=True)
+        system.add_alert_handler(lambda alert: release.wait(5))
+        for serial in ("A", "B", "C"):
+            system.process_enhanced_crash(make_match(), serial)
+
+        started = time.monotonic()
+        system.close(timeout=0.05)
+        assert time.monotonic() - started < 1
+        assert system._dispatch_thread is not None
+        release.set()
+        system.close()
+        assert system._dispatch_thread is None
+
+
+class TestAlertAggregator:
+    def make_alert(self, index, severity):
+        return Alert(
+            alert_id=f"crash_SERIAL1_{index}",
+            alert_type=AlertType.VIDEO_CODEC_FAILURE,
+            level=AlertLevel.WARNING,
+            title="Video Codec Error",
+            message="Video codec error detected.",
+            timestamp="2024-10-24T04:15:36",
+            device_serial="SERIAL1",
+            crash_type="video_codec_error",
+            severity=severity,
+        )
+
+    def test_to_dict_matches_fields(self):
+        alert = self.make_alert(0, 5)
+        data = alert.to_dict()
+        assert list(data) == [f.name for f in dataclasses.fields(Alert)]
+        assert data["alert_type"] == "video_codec_failure"
+        assert data["level"] == "warning"
+
+    def test_aggregates_after_five_alerts(self):
+        aggregator = AlertAggregator()
+        severities = [3, None, 9, 4, 6]
+        results = [aggregator.add_alert(self.make_alert(i, sev))
+                   for i, sev in enumerate(severities)]
+
+        assert results[:4] == [None] * 4
+        aggregated = results[4]
+        assert aggregated.crash_count == 5
+        assert aggregated.severity == 9
+        assert aggregated.level is AlertLevel.ERROR
+        assert aggregated.metadata == {
+            "first_alert_id": "crash_SERIAL1_0",
+            "last_alert_id": "crash_SERIAL1_4",
+            "original_alert_count": 5,
+        }
+        assert aggregator.pending_alerts == {}
+
+
+class TestAdaptiveRateLimit:
+    @pytest.fixture
+    def clock(self, monkeypatch):
+        now = [1000.0]
+        monkeypatch.setattr(enhanced_alerts.time, "time", lambda: now[0])
+        return now
+
+    def make_rule(self):
+        return AlertRule(
+            crash_type=EnhancedCrashType.HLS_STREAMING_ERROR,
+            alert_type=AlertType.HLS_STREAMING_DOWN,
+            level=AlertLevel.ERROR,
+            rate_limit_minutes=2,
+            cascade_threshold=3,
+        )
+
+    def test_flood_backs_off_and_quiet_period_recovers(self, clock):
+        limiter = RateLimiter()
+        rule = self.make_rule()
+        assert limiter.get_rate_limit("key", rule) == 2.0
+
+        assert limiter.can_send_rule_alert("key", rule)
+        for _ in range(RateLimiter.BACKOFF_SUPPRESSIONS):
+            clock[0] += 1
+            assert not limiter.can_send_rule_alert("key", rule)
+        assert limiter.get_rate_limit("key", rule) == 4.0
+
+        # Quiet for more than twice the backed-off window
+        clock[0] += 2 * 4 * 60
+        assert limiter.can_send_rule_alert("key", rule)
+        assert limiter.get_rate_limit("key", rule) == 2.0
+        assert limiter.backoff_windows == {}
+
+    def test_back_off_is_capped(self, clock):
+        limiter = RateLimiter()
+        rule = self.make_rule()
+        limiter.can_send_rule_alert("key", rule)
+        for _ in range(RateLimiter.BACKOFF_SUPPRESSIONS * 10):
+            clock[0] += 0.1
+            limiter.can_send_rule_alert("key", rule)
+        assert limiter.get_rate_limit("key", rule) == 2 * RateLimiter.MAX_BACKOFF_FACTOR
+
+    def test_back_off_is_per_key(self, clock):
+        limiter = RateLimiter()
+        rule = self.make_rule()
+        limiter.can_send_rule_alert("flooding", rule)
+        for _ in range(RateLimiter.BACKOFF_SUPPRESSIONS):
+            clock[0] += 1
+            limiter.can_send_rule_alert("flooding", rule)
+        assert limiter.get_rate_limit("flooding", rule) == 4.0
+
+        # Another device's key keeps the configured window
+        assert limiter.can_send_rule_alert("quiet", rule)
+        clock[0] += 2 * 60
+        assert limiter.can_send_rule_alert("quiet", rule)
+        assert limiter.get_rate_limit("quiet", rule) == 2.0
+        assert limiter.get_rate_limit("flooding", rule) == 4.0
+        assert rule == self.make_rule()
+
+    def test_new_configured_window_restarts_back_off(self, clock):
+        limiter = RateLimiter()
+        rule = self.make_rule()
+        limiter.can_send_rule_alert("key", rule)
+        for _ in range(RateLimiter.BACKOFF_SUPPRESSIONS):
+            clock[0] += 1
+            limiter.can_send_rule_alert("key", rule)
+        rule.rate_limit_minutes = 3
+        assert limiter.get_rate_limit("key", rule) == 3.0
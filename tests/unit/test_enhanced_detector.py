@@ -0,0 +1,327 @@
+"""Unit tests for the enhanced System.err crash detector."""
+
+import threading
+import time
+from datetime import datetime
+
+import pytest
+
+from android_crash_monitor.core import enhanced_detector, enhanced_patterns
+from android_crash_monitor.core.enhanced_detector import EnhancedCrashDetector, EnhancedDetectionCounters
+from android_crash_monitor.core.enhanced_alerts import Alert, AlertLevel, AlertType
+from android_crash_monitor.core.enhanced_patterns import EnhancedCrashType, PatternMatch
+from android_crash_monitor.core.monitor import LogEntry, LogLevel
+from android_crash_monitor.ui.console import ConsoleUI
+
+
+@pytest.fixture
+def detector(tmp_path):
+    return EnhancedCrashDetector(ConsoleUI(), tmp_path)
+
+
+def make_entry(message, tag="System.err", timestamp="10-06 22:36:33.972"):
+    return LogEntry(
+        timestamp=timestamp,
+        level=LogLevel.WARNING,
+        tag=tag,
+        pid=13579,
+        tid=13579,
+        message=message,
+        device_serial="SERIAL1",
+    )
+
+
+def make_alert(alert_id, title="HLS Streaming Failure"):
+    return Alert(alert_id=alert_id, alert_type=AlertType.SINGLE_CRASH, level=AlertLevel.INFO,
+                 title=title, message="", timestamp="",
+                 device_serial="SERIAL1", crash_type="hls_streaming_error")
+
+
+class TestTimestampParsing:
+    @pytest.mark.parametrize("timestamp", [
+        "10-06 22:36:33.972",
+        "10-06 22:36:59.001",
+        "10-06 22:37:00.5",
+        "10-06 22:36:33",
+    ])
+    def test_matches_strptime(self, detector, timestamp):
+        base, _, millis = timestamp.partition(".")
+        expected = datetime.strptime(
+            f"{datetime.now().year}-{base}.{int(millis or 0):03d}", "%Y-%m-%d %H:%M:%S.%f"
+        ).timestamp()
+        assert detector._parse_log_timestamp(timestamp) == pytest.approx(expected)
+
+    @pytest.mark.parametrize("timestamp", ["", "garbage", "2024-10-06 22:36:33.972"])
+    def test_malformed_raises_value_error(self, detector, timestamp):
+        with pytest.raises(ValueError):
+            detector._parse_log_timestamp(timestamp)
+
+
+class TestEnhancedStackTrace:
+    def make_match(self, crash_type):
+        return PatternMatch(crash_type=crash_type, pattern="HLS.*manifest.*invalid", confidence=0.9)
+
+    def test_hls_collects_coroutine_lines(self, detector):
+        logs = [make_entry("kotlinx.coroutines.DispatchedTask.run"),
+                make_entry("unrelated line"),
+                make_entry("BaseContinuationImpl.resumeWith")]
+        trace = detector._extract_enhanced_stack_trace(
+            logs, self.make_match(EnhancedCrashType.HLS_STREAMING_ERROR))
+        assert trace == ["kotlinx.coroutines.DispatchedTask.run",
+                         "BaseContinuationImpl.resumeWith"]
+
+    def test_generic_trace_wins_and_stops_at_unrelated_line(self, detector):
+        logs = [make_entry("kotlinx.coroutines.DispatchedTask.run"),
+                make_entry("java.io.IOException: Connection reset"),
+                make_entry("    at okhttp3.RealCall.execute(RealCall.java:92)"),
+                make_entry("unrelated line"),
+                make_entry("    at com.example.Late.run(Late.java:1)")]
+        trace = detector._extract_enhanced_stack_trace(
+            logs, self.make_match(EnhancedCrashType.HLS_STREAMING_ERROR))
+        assert trace == ["java.io.IOException: Connection reset",
+                         "    at okhttp3.RealCall.execute(RealCall.java:92)"]
+
+    def test_falls_back_to_pattern(self, detector):
+        logs = [make_entry("unrelated line")]
+        trace = detector._extract_enhanced_stack_trace(
+            logs, self.make_match(EnhancedCrashType.RECEIVER_REGISTRATION_ERROR))
+        assert trace == ["HLS.*manifest.*invalid"]
+
+
+class TestEnhancedStatistics:
+    def test_counts_enhanced_crash(self, detector):
+        detector.detect_crashes(make_entry(
+            "java.lang.IllegalArgumentException: Invalid HLS manifest: does not start with #EXTM3U"))
+        stats = detector.get_enhanced_statistics()
+        assert stats["enhanced_crashes_detected"] == 1
+        assert stats["hls_streaming_errors"] == 1
+        assert stats["high_confidence_detections"] == 1
+        assert stats["total_alerts_sent"] == 1
+        assert "alert_system" in stats and "pattern_matching" in stats
+
+    @pytest.fixture
+    def refreshes(self, detector, monkeypatch):
+        calls = []
+        get_alert_statistics = detector.alerting_system.get_alert_statistics
+        monkeypatch.setattr(detector.alerting_system, "get_alert_statistics",
+                            lambda: calls.append(1) or get_alert_statistics())
+        return calls
+
+    def test_cached_until_next_detection(self, detector, refreshes):
+        first = detector.get_enhanced_statistics()
+        assert detector.get_enhanced_statistics() == first
+        assert len(refreshes) == 1
+
+        detector.detect_crashes(make_entry("Receiver not registered: r8.a1b2"))
+        second = detector.get_enhanced_statistics()
+        assert len(refreshes) == 2
+        assert second["receiver_registration_errors"] == 1
+
+    def test_cache_expires(self, detector, refreshes, monkeypatch):
+        detector.get_enhanced_statistics()
+        now = time.monotonic()
+        monkeypatch.setattr(enhanced_detector.time, "monotonic",
+                            lambda: now + EnhancedCrashDetector.STATS_CACHE_SECONDS)
+        detector.get_enhanced_statistics()
+        assert len(refreshes) == 2
+
+    def test_caller_changes_do_not_reach_cache(self, detector, refreshes):
+        stats = detector.get_enhanced_statistics()
+        stats["enhanced_crashes_detected"] = 99
+        stats.pop("alert_system")
+        stats = detector.get_enhanced_statistics()
+        assert len(refreshes) == 1
+        assert stats["enhanced_crashes_detected"] == 0
+        assert "alert_system" in stats
+
+
+class TestSessionId:
+    def test_reused_within_second_and_per_device(self, detector, monkeypatch):
+        monkeypatch.setattr(enhanced_detector.time, "time", lambda: 1000.2)
+        first = detector._session_id("SERIAL1")
+        assert first == "1000_SERIAL1"
+        assert detector._session_id("SERIAL1") is first
+        assert detector._session_id("SERIAL2") == "1000_SERIAL2"
+
+        monkeypatch.setattr(enhanced_detector.time, "time", lambda: 1001.0)
+        assert detector._session_id("SERIAL1") == "1001_SERIAL1"
+
+
+class TestPrefilter:
+    @pytest.mark.parametrize("message", [
+        "java.lang.IllegalArgumentException: Invalid HLS manifest: does not start with #EXTM3U",
+        "RECEIVER NOT REGISTERED: r8.a1b2",
+        "opengl context error",
+        "ExynosC2Vp9DecComponent release",
+    ])
+    def test_passes_pattern_messages(self, detector, message):
+        assert detector.enhanced_patterns.might_match(message)
+        assert detector._detect_enhanced_patterns(make_entry(message))
+
+    def test_rejects_noise(self, detector):
+        message = "ActivityManager: Start proc 1234:com.example/u0a123 for service"
+        assert not detector.enhanced_patterns.might_match(message)
+        assert detector._detect_enhanced_patterns(make_entry(message)) == []
+
+    def test_required_literal(self):
+        assert enhanced_patterns._required_literal(r"Receiver not registered: r8\.[a-z]+") == \
+            "Receiver not registered: r8"
+        assert enhanced_patterns._required_literal(r"abc*d") == "ab"
+        assert enhanced_patterns._required_literal(r"(a|b)") == ""
+
+
+class TestAlertAppPackage:
+    @pytest.mark.parametrize("tag, expected", [
+        ("com.example.player", "com.example.player"),
+        ("example.player", None),
+        ("System.err", None),
+    ])
+    def test_package_like_tag_used_as_app(self, detector, monkeypatch, tag, expected):
+        calls = []
+        monkeypatch.setattr(detector.alerting_system, "process_enhanced_crash",
+                            lambda **kwargs: calls.append(kwargs))
+        match = PatternMatch(crash_type=EnhancedCrashType.HLS_STREAMING_ERROR,
+                             pattern="HLS.*manifest.*invalid", confidence=0.9)
+        detector._process_enhanced_alert(match, make_entry("HLS manifest invalid", tag=tag))
+        assert calls[0]["app_package"] == expected
+
+
+class TestAsyncAlertRendering:
+    def test_stats_are_synchronous_and_rendering_is_flushed(self, tmp_path, monkeypatch):
+        detector = EnhancedCrashDetector(ConsoleUI(), tmp_path, async_alerts=True)
+        printed = []
+        monkeypatch.setattr(detector.console, "print", lambda *args, **kwargs: printed.append(args))
+        try:
+            detector.detect_crashes(make_entry(
+                "java.lang.IllegalArgumentException: Invalid HLS manifest: does not start with #EXTM3U"))
+            assert detector.enhanced_stats.total_alerts_sent == 1
+            detector.flush_alerts()
+            assert len(printed) == 1
+        finally:
+            detector.close()
+        assert detector._render_thread is None
+
+    def test_close_timeout_keeps_busy_thread(self, tmp_path, monkeypatch):
+        detector = EnhancedCrashDetector(ConsoleUI(), tmp_path, async_alerts=True)
+        release = threading.Event()
+        printed = []
+
+        def slow_print(*args, **kwargs):
+            printed.append(threading.current_thread().name)
+            release.wait(5)
+
+        monkeypatch.setattr(detector.console, "print", slow_print)
+        detector._console_alert_handler(make_alert("a1"))
+        while not printed:
+            time.sleep(0.001)
+
+        detector.close(timeout=0.05)
+        assert detector._render_thread is not None
+        detector._console_alert_handler(make_alert("a2"))
+        assert len(printed) == 1  # queued, not rendered on this thread
+
+        release.set()
+        detector.close()
+        assert detector._render_thread is None
+        # a2 sat behind the stop marker and was rendered by close()
+        assert printed == ["alert-render", threading.current_thread().name]
+
+    def test_full_queue_drops_instead_of_rendering_inline(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(EnhancedCrashDetector, "RENDER_QUEUE_SIZE", 1)
+        detector = EnhancedCrashDetector(ConsoleUI(), tmp_path, async_alerts=True)
+        release = threading.Event()
+        printed = []
+
+        def slow_print(*args, **kwargs):
+            printed.append(threading.current_thread().name)
+            release.wait(5)
+
+        monkeypatch.setattr(detector.console, "print", slow_print)
+        detector._console_alert_handler(make_alert("a1"))
+        while not printed:
+            time.sleep(0.001)
+        for alert_id in ("a2", "a3", "a4"):
+            detector._console_alert_handler(make_alert(alert_id))
+
+        release.set()
+        detector.close()
+        assert printed == ["alert-render", "alert-render"]
+        assert detector.enhanced_stats.total_alerts_sent == 4
+        assert detector.get_enhanced_statistics()["dropped_alert_renders"] == 2
+
+
+class TestConsoleAlertHandler:
+    def test_headline_markup(self, detector, monkeypatch):
+        printed = []
+        monkeypatch.setattr(detector.console, "print", lambda *args, **kwargs: printed.append(args[0]))
+        detector.detect_crashes(make_entry(
+            "java.lang.IllegalArgumentException: Invalid HLS manifest: does not start with #EXTM3U"))
+        assert len(printed) == 1
+        assert printed[0].markup == "[red]📺 HLS[/red] [bold]HLS Streaming Failure[/bold] (Severity: 7/10)"
+
+    def test_title_is_not_parsed_as_markup(self, detector, monkeypatch):
+        printed = []
+        monkeypatch.setattr(detector.console, "print", lambda *args, **kwargs: printed.append(args[0]))
+        alert = make_alert("a1", title="Crash in [bold]app[/bold]")
+        detector._console_alert_handler(alert)
+        assert printed[0].plain == "💥 CRASH Crash in [bold]app[/bold] (Severity: N/A/10)"
+
+
+class TestPatternPerformanceSummary:
+    def test_empty(self, detector):
+        assert detector.get_pattern_performance_summary() == {"message": "No enhanced crashes detected yet"}
+
+    def test_percentages(self, detector):
+        stats = detector.enhanced_stats
+        stats.enhanced_crashes_detected = 3
+        stats.high_confidence_detections = 2
+        stats.low_confidence_detections = 1
+        stats.total_alerts_sent = 3
+        summary = detector.get_pattern_performance_summary()
+        assert summary["confidence_distribution"] == {"high": "66.7%", "medium": "0.0%", "low": "33.3%"}
+        assert summary["alert_efficiency"] == "100.0%"
+
+
+class TestDetectCrashesBatch:
+    def test_matches_per_entry_detection(self, tmp_path):
+        messages = [
+            "ActivityManager: Start proc 1234:com.example/u0a123",
+            "java.lang.IllegalArgumentException: Invalid HLS manifest: does not start with #EXTM3U",
+            "FATAL EXCEPTION: main",
+            "Receiver not registered: r8.a1b2",
+        ]
+        entries = [make_entry(message) for message in messages]
+        single = EnhancedCrashDetector(ConsoleUI(), tmp_path)
+        batch = EnhancedCrashDetector(ConsoleUI(), tmp_path)
+
+        expected = [crash for entry in entries for crash in single.detect_crashes(entry)]
+        crashes = batch.detect_crashes_batch(entries)
+
+        assert [(c.crash_type, c.title) for c in crashes] == [(c.crash_type, c.title) for c in expected]
+        assert batch.enhanced_stats == single.enhanced_stats
+
+
+class TestCrashTypeStatNames:
+    @pytest.mark.parametrize("crash_type", list(EnhancedCrashType))
+    def test_every_crash_type_has_a_counter(self, crash_type):
+        assert hasattr(EnhancedDetectionCounters(), crash_type.stat_name)
+
+
+class TestRelatedLogs:
+    def test_live_entry_uses_trailing_window(self, detector):
+        entries = [make_entry(f"line {i}") for i in range(20)]
+        for entry in entries:
+            detector.detect_crashes(entry)
+        assert detector._get_related_logs(entries[-1], context_lines=15) == entries[-16:]
+
+    def test_earlier_entry_is_centered(self, detector):
+        entries = [make_entry(f"line {i}") for i in range(20)]
+        for entry in entries:
+            detector.detect_crashes(entry)
+        assert detector._get_related_logs(entries[10], context_lines=2) == entries[8:13]
+
+    def test_matches_on_one_line_share_context(self, detector):
+        crashes = detector.detect_crashes(make_entry(
+            "Invalid HLS manifest: does not start with #EXTM3U; MediaPlayer error"))
+        assert len(crashes) >= 2
+        assert all(c.related_logs is crashes[0].related_logs for c in crashes)
@@ -0,0 +1,170 @@
+"""Unit tests for enhanced System.err crash patterns."""
+
+import random
+
+import pytest
+
+from android_crash_monitor.core.enhanced_patterns import (
+    CascadeDetector, EnhancedCrashPatterns, EnhancedCrashType, SystemErrPatterns,
+)
+
+
+MESSAGES = [
+    "java.lang.IllegalArgumentException: Invalid HLS manifest: does not start with #EXTM3U",
+    "invalid hls manifest: DOES NOT START WITH #extm3u",
+    "java.lang.IllegalArgumentException: receiver NOT registered: r8.a1b2",
+    "E/ExynosC2Vp9DecComponent: decoder release timed out",
+    "MEDIAPLAYER reported error (1, -1004)",
+    "Codec2-GraphicBufferAllocator: deallocate was not successful",
+    "Unsupported media type for playlist",
+    "MediaScanner: scanned file /sdcard/DCIM/IMG_1234.jpg in 12ms",
+    "SurfaceFlinger: Display 0 HWC layers: 4 visible",
+]
+
+
+def unguarded_matches(patterns, message):
+    """Reference result: first matching pattern per type, searched without guards."""
+    found = []
+    for crash_type, compiled_patterns in patterns.compiled_patterns.items():
+        for pattern in compiled_patterns:
+            if pattern.search(message):
+                found.append((crash_type, pattern.pattern))
+                break
+    return found
+
+
+# Backend name -> EnhancedCrashPatterns attribute holding its matcher
+BACKEND_ATTRIBUTES = {"ahocorasick": "literal_automaton", "hyperscan": "hyperscan_db"}
+
+
+@pytest.fixture(params=["re", "ahocorasick", "hyperscan"])
+def patterns(request):
+    patterns = EnhancedCrashPatterns()
+    for backend, attribute in BACKEND_ATTRIBUTES.items():
+        if backend != request.param:
+            setattr(patterns, attribute, None)
+        elif getattr(patterns, attribute) is None:
+            pytest.skip(f"{backend} is not installed")
+    return patterns
+
+
+@pytest.mark.parametrize("message", MESSAGES)
+def test_backends_match_first_pattern_per_type(patterns, message):
+    matches = patterns.detect_enhanced_crashes(message, tag="System.err")
+    assert [(m.crash_type, m.pattern) for m in matches] == unguarded_matches(patterns, message)
+
+
+@pytest.mark.parametrize("message", MESSAGES)
+def test_might_match_agrees_with_detection(patterns, message):
+    if patterns.detect_enhanced_crashes(message):
+        assert patterns.might_match(message)
+    assert patterns.might_match(message) == any(
+        literal in message.casefold() for literal in patterns.prefilter_literals)
+
+
+@pytest.mark.parametrize("messages", [
+    MESSAGES,
+    MESSAGES + ["Straße: MediaPlayer error"],
+    ["", "mediaplayer error\nmediaplayer error", "", "opengl"],
+    [],
+])
+def test_batch_matches_per_message(patterns, messages):
+    assert patterns.might_match_batch(messages) == [patterns.might_match(m) for m in messages]
+    
+    lines = [(message, "System.err", 0.0) for message in messages]
+    batch = patterns.detect_enhanced_crashes_batch(lines)
+    single = [patterns.detect_enhanced_crashes(*line) for line in lines]
+    assert batch == single
+
+
+@pytest.mark.parametrize("message, codec, confidence", [
+    ("MediaCodec failed for VP9 stream", "VP9", 0.9),
+    ("MediaCodec failed for HEVC and vp9 stream", "VP9", 0.9),
+    ("MediaCodec failed for AV1 stream", "AV1", 0.8),
+    ("MediaCodec failed for AV1 then h264 stream", "H264", 0.9),
+    ("MediaCodec failed", None, 0.8),
+])
+def test_codec_context_and_confidence(message, codec, confidence):
+    match, = EnhancedCrashPatterns().detect_enhanced_crashes(message, tag="CCodec")
+    assert match.additional_context.get("codec_type") == codec
+    assert match.confidence == pytest.approx(confidence)
+    assert match.severity_override == 6
+
+
+@pytest.mark.parametrize("message", [
+    "Receiver not registered: r8.AbC$1",
+    "IllegalArgumentException thrown by r8.AbC$1: Receiver was not registered",
+])
+def test_receiver_context(patterns, message):
+    match, = patterns.detect_enhanced_crashes(message, tag="System.err")
+    assert match.additional_context["receiver_class"] == "AbC$1"
+    assert match.confidence == pytest.approx(0.95)
+
+
+@pytest.mark.parametrize("message", [
+    "Receiver not registered: r8.AbC$1",
+    "Receiver not registered: R8.AbC$1",
+])
+def test_receiver_pattern_is_reported_plain(patterns, message):
+    match, = patterns.detect_enhanced_crashes(message, tag="System.err")
+    assert match.pattern == SystemErrPatterns.RECEIVER_REGISTRATION_PATTERNS[0]
+    assert "(?P" not in match.pattern
+    assert match.additional_context["receiver_class"] == "AbC$1"
+
+
+def test_context_is_a_fresh_dict_per_match():
+    patterns = EnhancedCrashPatterns()
+    message = "Invalid HLS manifest: does not start with #EXTM3U"
+    first, = patterns.detect_enhanced_crashes(message, tag="System.err")
+    second, = patterns.detect_enhanced_crashes(message, tag="ExoPlayer")
+    assert first.additional_context == {
+        "crash_category": "system_err_enhanced", "detection_tag": "System.err",
+        "error_category": "media_streaming", "streaming_protocol": "HLS",
+    }
+    assert second.additional_context["detection_tag"] == "ExoPlayer"
+    assert first.additional_context is not second.additional_context
+
+
+def test_pattern_tables_are_shared_and_read_only():
+    first, second = EnhancedCrashPatterns(), EnhancedCrashPatterns()
+    assert first.compiled_patterns is second.compiled_patterns
+    assert first.guarded_patterns is second.guarded_patterns
+    with pytest.raises(TypeError):
+        first.compiled_patterns[EnhancedCrashType.HLS_STREAMING_ERROR] = ()
+
+
+def test_hyperscan_scratch_is_per_instance():
+    first, second = EnhancedCrashPatterns(), EnhancedCrashPatterns()
+    if first.hyperscan_db is None:
+        pytest.skip("hyperscan is not installed")
+    assert first.hyperscan_db is second.hyperscan_db
+    assert first._hyperscan_scratch is not second._hyperscan_scratch
+
+
+class TestCascadeDetector:
+    def test_window_matches_full_rescan(self):
+        rng = random.Random(7)
+        detector = CascadeDetector(window_seconds=5, threshold_count=3)
+        reference = []
+        now = 1000.0
+        for _ in range(500):
+            # Mostly increasing timestamps with occasional stragglers
+            now += rng.uniform(0, 2)
+            timestamp = now - rng.uniform(0, 8) if rng.random() < 0.2 else now
+            crash_type = rng.choice(["hls", "codec", "receiver"])
+
+            is_cascade = detector.add_crash(timestamp, crash_type)
+            reference.append((timestamp, crash_type))
+            reference = [(ts, ct) for ts, ct in reference if ts >= timestamp - 5]
+
+            assert sorted(detector.recent_crashes) == sorted(reference)
+            assert is_cascade == (len(reference) >= 3)
+
+            info = detector.get_cascade_info()
+            if is_cascade:
+                types = [ct for _, ct in reference]
+                assert info["total_crashes"] == len(reference)
+                assert sorted(info["crash_types"]) == sorted(set(types))
+                assert types.count(info["dominant_type"]) == max(map(types.count, types))
+            else:
+                assert info == {}
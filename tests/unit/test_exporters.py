@@ -0,0 +1,64 @@
+"""Unit tests for the exporters."""
+
+from dataclasses import asdict
+
+import pytest
+
+from android_crash_monitor.core.monitor import MonitoringStats
+from android_crash_monitor.exporters import (
+    EXPORTERS, ExportData, ExportError, JSONExporter, TextExporter, get_available_formats,
+    get_exporter,
+)
+
+
+class TestRegistry:
+    def test_available_formats_sorted(self):
+        formats = get_available_formats()
+        assert formats == sorted(EXPORTERS)
+        formats.append("mutated")
+        assert "mutated" not in get_available_formats()
+
+    def test_registry_is_read_only(self):
+        with pytest.raises(TypeError):
+            EXPORTERS["xml"] = JSONExporter
+
+    @pytest.mark.parametrize("format_name", ["json", "JSON", "Json"])
+    def test_lookup_is_case_insensitive(self, format_name):
+        assert isinstance(get_exporter(format_name), JSONExporter)
+
+    def test_unknown_format_lists_available(self):
+        with pytest.raises(ExportError, match="Available formats: compact-json, csv"):
+            get_exporter("xml")
+
+
+def make_stats(crashes_by_app=None):
+    return MonitoringStats(
+        session_id="s", start_time="", end_time=None, uptime_seconds=1.5,
+        devices_monitored=["SERIAL1"], reconnection_count=0, total_logs_processed=98765,
+        logs_per_second=2.0, total_crashes=3, crashes_by_type={"crash": 3},
+        crashes_by_app=crashes_by_app or {"com.example.app": 3},
+        memory_usage_mb=0.0, cpu_usage_percent=0.0,
+    )
+
+
+class TestStatsData:
+    def test_matches_asdict(self):
+        stats = make_stats()
+        assert JSONExporter()._prepare_stats_data(stats) == asdict(stats)
+        assert JSONExporter()._prepare_stats_data(None) == {}
+
+    @pytest.mark.parametrize("format_name", ["json", "csv", "html", "txt", "md"])
+    def test_exports_slotted_stats(self, tmp_path, format_name):
+        data = ExportData()
+        data.set_stats(make_stats())
+        output = tmp_path / f"report.{format_name}"
+        get_exporter(format_name).export(data, output, include_stats=True)
+        assert "98765" in output.read_text(encoding="utf-8").replace(",", "")
+
+
+class TestTopApps:
+    def test_text_top_five_keeps_sorted_order(self):
+        crashes_by_app = {f"com.app{i}": count for i, count in enumerate([3, 7, 3, 1, 7, 3, 2, 3])}
+        text = TextExporter()._text_statistics_section(make_stats(crashes_by_app), use_markdown=False)
+        expected = sorted(crashes_by_app.items(), key=lambda x: x[1], reverse=True)[:5]
+        assert text.splitlines()[-5:] == [f"  {app}: {count}" for app, count in expected]
@@ -0,0 +1,56 @@
+"""Unit tests for JSON serialization helpers."""
+
+import json
+from dataclasses import dataclass
+from enum import Enum
+from pathlib import Path
+from types import MappingProxyType
+from typing import Dict, Optional
+
+import pytest
+
+from android_crash_monitor.core.enhanced_patterns import EnhancedCrashPatterns
+from android_crash_monitor.utils import json_utils
+from android_crash_monitor.utils.json_utils import dumps_json
+
+
+class Color(Enum):
+    RED = "red"
+
+
+@dataclass
+class Sample:
+    name: str
+    color: Color
+    metadata: Optional[Dict] = None
+
+
+class TestDumpsJson:
+    def test_dataclass_and_enum(self):
+        data = json.loads(dumps_json(Sample("a", Color.RED, {"k": [1, 2]})))
+        assert data == {"name": "a", "color": "red", "metadata": {"k": [1, 2]}}
+
+    def test_stdlib_fallback_matches(self, monkeypatch):
+        sample = Sample("a", Color.RED, {"nested": {"x": 1}})
+        fast = json.loads(dumps_json(sample))
+        monkeypatch.setattr(json_utils, "ORJSON_AVAILABLE", False)
+        assert json.loads(dumps_json(sample)) == fast
+
+    def test_unknown_objects_use_str(self):
+        data = json.loads(dumps_json({"path": Path("/tmp/x")}, indent=False))
+        assert data == {"path": "/tmp/x"}
+
+    @pytest.mark.parametrize("orjson", [True, False])
+    def test_read_only_mapping_is_an_object(self, monkeypatch, orjson):
+        monkeypatch.setattr(json_utils, "ORJSON_AVAILABLE", orjson and json_utils.ORJSON_AVAILABLE)
+        data = json.loads(dumps_json({"ctx": MappingProxyType({"k": "v"})}))
+        assert data == {"ctx": {"k": "v"}}
+
+    def test_pattern_match_batch(self, monkeypatch):
+        matches = EnhancedCrashPatterns().detect_enhanced_crashes(
+            "Invalid HLS manifest: does not start with #EXTM3U", tag="System.err")
+        fast = json.loads(dumps_json(matches, indent=False))
+        assert fast[0]["crash_type"] == "hls_streaming_error"
+        assert fast[0]["additional_context"]["detection_tag"] == "System.err"
+        monkeypatch.setattr(json_utils, "ORJSON_AVAILABLE", False)
+        assert json.loads(dumps_json(matches, indent=False)) == fast
@@ -0,0 +1,360 @@
+"""Unit tests for the core crash detector."""
+
+import asyncio
+import json
+import time
+from dataclasses import asdict
+from datetime import datetime
+
+import pytest
+
+from android_crash_monitor.core import monitor
+from android_crash_monitor.core.adb import AndroidDevice
+from android_crash_monitor.core.config import MonitoringConfig
+from android_crash_monitor.core.monitor import (
+    AndroidCrashMonitor, CrashDetector, CrashType, LogEntry, LogLevel, LogParser,
+)
+from android_crash_monitor.ui.console import ConsoleUI
+from android_crash_monitor.utils import time_utils
+
+
+# One message per CrashPatterns pattern, plus noise and case variants
+MESSAGES = [
+    "ANR in com.example.app (com.example.app/.MainActivity)",
+    "ActivityManager: ANR in com.example",
+    "Application Not Responding: com.example",
+    "Input dispatching timed out (Waiting to send key event)",
+    "FATAL EXCEPTION: main",
+    "Process: com.example.app, PID: 1234",
+    "AndroidRuntime: FATAL EXCEPTION: main",
+    "System.exit called, status: -1",
+    "DEBUG  : *** FATAL EXCEPTION IN PROCESS 1234",
+    "DEBUG  : Build fingerprint: 'google/raven'",
+    "DEBUG  : Abort message: 'assertion failed'",
+    "libc    : Fatal signal 11 (SIGSEGV)",
+    "tombstoned: crash_dump started",
+    "java.lang.IllegalStateException: boom",
+    "java.lang.StackOverflowError",
+    "RuntimeException in worker",
+    "IllegalArgumentException: bad input",
+    "NullPointerException at com.example.Foo",
+    "ClassNotFoundException: com.example.Missing",
+    "OutOfMemoryError: Failed to allocate a 1024 byte allocation",
+    "Failed to allocate 4096 bytes",
+    "Low on memory: killing process",
+    "GC_CONCURRENT freed 1K, native heap 2K",
+    "open failed: EACCES (Permission denied)",
+    "SecurityException: not allowed",
+    "Caller requires android.permission.CAMERA",
+    "Access denied finding property",
+    "UnknownHostException: example.com",
+    "ConnectTimeoutException after 10s",
+    "SocketTimeoutException: timeout",
+    "No Network Security Config specified, using platform default",
+    "Unable to resolve host \"example.com\"",
+    "SQLiteException: no such table",
+    "SQLException: constraint",
+    "Database disk image is corrupt",
+    "SQLiteCantOpenDatabaseException: unknown error",
+    "fatal exception: MAIN",
+    "Start proc 1234:com.example/u0a123 for service com.example/.Svc",
+    "",
+]
+
+
+def make_entry(message, device_serial="SERIAL1"):
+    return LogEntry(
+        timestamp="10-06 22:36:33.972",
+        level=LogLevel.ERROR,
+        tag="Test",
+        pid=1234,
+        tid=1234,
+        message=message,
+        device_serial=device_serial,
+    )
+
+
+class TestTriggers:
+    @pytest.mark.parametrize("message", MESSAGES)
+    def test_same_crash_types_as_unfiltered(self, message):
+        filtered = CrashDetector()
+        unfiltered = CrashDetector()
+        unfiltered.triggered_patterns = [
+            (crash_type, None, patterns)
+            for crash_type, _, patterns in unfiltered.triggered_patterns
+        ]
+        entry = make_entry(message)
+        assert [c.crash_type for c in filtered.detect_crashes(entry)] == \
+            [c.crash_type for c in unfiltered.detect_crashes(entry)]
+
+    def test_noise_skips_every_type(self):
+        assert CrashDetector().detect_crashes(make_entry(MESSAGES[-2])) == []
+
+    def test_triggers_are_lowercase(self):
+        detector = CrashDetector()
+        for crash_type, triggers, _ in detector.triggered_patterns:
+            assert triggers is not None, crash_type
+            assert all(trigger == trigger.casefold() for trigger in triggers)
+
+    def test_every_pattern_message_is_detected(self):
+        detector = CrashDetector()
+        detected = {c.crash_type for m in MESSAGES for c in detector.detect_crashes(make_entry(m))}
+        assert detected == set(CrashType) - {CrashType.UNKNOWN}
+
+    def test_messages_cover_every_pattern(self):
+        for patterns in CrashDetector().compiled_patterns.values():
+            for pattern in patterns:
+                assert any(pattern.search(m) for m in MESSAGES), pattern.pattern
+
+
+class TestLogParser:
+    def test_raw_line_is_rebuilt_from_fields(self):
+        line = "10-06 22:36:33.972 13579 13579 W System.err: Invalid HLS manifest"
+        entry = LogParser().parse_log_line(line, "SERIAL1")
+        assert entry.raw_line == line
+        assert entry.to_dict()["raw_line"] == line
+        assert not hasattr(entry, "__dict__") or "raw_line" not in vars(entry)
+
+    @pytest.mark.parametrize("level", list(LogLevel))
+    def test_every_level_is_parsed(self, level):
+        line = f"10-06 22:36:33.972  1234  1234 {level.value} Tag: message"
+        assert LogParser().parse_log_line(line, "SERIAL1").level is level
+
+    def test_unparsed_raw_line_is_the_message(self):
+        entry = LogParser().parse_log_line("--------- beginning of main", "SERIAL1")
+        assert entry.raw_line == "--------- beginning of main"
+
+    def test_malformed_line_gets_current_logcat_timestamp(self, monkeypatch):
+        now = 1700000000.25
+        monkeypatch.setattr(time_utils.time, "time", lambda: now)
+        entry = LogParser().parse_log_line("--------- beginning of main", "SERIAL1")
+        assert entry.tag == "UNKNOWN"
+        assert entry.timestamp == datetime.fromtimestamp(now).strftime("%m-%d %H:%M:%S.%f")[:-3]
+
+    def test_cached_timestamp_tracks_the_second(self, monkeypatch):
+        for now in (1700000000.999, 1700000001.0, 1700000001.5):
+            monkeypatch.setattr(time_utils.time, "time", lambda: now)
+            expected = datetime.fromtimestamp(now).strftime("%m-%d %H:%M:%S.%f")[:-3]
+            assert time_utils.cached_logcat_now() == expected
+
+
+class TestLogBuffer:
+    def test_keeps_most_recent_entries(self):
+        detector = CrashDetector()
+        entries = [make_entry(f"line {i}") for i in range(detector.buffer_size + 5)]
+        for entry in entries:
+            detector.detect_crashes(entry)
+        assert list(detector.log_buffer) == entries[5:]
+        assert detector._get_related_logs(entries[-1], context_lines=3) == entries[-4:]
+        assert detector._get_related_logs(entries[10], context_lines=2) == entries[8:13]
+
+
+class TestCrashEvent:
+    def test_app_fields_from_one_package_lookup(self):
+        crash, = CrashDetector().detect_crashes(make_entry("Process: com.example.app, PID: 1234"))
+        assert crash.app_package == "com.example.app"
+        assert crash.app_name == "app"
+        assert crash.title == "Application Crash in com.example.app"
+
+    def test_to_dict_matches_asdict(self):
+        detector = CrashDetector()
+        for i in range(3):
+            detector.detect_crashes(make_entry(f"line {i}"))
+        crash, = detector.detect_crashes(make_entry("Process: com.example.app, PID: 1234"))
+        expected = asdict(crash)
+        expected["crash_type"] = crash.crash_type.value
+        for log, entry in zip(expected["related_logs"], crash.related_logs):
+            log["level"] = log["level"].value
+            log["raw_line"] = entry.raw_line
+        result = crash.to_dict()
+        assert result == expected
+        assert list(result) == list(expected)
+        assert list(result["related_logs"][0]) == list(expected["related_logs"][0])
+
+    @pytest.mark.parametrize("message", MESSAGES + [
+        "Killing com.foo.bar (pid 123): crash",
+        "com.foo.bar\t(pid 7) then Process: com.first",
+        "Package: com.pkg (pid 9)",
+        "(pid 12) with no package",
+    ])
+    def test_package_matches_unguarded_patterns(self, message):
+        expected = next((m.group(1) for m in (p.search(message) for _, p in monitor._APP_PACKAGE_PATTERNS)
+                         if m), None)
+        assert CrashDetector()._extract_app_package(make_entry(message)) == expected
+
+    def test_package_extracted_once_per_entry(self, monkeypatch):
+        detector = CrashDetector()
+        calls = []
+        extract = detector._extract_app_package
+        monkeypatch.setattr(detector, "_extract_app_package", lambda entry: calls.append(entry) or extract(entry))
+        entry = make_entry("Process: com.example.app FATAL EXCEPTION: OutOfMemoryError")
+        crashes = detector.detect_crashes(entry)
+        assert len(crashes) > 1
+        assert calls == [entry]
+        assert {c.app_package for c in crashes} == {"com.example.app"}
+
+    @pytest.mark.parametrize("crash_type", list(CrashType))
+    def test_every_type_has_a_title(self, crash_type):
+        title = CrashDetector()._generate_crash_title(crash_type, make_entry(""), "com.example.app")
+        assert title == f"{crash_type.crash_title} in com.example.app"
+        assert crash_type.crash_title
+
+    def test_falls_back_to_tag(self):
+        crash, = CrashDetector().detect_crashes(make_entry("FATAL EXCEPTION: main"))
+        assert crash.app_package is None
+        assert crash.app_name == "Test"
+        assert crash.title == "Application Crash (Test)"
+
+
+class TestStackTrace:
+    def test_collects_until_unrelated_line(self):
+        logs = [make_entry(m) for m in (
+            "ActivityManager: Start proc",
+            "java.lang.IllegalStateException: boom",
+            "    at com.example.Foo.bar(Foo.java:12)",
+            "",
+            "Caused by: java.io.IOException",
+            "unrelated line",
+            "    at com.example.Late.run(Late.java:1)",
+        )]
+        assert CrashDetector()._extract_stack_trace(logs) == [
+            "java.lang.IllegalStateException: boom",
+            "    at com.example.Foo.bar(Foo.java:12)",
+            "Caused by: java.io.IOException",
+        ]
+
+
+@pytest.fixture
+def crash_monitor(tmp_path, monkeypatch):
+    monkeypatch.setattr(monitor, "ADBManager", lambda: None)
+    return AndroidCrashMonitor(MonitoringConfig(output_dir=tmp_path), ConsoleUI())
+
+
+def make_crashes(count):
+    detector = CrashDetector()
+    return [crash
+            for i in range(count)
+            for crash in detector.detect_crashes(make_entry("FATAL EXCEPTION: main", f"SERIAL{i}"))]
+
+
+class TestCrashSaving:
+    def test_saves_synchronously_without_worker(self, crash_monitor, tmp_path):
+        crash, = make_crashes(1)
+        asyncio.run(crash_monitor._save_crash(crash))
+        path, = tmp_path.glob("crash_*.json")
+        assert json.loads(path.read_text(encoding="utf-8")) == \
+            json.loads(json.dumps(crash.to_dict(), default=str))
+
+    def test_recreates_removed_output_dir(self, crash_monitor, tmp_path):
+        crash, = make_crashes(1)
+        tmp_path.rmdir()
+        asyncio.run(crash_monitor._save_crash(crash))
+        assert len(list(tmp_path.glob("crash_*.json"))) == 1
+
+    def test_session_stats_written_off_loop(self, crash_monitor, tmp_path):
+        crash_monitor.stats.crashes_by_app = {"com.example.app": 2}
+        asyncio.run(crash_monitor._save_session_stats())
+        path, = tmp_path.glob("session_stats_*.json")
+        assert json.loads(path.read_bytes()) == json.loads(json.dumps(asdict(crash_monitor.stats)))
+
+    def test_cleanup_submits_stats_write_before_summary(self, crash_monitor, monkeypatch):
+        events = []
+        monkeypatch.setattr(crash_monitor, "_write_file", lambda path, data: events.append("write"))
+        monkeypatch.setattr(crash_monitor, "_display_final_stats", lambda: events.append("summary"))
+        monkeypatch.setattr(monitor, "dumps_json", lambda obj: events.append("encode") or b"{}")
+        asyncio.run(crash_monitor._cleanup())
+        assert events.index("encode") < events.index("summary")
+        assert "write" in events
+
+    def test_cleanup_awaits_stats_save_when_summary_fails(self, crash_monitor, monkeypatch):
+        saved = []
+        save_session_stats = crash_monitor._save_session_stats
+
+        async def tracked_save():
+            await save_session_stats()
+            saved.append(True)
+
+        def fail():
+            raise RuntimeError("console gone")
+
+        write_file = crash_monitor._write_file
+        monkeypatch.setattr(crash_monitor, "_write_file",
+                            lambda path, data: time.sleep(0.05) or write_file(path, data))
+        monkeypatch.setattr(crash_monitor, "_save_session_stats", tracked_save)
+        monkeypatch.setattr(crash_monitor, "_display_final_stats", fail)
+        with pytest.raises(RuntimeError):
+            asyncio.run(crash_monitor._cleanup())
+        assert saved == [True]
+
+    def test_worker_writes_every_queued_crash(self, crash_monitor, tmp_path):
+        crashes = make_crashes(AndroidCrashMonitor.SAVE_BATCH_SIZE + 10)
+
+        async def run():
+            crash_monitor._start_crash_saver()
+            for crash in crashes:
+                await crash_monitor._save_crash(crash)
+            await crash_monitor._stop_crash_saver()
+
+        asyncio.run(run())
+        saved = {json.loads(p.read_text())["device_serial"] for p in tmp_path.glob("crash_*.json")}
+        assert saved == {crash.device_serial for crash in crashes}
+        assert crash_monitor._saver_task is None
+
+
+class FakeProcess:
+    def __init__(self, chunks):
+        self.stdout = asyncio.StreamReader()
+        for chunk in chunks:
+            self.stdout.feed_data(chunk)
+        self.stdout.feed_eof()
+        self.returncode = 0
+
+    def terminate(self):
+        pass
+
+    async def wait(self):
+        return self.returncode
+
+
+class TestLogcatStream:
+    def read_lines(self, crash_monitor, chunks, chunk_size):
+        async def run():
+            return [line async for line in crash_monitor._read_logcat_stream(FakeProcess(chunks))]
+
+        crash_monitor.READ_CHUNK_SIZE = chunk_size
+        return asyncio.run(run())
+
+    @pytest.mark.parametrize("chunk_size", [1, 3, 7, 65536])
+    def test_splits_chunks_into_lines(self, crash_monitor, chunk_size):
+        data = "first line\r\n  second\n\nthird ü line\nno newline at eof".encode("utf-8")
+        chunks = [data[i:i + 5] for i in range(0, len(data), 5)]
+        assert self.read_lines(crash_monitor, chunks, chunk_size) == [
+            "first line", "second", "", "third ü line", "no newline at eof",
+        ]
+
+    def test_invalid_utf8_is_replaced(self, crash_monitor):
+        assert self.read_lines(crash_monitor, [b"bad \xff byte\n"], 65536) == ["bad � byte"]
+
+
+class FakeADBManager:
+    """Serves one logcat session, then stops the monitor on reconnect."""
+
+    def __init__(self, crash_monitor, data):
+        self.crash_monitor = crash_monitor
+        self.sessions = [data]
+
+    async def start_logcat(self, device_serial, filters=None):
+        if not self.sessions:
+            self.crash_monitor.is_running = False
+            return FakeProcess([])
+        return FakeProcess([self.sessions.pop()])
+
+
+class TestMonitorDevice:
+    @pytest.mark.parametrize("line_count", [0, 5, 256, 600])
+    def test_counts_every_parsed_line(self, crash_monitor, line_count):
+        data = "".join(f"10-06 22:36:33.972  1234  1234 I Tag: line {i}\n" for i in range(line_count))
+        crash_monitor.adb_manager = FakeADBManager(crash_monitor, data.encode())
+        crash_monitor.is_running = True
+        asyncio.run(crash_monitor._monitor_device(AndroidDevice(serial="SERIAL1", status="device")))
+        assert crash_monitor.stats.total_logs_processed == line_count
@@ -0,0 +1,175 @@
+"""Unit tests for system detection."""
+
+import subprocess
+
+import pytest
+
+from android_crash_monitor.core import system
+from android_crash_monitor.core.system import SystemDetector
+
+
+@pytest.fixture
+def probes(monkeypatch):
+    """Count external probes (PATH lookups and subprocess runs)."""
+    calls = []
+
+    def which(command, *args, **kwargs):
+        calls.append(command)
+        return None
+
+    def run(args, *rest, **kwargs):
+        calls.append(args[0])
+        raise FileNotFoundError(args[0])
+
+    monkeypatch.setattr(system.shutil, "which", which)
+    monkeypatch.setattr(system.subprocess, "run", run)
+    return calls
+
+
+class TestSystemDetector:
+    def test_detect_all_is_cached(self, probes):
+        detector = SystemDetector()
+        info = detector.detect_all()
+        probe_count = len(probes)
+        assert probe_count > 0
+        assert detector.detect_all() is info
+        assert len(probes) == probe_count
+
+    def test_clear_cache_detects_again(self, probes):
+        detector = SystemDetector()
+        info = detector.detect_all()
+        detector.clear_cache()
+        assert detector.detect_all() is not info
+
+    def test_missing_java(self, probes):
+        info = SystemDetector().detect_all()
+        assert info.has_java is False
+        assert info.java_version is None
+
+    def test_java_not_spawned_when_missing_from_path(self, probes):
+        assert SystemDetector().get_java_version() is None
+        assert probes == ["java"]
+
+    def test_java_version_parsed(self, monkeypatch):
+        monkeypatch.setattr(system.shutil, "which", lambda command: f"/usr/bin/{command}")
+        monkeypatch.setattr(system.subprocess, "run", lambda *args, **kwargs: subprocess.CompletedProcess(
+            args, 0, stdout="", stderr='openjdk version "17.0.8" 2023-07-18\nOpenJDK Runtime Environment'))
+        assert SystemDetector().get_java_version() == "17.0.8"
+
+    @pytest.mark.parametrize("os_name, found, expected", [
+        ("Linux", {"yum", "apt", "brew"}, ["apt", "yum"]),
+        ("macOS", {"port", "brew"}, ["brew", "port"]),
+        ("Windows", set(), []),
+        ("FreeBSD", {"apt"}, []),
+    ])
+    def test_package_managers_in_candidate_order(self, monkeypatch, os_name, found, expected):
+        monkeypatch.setattr(system.shutil, "which", lambda command: command if command in found else None)
+        monkeypatch.setattr(SystemDetector, "get_os_name", lambda self: os_name)
+        assert SystemDetector().detect_package_managers() == expected
+
+    def test_download_tools_probed_once(self, probes):
+        detector = SystemDetector()
+        detector.get_download_tools()
+        detector.has_download_tools()
+        assert probes.count("curl") == 1
+        assert probes.count("wget") == 1
+
+    @pytest.mark.parametrize("found, expected", [
+        ((), False), (("wget",), True), (("curl", "wget"), True),
+    ])
+    def test_has_download_tools(self, monkeypatch, found, expected):
+        monkeypatch.setattr(system.shutil, "which", lambda command: command if command in found else None)
+        assert SystemDetector().has_download_tools() is expected
+
+    @pytest.mark.parametrize("uid, expected", [(0, True), (1000, False)])
+    def test_is_admin_from_uid(self, monkeypatch, uid, expected):
+        monkeypatch.setattr(system, "_IS_WINDOWS", False)
+        monkeypatch.setattr(system.os, "getuid", lambda: uid, raising=False)
+        system._is_admin.cache_clear()
+        try:
+            assert SystemDetector().is_admin() is expected
+        finally:
+            system._is_admin.cache_clear()
+
+    def test_is_admin_checked_once_per_process(self, monkeypatch):
+        calls = []
+        monkeypatch.setattr(system, "_IS_WINDOWS", False)
+        monkeypatch.setattr(system.os, "getuid", lambda: calls.append(1) or 1000, raising=False)
+        system._is_admin.cache_clear()
+        try:
+            assert not SystemDetector().is_admin()
+            assert not SystemDetector().is_admin()
+            assert len(calls) == 1
+        finally:
+            system._is_admin.cache_clear()
+
+    def test_system_info_dict(self, probes, monkeypatch):
+        monkeypatch.setenv("SHELL", "/bin/zsh")
+        detector = SystemDetector()
+        info = detector.detect_all()
+        result = detector.get_system_info_dict()
+        assert result["os_name"] == info.os
+        assert result["architecture"] == info.arch
+        assert result["has_download_tools"] is False
+        assert result["java_version"] is None
+        assert result["shell"] == "zsh"
+
+
+class TestOsVersion:
+    @pytest.fixture(autouse=True)
+    def linux(self, monkeypatch):
+        monkeypatch.setattr(system.platform, "system", lambda: "Linux")
+        monkeypatch.setattr(system.platform, "release", lambda: "6.1.0-kernel")
+
+    @pytest.mark.parametrize("content, expected", [
+        ('NAME="Ubuntu"\nVERSION="22.04.3 LTS (Jammy Jellyfish)"\nID=ubuntu\n', "22.04.3 LTS (Jammy Jellyfish)"),
+        ('NAME=Fedora\nVERSION_ID=39\nVERSION=39 (Workstation Edition)\n', "39 (Workstation Edition)"),
+        ('NAME=Arch\nVERSION_ID=rolling\n', "6.1.0-kernel"),
+        ('VERSION=""\n', "6.1.0-kernel"),
+        ('VERSION="1.0"\r\nVERSION="2.0"\n', "1.0"),
+    ])
+    def test_reads_version_line(self, monkeypatch, tmp_path, content, expected):
+        os_release = tmp_path / "os-release"
+        os_release.write_bytes(content.encode())
+        monkeypatch.setattr(system, "_OS_RELEASE_PATH", str(os_release))
+        assert SystemDetector().get_os_version() == expected
+
+    def test_missing_file_uses_release(self, monkeypatch, tmp_path):
+        monkeypatch.setattr(system, "_OS_RELEASE_PATH", str(tmp_path / "missing"))
+        assert SystemDetector().get_os_version() == "6.1.0-kernel"
+
+
+class TestAndroidHome:
+    @pytest.fixture(autouse=True)
+    def linux_home(self, monkeypatch, tmp_path):
+        monkeypatch.delenv("ANDROID_HOME", raising=False)
+        monkeypatch.delenv("ANDROID_SDK_ROOT", raising=False)
+        monkeypatch.setenv("HOME", str(tmp_path))
+        monkeypatch.setattr(SystemDetector, "get_os_name", lambda self: "Linux")
+
+    def test_env_var_wins(self, monkeypatch, tmp_path):
+        monkeypatch.setenv("ANDROID_SDK_ROOT", str(tmp_path))
+        assert SystemDetector().get_android_home() == tmp_path
+
+    def test_home_candidate_needs_platform_tools(self, tmp_path):
+        sdk = tmp_path / "Android" / "Sdk"
+        sdk.mkdir(parents=True)
+        assert SystemDetector().get_android_home() != sdk
+        (sdk / "platform-tools").mkdir()
+        assert SystemDetector().get_android_home() == sdk
+
+    def test_missing_env_dir_is_ignored(self, monkeypatch, tmp_path):
+        monkeypatch.setenv("ANDROID_HOME", str(tmp_path / "missing"))
+        assert SystemDetector().get_android_home() != tmp_path / "missing"
+
+
+class TestConvenienceFunctions:
+    def test_share_one_detector(self, probes, monkeypatch):
+        monkeypatch.setattr(system, "_DETECTOR", SystemDetector())
+        info = system.detect_system()
+        probe_count = len(probes)
+        assert system.detect_system() is info
+        assert system.get_os_name() == info.os
+        assert system.get_package_managers() == info.package_managers
+        assert len(probes) == probe_count
+